@@ -0,0 +1,82 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Compare JSON codecs on large Redfish payloads.
+
+Usage: python benchmarks/bench_codec.py [recorded.json ...]
+
+Without arguments, synthetic payloads (an expanded Systems collection and a
+LogService Entries collection) are used. Recorded responses can be passed
+as files. Note that $metadata documents are CSDL (XML), so they do not go
+through the JSON codec at all.
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from redfish_client.codec import CODECS  # noqa: E402
+
+from payloads import PAYLOADS  # noqa: E402
+
+
+def available_codecs():
+    for name, klass in sorted(CODECS.items()):
+        try:
+            yield name, klass()
+        except ImportError:
+            print("Skipping {} codec (not installed)".format(name))
+
+
+def best_of(func, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("files", nargs="*", help="recorded JSON payloads")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    if args.files:
+        payloads = {}
+        for path in args.files:
+            with open(path, "rb") as fd:
+                payloads[os.path.basename(path)] = fd.read()
+    else:
+        payloads = {
+            name: json.dumps(factory()).encode("utf-8")
+            for name, factory in PAYLOADS.items()
+        }
+
+    print("{:<24} {:<8} {:>10} {:>12} {:>12}".format(
+        "payload", "codec", "size [kB]", "decode [ms]", "encode [ms]",
+    ))
+    for name, raw in payloads.items():
+        for codec_name, codec in available_codecs():
+            data = codec.loads(raw)
+            decode = best_of(lambda: codec.loads(raw), args.repeat)
+            encode = best_of(lambda: codec.dumps(data), args.repeat)
+            print("{:<24} {:<8} {:>10.1f} {:>12.2f} {:>12.2f}".format(
+                name, codec_name, len(raw) / 1024, decode * 1000, encode * 1000,
+            ))
+
+
+if __name__ == "__main__":
+    main()
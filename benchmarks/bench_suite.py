@@ -0,0 +1,212 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""
+Benchmark hot paths of the client on synthetic large trees.
+
+Usage: python benchmarks/bench_suite.py [-k PATTERN] [--save FILE]
+                                        [--compare FILE]
+
+Reports the best time of each benchmark and its peak memory (as traced by
+tracemalloc). With --compare, benchmarks that got slower or use more
+memory than --threshold times the baseline are reported and the command
+exits with status 1. Baselines are only comparable on the same machine
+and Python version (make bench-baseline saves one, make bench compares
+against it). Timings of busy or virtualized machines vary between runs,
+which is why the default threshold is generous.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from redfish_client.caching_connector import CachingConnector  # noqa: E402
+from redfish_client.connector import Response  # noqa: E402
+from redfish_client.recording import Exchange, ReplayAdapter  # noqa: E402
+from redfish_client.resource import Resource  # noqa: E402
+
+import harness  # noqa: E402
+from harness import benchmark  # noqa: E402
+from payloads import deep_oem, expanded_collection, log_entries  # noqa: E402
+
+BASE_URL = "https://bmc.bench"
+MEMBERS = 2000
+
+
+def collection_resource(expanded):
+    resource = Resource(None, data=expanded_collection(MEMBERS), lazy=True)
+    resource._is_stub = False
+    resource._is_expanded = expanded
+    return resource
+
+
+@benchmark("build-members")
+def build_members():
+    # First access wraps every member of a large collection.
+    data = expanded_collection(MEMBERS)
+
+    def run():
+        resource = Resource(None, data=data, lazy=True)
+        resource._is_stub = False
+        resource._is_expanded = True
+        resource["Members"]
+    return run
+
+
+@benchmark("member-loop")
+def member_loop():
+    # Repeated attribute access in a hot loop over an expanded collection.
+    resource = collection_resource(expanded=True)
+
+    def run():
+        for member in resource.Members:
+            member.Status.Health
+    return run
+
+
+@benchmark("getattr-nested")
+def getattr_nested():
+    resource = Resource(None, data=deep_oem(), lazy=True)
+    resource._is_stub = False
+
+    def run():
+        resource.Oem.Vendor.Next.Next.Next.Property0
+    return run
+
+
+@benchmark("getitem-deep-oem")
+def getitem_deep_oem():
+    resource = Resource(None, data=deep_oem(), lazy=True)
+    resource._is_stub = False
+
+    def run():
+        level = resource["Oem"]["Vendor"]
+        while "Next" in level:
+            level = level["Next"]
+    return run
+
+
+@benchmark("find-object")
+def find_object():
+    # find_object follows links, so only search the (link-free) Oem block.
+    resource = Resource(None, data=deep_oem()["Oem"], lazy=True)
+    resource._is_stub = False
+
+    def run():
+        assert resource.find_object("Marker")["Depth"] == 64
+    return run
+
+
+@benchmark("dig")
+def dig():
+    resource = Resource(None, data=deep_oem(), lazy=True)
+    resource._is_stub = False
+    keys = ("Oem", "Vendor") + ("Next",) * 16 + ("Property0",)
+
+    def run():
+        assert resource.dig(*keys) is not None
+    return run
+
+
+@benchmark("get-fragment")
+def get_fragment():
+    data = expanded_collection(MEMBERS)
+    fragment = "/Members/{}/Oem/Vendor/Nested/Level7/Text".format(MEMBERS - 1)
+
+    def run():
+        Resource._get_fragment(data, fragment)
+    return run
+
+
+def replay_connector(paths):
+    body = json.dumps(deep_oem()).encode("utf-8")
+    adapter = ReplayAdapter([
+        Exchange("GET", BASE_URL + path, 200, {}, body, 0, 0) for path in paths
+    ])
+    return CachingConnector(BASE_URL, "", "", adapter=adapter)
+
+
+@benchmark("cache-hit")
+def cache_hit():
+    connector = replay_connector(["/redfish/v1/Systems/1"])
+    connector.get("/redfish/v1/Systems/1")
+
+    def run():
+        connector.get("/redfish/v1/Systems/1")
+    return run
+
+
+@benchmark("cache-miss")
+def cache_miss():
+    # Misses go through the HTTP library (with a replayed response), so
+    # this measures the client-side cost of a request.
+    paths = ["/redfish/v1/Systems/{}".format(i) for i in range(100)]
+    connector = replay_connector(paths)
+
+    def run():
+        connector.reset()
+        for path in paths:
+            connector.get(path).json
+    return run
+
+
+@benchmark("decode-collection")
+def decode_collection():
+    raw = json.dumps(expanded_collection(MEMBERS)).encode("utf-8")
+
+    def run():
+        Response(200, {}, raw=raw).json
+    return run
+
+
+@benchmark("decode-log-entries")
+def decode_log_entries():
+    raw = json.dumps(log_entries()).encode("utf-8")
+
+    def run():
+        Response(200, {}, raw=raw).json
+    return run
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "-k", dest="patterns", action="append", default=[],
+        help="only run benchmarks with names that match the glob pattern",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", help="save results as the baseline")
+    parser.add_argument("--compare", help="compare results to the baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=1.5,
+        help="ratio to the baseline that counts as a regression",
+    )
+    args = parser.parse_args()
+
+    baseline = harness.load(args.compare) if args.compare else None
+    results, regressions = harness.report(
+        harness.run(args.patterns, args.repeat), baseline, args.threshold,
+    )
+    if args.save:
+        harness.save(results, args.save)
+    if regressions:
+        print("\nRegressions: {}".format(", ".join(regressions)))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# Minimal benchmark runner with time and peak memory measurements and
+# baseline comparison.
+
+import collections
+import fnmatch
+import json
+import platform
+import timeit
+import tracemalloc
+
+
+Benchmark = collections.namedtuple("Benchmark", "name setup")
+Result = collections.namedtuple("Result", "name time peak")
+
+BENCHMARKS = []
+
+# Peak memory of small benchmarks varies by a few allocator blocks, which
+# should not count as a regression.
+MEMORY_SLACK = 16 * 1024  # In bytes
+
+
+def benchmark(name):
+    """
+    Register a benchmark.
+
+    The decorated function prepares the data and returns the function to
+    measure, so that the setup is not part of the measurement.
+    """
+    def register(setup):
+        BENCHMARKS.append(Benchmark(name, setup))
+        return setup
+    return register
+
+
+def measure(bench, repeat):
+    func = bench.setup()
+    func()  # Warm up (imports, lazily initialized state, ...)
+    # Each round calls the function as many times as fit in 0.2 seconds,
+    # and the best round counts, which keeps the noise of busy machines low.
+    timer = timeit.Timer(func)
+    number = timer.autorange()[0]
+    seconds = min(timer.repeat(number=number, repeat=repeat)) / number
+
+    # Memory is measured separately, since tracing slows everything down.
+    tracemalloc.start()
+    try:
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return Result(bench.name, seconds, peak)
+
+
+def run(patterns=(), repeat=5):
+    for bench in BENCHMARKS:
+        if not patterns or any(fnmatch.fnmatch(bench.name, p) for p in patterns):
+            yield measure(bench, repeat)
+
+
+def save(results, path):
+    with open(path, "w") as fd:
+        json.dump(dict(
+            python=platform.python_version(),
+            machine=platform.machine(),
+            results={r.name: dict(time=r.time, peak=r.peak) for r in results},
+        ), fd, indent=2, sort_keys=True)
+
+
+def load(path):
+    with open(path) as fd:
+        return {
+            name: Result(name, value["time"], value["peak"])
+            for name, value in json.load(fd)["results"].items()
+        }
+
+
+def _change(value, reference):
+    if not reference:
+        return ""
+    return "{:+.0%}".format(value / reference - 1)
+
+
+def report(results, baseline=None, threshold=1.5):
+    """
+    Print results (and changes relative to the baseline) as they come in.
+
+    Returns the list of results and names of benchmarks that got slower or
+    use more memory than threshold times the baseline.
+    """
+    print("{:<28} {:>12} {:>8} {:>12} {:>8}".format(
+        "benchmark", "time [ms]", "change", "peak [kB]", "change",
+    ))
+    collected, regressions = [], []
+    for result in results:
+        collected.append(result)
+        reference = (baseline or {}).get(result.name)
+        time_change = peak_change = ""
+        if reference:
+            time_change = _change(result.time, reference.time)
+            peak_change = _change(result.peak, reference.peak)
+            if (result.time > reference.time * threshold or
+                    result.peak > reference.peak * threshold + MEMORY_SLACK):
+                regressions.append(result.name)
+        print("{:<28} {:>12.3f} {:>8} {:>12.1f} {:>8}{}".format(
+            result.name, result.time * 1000, time_change,
+            result.peak / 1024, peak_change,
+            "  REGRESSION" if result.name in regressions else "",
+        ), flush=True)
+    return collected, regressions
@@ -0,0 +1,102 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# Synthetic Redfish documents that mimic the large payloads BMCs return.
+
+
+def system(index):
+    oid = "/redfish/v1/Systems/{}".format(index)
+    return {
+        "@odata.id": oid,
+        "@odata.type": "#ComputerSystem.v1_13_0.ComputerSystem",
+        "@odata.etag": "W/\"{:032x}\"".format(index),
+        "Id": str(index),
+        "Name": "System {}".format(index),
+        "PowerState": "On",
+        "Status": {"State": "Enabled", "Health": "OK", "HealthRollup": "OK"},
+        "ProcessorSummary": {"Count": 2, "Model": "Xeon", "Status": {"Health": "OK"}},
+        "MemorySummary": {"TotalSystemMemoryGiB": 512, "Status": {"Health": "OK"}},
+        "Boot": {
+            "BootSourceOverrideEnabled": "Disabled",
+            "BootSourceOverrideTarget@Redfish.AllowableValues": [
+                "None", "Pxe", "Floppy", "Cd", "Hdd", "BiosSetup", "Utilities",
+            ],
+        },
+        "Processors": {"@odata.id": oid + "/Processors"},
+        "Memory": {"@odata.id": oid + "/Memory"},
+        "Links": {
+            "Chassis": [{"@odata.id": "/redfish/v1/Chassis/{}".format(index)}],
+            "ManagedBy": [{"@odata.id": "/redfish/v1/Managers/{}".format(index)}],
+        },
+        "Actions": {"#ComputerSystem.Reset": {
+            "target": oid + "/Actions/ComputerSystem.Reset",
+        }},
+        "Oem": {"Vendor": {"Nested": {
+            "Level{}".format(level): {"Value": level, "Text": "x" * 32}
+            for level in range(8)
+        }}},
+    }
+
+
+def expanded_collection(members=256):
+    """ Systems collection, requested with $expand """
+    return {
+        "@odata.id": "/redfish/v1/Systems",
+        "@odata.type": "#ComputerSystemCollection.ComputerSystemCollection",
+        "Name": "Computer System Collection",
+        "Members@odata.count": members,
+        "Members": [system(i) for i in range(members)],
+    }
+
+
+def log_entries(entries=2000):
+    """ LogService Entries collection with inline entries """
+    path = "/redfish/v1/Managers/1/LogServices/Log/Entries"
+    return {
+        "@odata.id": path,
+        "@odata.type": "#LogEntryCollection.LogEntryCollection",
+        "Members@odata.count": entries,
+        "Members": [{
+            "@odata.id": "{}/{}".format(path, i),
+            "@odata.type": "#LogEntry.v1_4_0.LogEntry",
+            "Id": str(i),
+            "Created": "2026-01-01T00:00:{:02d}+00:00".format(i % 60),
+            "EntryType": "Event",
+            "Severity": ("OK", "Warning", "Critical")[i % 3],
+            "Message": "The system event log entry number {} was recorded.".format(i),
+            "MessageId": "Event.1.0.Generic",
+            "MessageArgs": [str(i)],
+        } for i in range(entries)],
+    }
+
+
+def deep_oem(depth=64, width=8):
+    """ System with a deeply nested Oem block (vendor extensions) """
+    data = system(0)
+    level = {"Marker": {"Depth": depth}}
+    for i in reversed(range(depth)):
+        level = dict(
+            {"Property{}".format(j): "x" * 16 for j in range(width)},
+            Settings=[{"Index": k, "Value": k * i} for k in range(width)],
+            Next=level,
+        )
+    data["Oem"] = {"Vendor": level}
+    return data
+
+
+PAYLOADS = {
+    "expanded-collection": expanded_collection,
+    "log-entries": log_entries,
+    "deep-oem": deep_oem,
+}
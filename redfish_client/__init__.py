@@ -12,15 +12,48 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from redfish_client.cache import Cache
 from redfish_client.connector import Connector
 from redfish_client.caching_connector import CachingConnector
 from redfish_client.root import Root
+from redfish_client.fleet import Fleet
 
 
 def connect(base_url, username, password, verify=True, cache=True,
-            lazy_load=True, timeout=Connector.DEFAULT_TIMEOUT):
-    klass = CachingConnector if cache else Connector
-    connector = klass(base_url, username, password, verify=verify, timeout=timeout)
+            lazy_load=True, timeout=Connector.DEFAULT_TIMEOUT, **connector_args):
+    # Additional keyword arguments (connection pool configuration, ...) are
+    # passed to the connector unchanged. The cache argument can also be a
+    # cache backend instance (see redfish_client.cache).
+    # Empty cache backends are falsy (they have a length), but still mean
+    # that responses should be cached.
+    caching = isinstance(cache, Cache) or cache
+    klass = CachingConnector if caching else Connector
+    if isinstance(cache, Cache):
+        connector_args["cache"] = cache
+    connector = klass(
+        base_url, username, password, verify=verify, timeout=timeout,
+        **connector_args
+    )
     root = Root(connector, oid="/redfish/v1", lazy=lazy_load)
     root.login()
     return root
+
+
+async def connect_async(base_url, username, password, verify=True,
+                        timeout=Connector.DEFAULT_TIMEOUT, **connector_args):
+    # aiohttp is an optional dependency, so we only import the async parts
+    # of the client when they are actually used.
+    from redfish_client.async_connector import AsyncConnector
+    from redfish_client.async_root import AsyncRoot
+
+    connector = AsyncConnector(
+        base_url, username, password, verify=verify, timeout=timeout,
+        **connector_args
+    )
+    root = AsyncRoot(connector, oid="/redfish/v1")
+    try:
+        await root.login()
+    except BaseException:
+        await connector.close()
+        raise
+    return root
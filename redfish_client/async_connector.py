@@ -0,0 +1,328 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import base64
+import time
+from urllib.parse import urlparse
+
+import aiohttp
+
+from redfish_client.codec import get_codec
+from redfish_client.connector import (
+    Connector, Response, _unavailable, logger,
+)
+from redfish_client.exceptions import (
+    AuthException,
+    InaccessibleException,
+    ResourceNotFound,
+    TimedOutException,
+)
+from redfish_client.wire_log import WireLogger
+
+
+class AsyncConnector:
+    """
+    asyncio counterpart of the Connector.
+
+    All request methods are coroutines, which makes it possible to drive
+    many Redfish services from a single event loop. The underlying aiohttp
+    session is created on first use, since it must be bound to a running
+    loop. Call close (or use the connector as an async context manager) to
+    release the connections.
+    """
+    DEFAULT_HEADERS = Connector.DEFAULT_HEADERS
+    DEFAULT_TIMEOUT = Connector.DEFAULT_TIMEOUT
+
+    def __init__(self, base_url, username, password, verify=True, timeout=DEFAULT_TIMEOUT,
+                 instruments=(), wire_log=None, codec=None):
+        """
+        Args:
+          instruments: Instrument objects that are notified about requests.
+          wire_log: WireLogger that logs requests and responses.
+          codec: Codec name or instance (see redfish_client.codec).
+        """
+        self._base_url = base_url.rstrip("/")
+        self._username = username
+        self._password = password
+
+        self._session_path = None
+        self._session_id = None
+
+        self._basic_path = None
+
+        self._client = None
+        self._headers = AsyncConnector.DEFAULT_HEADERS.copy()
+        self._ssl = None if verify else False
+        self._timeout = timeout
+        self._instruments = list(instruments)
+        self._wire_log = wire_log or WireLogger(logger)
+        self._codec = get_codec(codec)
+        self._protocol_features = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc_info):
+        await self.close()
+
+    def _url(self, path):
+        return self._base_url + path
+
+    @property
+    def protocol_features(self):
+        return self._protocol_features
+
+    def set_protocol_features(self, features):
+        self._protocol_features = features or {}
+
+    # Instrumentation does not depend on the HTTP library.
+    add_instrument = Connector.add_instrument
+    remove_instrument = Connector.remove_instrument
+    _notify_before = Connector._notify_before
+    _notify_after = Connector._notify_after
+
+    def _get_client(self):
+        if self._client is None or self._client.closed:
+            self._client = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self._timeout),
+            )
+        return self._client
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    async def _send(self, method, path, payload=None, headers=None):
+        request_headers = dict(self._headers)
+        args = {}
+        if payload is not None:
+            request_headers["Content-Type"] = "application/json"
+            args = dict(data=self._codec.dumps(payload))
+        request_headers.update(headers or {})
+        try:
+            async with self._get_client().request(
+                    method,
+                    self._url(path),
+                    **args,
+                    headers=request_headers,
+                    ssl=self._ssl,
+            ) as resp:
+                raw = await resp.read()
+        except aiohttp.ClientConnectionError:
+            raise InaccessibleException(
+                "Endpoint at {} is not accessible".format(self._base_url))
+        except asyncio.TimeoutError:
+            raise TimedOutException(
+                "Endpoint at {} did not respond in time".format(self._base_url))
+
+        return Response(resp.status, resp.headers, raw=raw, codec=self._codec)
+
+    async def _request(self, method, path, payload=None, headers=None):
+        wire = self._wire_log.sample()
+        if wire:
+            self._wire_log.log_request(
+                self._base_url, method, path, payload, headers,
+            )
+        self._notify_before(method, path)
+        start, response, relogin = time.monotonic(), None, False
+        try:
+            resp = await self._send(
+                method, path, payload=payload, headers=headers,
+            )
+
+            if resp.status == 401:
+                relogin = True
+                self._unset_header("x-auth-token")
+                await self.login()
+                resp = await self._send(
+                    method, path, payload=payload, headers=headers,
+                )
+
+            if wire:
+                self._wire_log.log_response(self._base_url, method, path, resp)
+            response = resp
+            return response
+        finally:
+            self._notify_after(method, path, start, response, relogin)
+
+    def _set_header(self, key, value):
+        self._headers[key] = value
+
+    def _unset_header(self, key):
+        self._headers.pop(key, None)
+
+    def set_session_auth_data(self, path, session_id=None, token=None):
+        self._basic_logout()
+        self._basic_path = None
+
+        self._session_path = path
+        self._session_id = session_id
+        if token:
+            self._set_header("x-auth-token", token)
+
+    @property
+    def session_auth_data(self):
+        return (
+            self._session_path,
+            self._session_id,
+            self._headers.get("x-auth-token"),
+        )
+
+    def set_basic_auth_data(self, path):
+        # Session logout needs a round trip, so we only forget the session
+        # here. Call logout beforehand if the session should be deleted.
+        self._session_id = None
+        self._unset_header("x-auth-token")
+        self._session_path = None
+
+        self._basic_path = path
+
+    @property
+    def _has_session_support(self):
+        return bool(self._session_path)
+
+    async def _session_login(self):
+        resp = await self._send("POST", self._session_path, payload=dict(
+            UserName=self._username, Password=self._password,
+        ))
+        if resp.status != 201:
+            raise AuthException("Cannot create session: {}".format(
+                resp.raw.decode("utf-8", "replace")))
+
+        self._set_header("x-auth-token", resp.headers["x-auth-token"])
+        # We combine with `or` here because the default value of the dict.get
+        # method is eagerly evaluated, which is not what we want.
+        sess_id = resp.headers.get("location") or resp.json["@odata.id"]
+        try:
+            sess_id = urlparse(sess_id).path
+        except BaseException:
+            pass
+        self._session_id = sess_id
+
+    async def _session_logout(self):
+        if self._session_id:
+            await self._send("DELETE", self._session_id)
+            self._session_id = None
+        self._unset_header("x-auth-token")
+
+    async def _basic_login(self):
+        secret = "Basic {}".format(base64.b64encode(
+            "{}:{}".format(self._username, self._password).encode("ascii"),
+        ).decode("ascii"))
+        resp = await self._send(
+            "GET", self._basic_path, headers=dict(authorization=secret),
+        )
+        if resp.status != 200:
+            raise AuthException("Invalid credentials")
+        self._set_header("authorization", secret)
+
+    def _basic_logout(self):
+        self._unset_header("authorization")
+
+    async def login(self):
+        assert self._session_path or self._basic_path, "Use set_*_auth_data"
+
+        if self._has_session_support:
+            self._basic_logout()
+            await self._session_login()
+        else:
+            await self._session_logout()
+            await self._basic_login()
+
+    async def logout(self):
+        await self._session_logout()
+        self._basic_logout()
+
+    async def get(self, path, headers=None, cache=True):
+        return await self._request("GET", path, headers=headers)
+
+    async def _open_stream(self, path, headers, timeout):
+        request_headers = dict(self._headers)
+        request_headers.update(headers or {})
+        try:
+            return await self._get_client().request(
+                "GET", self._url(path), headers=request_headers, ssl=self._ssl,
+                timeout=timeout,
+            )
+        except aiohttp.ClientConnectionError:
+            raise InaccessibleException(
+                "Endpoint at {} is not accessible".format(self._base_url))
+        except asyncio.TimeoutError:
+            raise TimedOutException(
+                "Endpoint at {} did not respond in time".format(self._base_url))
+
+    async def stream(self, path, headers=None, read_timeout=None):
+        """
+        Async counterpart of the Connector.stream.
+
+        Lines are split manually, since the aiohttp line reader rejects
+        lines that do not fit into its buffer.
+        """
+        timeout = aiohttp.ClientTimeout(
+            total=None, connect=self._timeout, sock_read=read_timeout,
+        )
+        resp = await self._open_stream(path, headers, timeout)
+        if resp.status == 401:
+            resp.release()
+            self._unset_header("x-auth-token")
+            await self.login()
+            resp = await self._open_stream(path, headers, timeout)
+
+        try:
+            if _unavailable(resp.status):
+                raise InaccessibleException(
+                    "Stream at {} is not available ({})".format(
+                        self._base_url, resp.status,
+                    ))
+            if resp.status != 200:
+                raise ResourceNotFound(await resp.read())
+            pending = b""
+            async for chunk in resp.content.iter_any():
+                lines = (pending + chunk).split(b"\n")
+                pending = lines.pop()
+                for line in lines:
+                    yield line.rstrip(b"\r")
+            if pending:
+                yield pending.rstrip(b"\r")
+        except aiohttp.ClientError:
+            raise InaccessibleException(
+                "Stream at {} was interrupted".format(self._base_url))
+        except asyncio.TimeoutError:
+            raise TimedOutException(
+                "Stream at {} did not send data in time".format(self._base_url))
+        finally:
+            resp.close()
+
+    async def post(self, path, payload=None, headers=None):
+        return await self._request("POST", path, payload=payload, headers=headers)
+
+    async def patch(self, path, payload=None, headers=None):
+        return await self._request("PATCH", path, payload=payload, headers=headers)
+
+    async def put(self, path, payload=None, headers=None):
+        return await self._request("PUT", path, payload=payload, headers=headers)
+
+    async def delete(self, path, headers=None):
+        return await self._request("DELETE", path, headers=headers)
+
+    def reset(self, _path=None):
+        pass
+
+    def expire(self, path):
+        self.reset(path)
+
+    def seed(self, path, data):
+        pass
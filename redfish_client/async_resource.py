@@ -0,0 +1,220 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import operator
+import time
+from functools import reduce
+
+from redfish_client.exceptions import (
+    BlacklistedValueException,
+    TimedOutException,
+    MissingOidException,
+    ResourceNotFound,
+    ResourceNotLoaded,
+)
+from redfish_client.resource import Resource
+
+
+def _sync_only(name):
+    def method(self, *args, **kwargs):
+        raise TypeError(
+            "{} is not supported by async resources, load the resources "
+            "with the load method instead".format(name)
+        )
+    method.__name__ = name
+    return method
+
+
+class AsyncResource(Resource):
+    """
+    Resource that is backed by an AsyncConnector.
+
+    Async resources are always lazy: accessing already loaded content works
+    the same as with the Resource, but stubs need to be loaded explicitly
+    by awaiting the load method (or one of the helpers that load stubs on
+    the way, like dig and find_object). The prefetch, iter_members, filter,
+    expand and select helpers are not available and raise TypeError.
+    """
+
+    def __init__(self, connector, oid=None, data=None):
+        super().__init__(connector, oid=oid, data=data, lazy=True)
+        self._is_stub = bool(oid)
+
+    async def _init_from_oid(self, oid):
+        if "#" in oid:
+            url, fragment = oid.split("#", 1)
+        else:
+            url, fragment = oid, ""
+
+        resp = await self._connector.get(url)
+        if resp.status != 200:
+            raise ResourceNotFound(resp.raw)
+        self._is_stub = False
+        return resp.headers, self._get_fragment(resp.json, fragment)
+
+    def _is_link(self, data):
+        return "@odata.id" in data
+
+    # Helpers that load resources through the blocking connector API.
+    prefetch = _sync_only("prefetch")
+    iter_members = _sync_only("iter_members")
+    filter = _sync_only("filter")
+    expand = _sync_only("expand")
+    select = _sync_only("select")
+
+    def _build_from_hash(self, data):
+        if self._is_link(data):
+            return AsyncResource(self._connector, oid=data["@odata.id"])
+        return AsyncResource(self._connector, data=data)
+
+    def _require_content(self):
+        if self._is_stub:
+            raise ResourceNotLoaded(
+                "Resource {} is not loaded yet".format(self._content["@odata.id"])
+            )
+        return self._content
+
+    def __getitem__(self, name):
+        if name not in self._content:
+            self._require_content()
+        return self._child(name)
+
+    def __contains__(self, item):
+        return item in self._require_content()
+
+    async def _get_content(self):
+        oid = self._content.get("@odata.id")
+        if oid and self._is_stub:
+            self._headers, self._content = await self._init_from_oid(oid)
+        return self._content
+
+    async def load(self):
+        await self._get_content()
+        return self
+
+    async def refresh(self):
+        try:
+            oid = self._content["@odata.id"]
+        except KeyError:
+            raise MissingOidException("Cannot refresh resource without @odata.id")
+
+        self._connector.expire(oid.split("#", 1)[0])
+        self._children, self._children_of = {}, None
+        self._unload(oid)
+        await self._get_content()
+
+    async def dig(self, *keys):
+        resource = self
+        for k in keys:
+            if isinstance(resource, AsyncResource):
+                await resource.load()
+            if k in resource:
+                resource = resource[k]
+            else:
+                return None
+        return resource
+
+    async def find_object(self, key):
+        """ Recursively search for a key and return key's content """
+        content = await self._get_content()
+        if key in content.keys():
+            return self[key]
+
+        for k in content.keys():
+            value = self[k]
+            if isinstance(value, AsyncResource):
+                result = await value.find_object(key)
+                if result:
+                    return result
+
+    async def execute_action(self, action_name, payload):
+        """
+        Perform an action supported by the resource.
+
+        Args:
+          action_name: The field representing the action to perform.
+          payload: The dictionary with the action parameters.
+        """
+        if "Actions" not in await self._get_content():
+            raise KeyError("Element does not have Actions attribute")
+        action = await self.Actions.find_object(action_name)
+        if action:
+            return await self._connector.post(action.target, payload=payload)
+        raise KeyError("Action with {} does not exist".format(action_name))
+
+    async def wait_for(
+            self, stat, expected, blacklisted=None, poll_interval=3,
+            timeout=15,
+    ):
+        """
+        Async version of the Resource.wait_for that sleeps without blocking
+        the event loop.
+        """
+        if "@odata.id" not in self._content:
+            raise MissingOidException(
+                "Element does not have '@odata.id' attribute, cannot wait "
+                "for a stat inside inner object"
+            )
+        start_time = time.time()
+        while time.time() <= start_time + timeout:
+            await self.refresh()
+            actual_value = reduce(operator.getitem, stat, self._content)
+            if actual_value == expected:
+                return True
+            if blacklisted and actual_value in blacklisted:
+                raise BlacklistedValueException(
+                    "Detected blacklisted value '{}'".format(actual_value)
+                )
+            await asyncio.sleep(poll_interval)
+        raise TimedOutException(
+            "Could not wait for stat {} in time".format(stat)
+        )
+
+    @property
+    def raw(self):
+        return self._require_content()
+
+    async def post(self, payload=None, headers=None):
+        path = self._content.get("@odata.id")
+        if not path:
+            raise MissingOidException("The resource cannot be POSTed to.")
+        resp = await self._connector.post(path, payload=payload, headers=headers)
+        self._modified(path)
+        return resp
+
+    async def patch(self, payload, headers=None):
+        path = self._content.get("@odata.id")
+        if not path:
+            raise MissingOidException("The resource cannot be PATCHed.")
+        resp = await self._connector.patch(path, payload=payload, headers=headers)
+        self._modified(path)
+        return resp
+
+    async def put(self, path=None, payload=None, headers=None):
+        field = self._content.get("@odata.id")
+        path = self._get_path(field, path)
+        if not path:
+            raise MissingOidException("The resource cannot be PUT.")
+        resp = await self._connector.put(path, payload=payload, headers=headers)
+        self._modified(path)
+        return resp
+
+    async def delete(self, headers=None):
+        path = self._content.get("@odata.id")
+        if not path:
+            raise MissingOidException("The resource cannot be DELETEd.")
+        resp = await self._connector.delete(path, headers=headers)
+        self._modified(path)
+        return resp
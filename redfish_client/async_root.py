@@ -0,0 +1,41 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from redfish_client.async_resource import AsyncResource
+
+
+class AsyncRoot(AsyncResource):
+    async def login(self):
+        content = await self._get_content()
+        sessions = content.get("Links", {}).get("Sessions", {})
+        authenticated_path = next(
+            i["@odata.id"] for i in content.values() if "@odata.id" in i
+        )
+        self._connector.set_protocol_features(
+            content.get("ProtocolFeaturesSupported"),
+        )
+        if "@odata.id" in sessions:
+            self._connector.set_session_auth_data(sessions["@odata.id"])
+        else:
+            self._connector.set_basic_auth_data(authenticated_path)
+        await self._connector.login()
+
+    async def logout(self):
+        await self._connector.logout()
+
+    async def close(self):
+        await self._connector.close()
+
+    def find(self, oid):
+        return AsyncResource(self._connector, oid=oid)
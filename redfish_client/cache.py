@@ -0,0 +1,450 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import abc
+import collections
+import fnmatch
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from requests.structures import CaseInsensitiveDict
+
+from redfish_client.connector import Response
+
+
+CacheStats = collections.namedtuple(
+    "CacheStats", "hits misses evictions expirations entries size",
+)
+
+
+class _Entry:
+    __slots__ = ("response", "expires")
+
+    def __init__(self, response, expires):
+        self.response = response
+        self.expires = expires
+
+
+class CachePolicy:
+    """
+    Decides which responses get cached and for how long.
+
+    Successful responses are cached for ttl seconds by default (None means
+    that they never expire). Time to live can be overridden for paths that
+    match one of the glob patterns in paths, or for resources of OData types
+    in types (either full type names, like #Thermal.v1_5_0.Thermal, glob
+    patterns, like #Thermal.*, or unversioned names, like Thermal). Path
+    patterns take precedence over types, and the first match wins.
+
+    Paths that match any of the never patterns are never cached. Responses
+    with status 404 are cached for negative_ttl seconds if set, so that
+    probing for optional resources does not hit the service every time.
+    """
+
+    def __init__(self, ttl=None, paths=None, types=None, never=(),
+                 negative_ttl=None):
+        self._ttl = ttl
+        self._paths = list((paths or {}).items())
+        self._types = list((types or {}).items())
+        self._never = tuple(never)
+        self._negative_ttl = negative_ttl
+
+    @staticmethod
+    def _odata_type(response):
+        data = response.json
+        return data.get("@odata.type") if isinstance(data, dict) else None
+
+    @staticmethod
+    def _match_type(odata_type, pattern):
+        return (
+            fnmatch.fnmatchcase(odata_type, pattern) or
+            odata_type.rsplit(".", 1)[-1] == pattern
+        )
+
+    def cacheable(self, path, response=None):
+        """
+        Check if responses for path can be cached. If response is given,
+        check if this particular response can be cached.
+        """
+        if any(fnmatch.fnmatchcase(path, p) for p in self._never):
+            return False
+        if response is None or response.status == 200:
+            return True
+        return response.status == 404 and self._negative_ttl is not None
+
+    def ttl(self, path, response):
+        """ Return time to live for a cacheable response """
+        if response.status == 404:
+            return self._negative_ttl
+
+        for pattern, ttl in self._paths:
+            if fnmatch.fnmatchcase(path, pattern):
+                return ttl
+
+        odata_type = self._types and self._odata_type(response)
+        if odata_type:
+            for pattern, ttl in self._types:
+                if self._match_type(odata_type, pattern):
+                    return ttl
+
+        return self._ttl
+
+
+class Cache(abc.ABC):
+    """
+    Base class for response caches (cache backends).
+
+    Backends map keys (the caching connector uses full URLs of resources)
+    to responses. Entries with a time to live (in seconds) are treated as
+    missing by get after they expire, but get_stale still returns them, so
+    that they can be revalidated. The expire method makes an entry expire
+    immediately.
+    """
+
+    @property
+    @abc.abstractmethod
+    def stats(self):
+        pass
+
+    @abc.abstractmethod
+    def get(self, key):
+        pass
+
+    @abc.abstractmethod
+    def get_stale(self, key):
+        pass
+
+    @abc.abstractmethod
+    def expire(self, key):
+        pass
+
+    @abc.abstractmethod
+    def set(self, key, response, ttl=None):
+        pass
+
+    @abc.abstractmethod
+    def pop(self, key):
+        pass
+
+    @abc.abstractmethod
+    def clear(self):
+        pass
+
+    @abc.abstractmethod
+    def clear_prefix(self, prefix):
+        """ Remove entries with keys that start with prefix """
+
+
+class MemoryCache(Cache):
+    """
+    In-memory LRU cache of responses.
+
+    The cache is bounded by the number of entries and by the total size of
+    cached response bodies. Least recently used entries are evicted first
+    when any of the limits is reached. Entries can also have a time to live,
+    after which they are treated as missing. Expired entries are kept until
+    they are replaced or evicted, since they can still be revalidated.
+
+    All operations are thread-safe.
+    """
+
+    def __init__(self, max_entries=None, max_bytes=None):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries = collections.OrderedDict()
+        self._size = 0
+        self._hits = self._misses = self._evictions = self._expirations = 0
+        self._lock = threading.RLock()
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def stats(self):
+        with self._lock:
+            return CacheStats(
+                self._hits, self._misses, self._evictions, self._expirations,
+                len(self._entries), self._size,
+            )
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        self._size -= entry.response.size
+        return entry
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            if entry.expires is not None and entry.expires <= time.monotonic():
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.response
+
+    def get_stale(self, key):
+        """ Return cached response, even if expired, without updating stats """
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.response if entry else None
+
+    def expire(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.expires = float("-inf")
+
+    def set(self, key, response, ttl=None):
+        with self._lock:
+            # The old entry goes away even if the new one does not fit, so
+            # that it is not served in place of the new response.
+            if key in self._entries:
+                self._remove(key)
+            if self._max_bytes is not None and response.size > self._max_bytes:
+                return  # Would evict everything and still not fit
+
+            expires = None if ttl is None else time.monotonic() + ttl
+            self._entries[key] = _Entry(response, expires)
+            self._size += response.size
+
+            while self._over_limits():
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def _over_limits(self):
+        return (
+            (self._max_entries is not None and
+             len(self._entries) > self._max_entries) or
+            (self._max_bytes is not None and self._size > self._max_bytes)
+        )
+
+    def pop(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def clear_prefix(self, prefix):
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                self._remove(key)
+
+
+class SQLiteCache(Cache):
+    """
+    Response cache that is stored in an SQLite database.
+
+    The database can be shared by threads and processes (the database runs
+    in WAL mode), so that short-lived processes do not need to download the
+    same resources over and over again. Entries are evicted in least
+    recently used order when max_entries or max_bytes limits are reached,
+    and expire based on wall-clock time.
+
+    Hit, miss, eviction and expiration counters are per cache instance,
+    while entries and size reflect the shared database.
+    """
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            status INTEGER NOT NULL,
+            headers TEXT NOT NULL,
+            body BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            expires REAL,
+            accessed REAL NOT NULL
+        )
+    """
+
+    def __init__(self, path, max_entries=None, max_bytes=None, codec=None,
+                 timeout=30):
+        """
+        Args:
+          path: Path to the database file. Created if it does not exist.
+          max_entries: Maximum number of cached responses.
+          max_bytes: Maximum total size of cached response bodies.
+          codec: Codec (see redfish_client.codec) for decoding bodies.
+          timeout: Number of seconds to wait for other writers.
+        """
+        self._path = path
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._codec = codec
+        self._timeout = timeout
+        self._hits = self._misses = self._evictions = self._expirations = 0
+        self._lock = threading.RLock()
+        self._db = None
+        self._pid = None
+
+    def _connection(self):
+        # SQLite connections must not be used across fork.
+        if self._pid != os.getpid():
+            if self._path != ":memory:":
+                # Responses of authenticated requests are not for everyone.
+                os.close(os.open(self._path, os.O_CREAT | os.O_RDWR, 0o600))
+            self._db = sqlite3.connect(
+                self._path, timeout=self._timeout, isolation_level=None,
+                check_same_thread=False,
+            )
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(self.SCHEMA)
+            self._pid = os.getpid()
+        return self._db
+
+    def _execute(self, query, *args):
+        with self._lock:
+            return self._connection().execute(query, args).fetchall()
+
+    def close(self):
+        with self._lock:
+            if self._db is not None and self._pid == os.getpid():
+                self._db.close()
+            self._db = self._pid = None
+
+    def __contains__(self, key):
+        return bool(self._execute("SELECT 1 FROM responses WHERE key = ?", key))
+
+    def __len__(self):
+        return self._execute("SELECT COUNT(*) FROM responses")[0][0]
+
+    @property
+    def stats(self):
+        entries, size = self._execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses",
+        )[0]
+        return CacheStats(
+            self._hits, self._misses, self._evictions, self._expirations,
+            entries, size,
+        )
+
+    def _load(self, key):
+        rows = self._execute(
+            "SELECT status, headers, body, expires FROM responses WHERE key = ?",
+            key,
+        )
+        if not rows:
+            return None, None
+        status, headers, body, expires = rows[0]
+        response = Response(
+            status, CaseInsensitiveDict(json.loads(headers)), raw=bytes(body),
+            codec=self._codec,
+        )
+        return response, expires
+
+    def get(self, key):
+        with self._lock:
+            response, expires = self._load(key)
+            if response is None:
+                self._misses += 1
+                return None
+
+            if expires is not None and expires <= time.time():
+                self._expirations += 1
+                self._misses += 1
+                return None
+
+            self._execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?",
+                time.time(), key,
+            )
+            self._hits += 1
+            return response
+
+    def get_stale(self, key):
+        """ Return cached response, even if expired, without updating stats """
+        return self._load(key)[0]
+
+    def expire(self, key):
+        self._execute("UPDATE responses SET expires = 0 WHERE key = ?", key)
+
+    def set(self, key, response, ttl=None):
+        body = response.raw
+        if self._max_bytes is not None and len(body) > self._max_bytes:
+            # Would evict everything and still not fit. The old entry must
+            # not be served in place of the new response either.
+            self.pop(key)
+            return
+
+        now = time.time()
+        expires = None if ttl is None else now + ttl
+        with self._lock:
+            db = self._connection()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                db.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, response.status, json.dumps(dict(response.headers)),
+                     body, len(body), expires, now),
+                )
+                self._evict(db)
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+
+    def _over_limits(self, entries, size):
+        return (
+            (self._max_entries is not None and entries > self._max_entries) or
+            (self._max_bytes is not None and size > self._max_bytes)
+        )
+
+    def _evict(self, db):
+        entries, size = db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses",
+        ).fetchone()
+        if not self._over_limits(entries, size):
+            return
+
+        rows = db.execute(
+            "SELECT key, size FROM responses ORDER BY accessed, rowid",
+        ).fetchall()
+        evicted = []
+        for key, entry_size in rows:
+            if not self._over_limits(entries, size):
+                break
+            evicted.append((key,))
+            entries -= 1
+            size -= entry_size
+        db.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self._evictions += len(evicted)
+
+    def pop(self, key):
+        self._execute("DELETE FROM responses WHERE key = ?", key)
+
+    def clear(self):
+        self._execute("DELETE FROM responses")
+
+    def clear_prefix(self, prefix):
+        pattern = prefix
+        for special in "\\%_":
+            pattern = pattern.replace(special, "\\" + special)
+        self._execute(
+            "DELETE FROM responses WHERE key LIKE ? ESCAPE '\\'", pattern + "%",
+        )
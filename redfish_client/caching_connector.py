@@ -12,25 +12,220 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from redfish_client.connector import Connector
+import threading
+import time
+from urllib.parse import urlparse
+
+from redfish_client.cache import CachePolicy, MemoryCache
+from redfish_client.connector import Connector, Response
+
+
+def _resource_path(path):
+    return path.split("#", 1)[0].split("?", 1)[0].rstrip("/")
+
+
+class _Call:
+    """ GET request in flight that concurrent callers can wait for """
+    __slots__ = ("done", "response", "error", "stale")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+        # Set when a request changed the resource while this one was in
+        # flight, so that its (possibly outdated) response is not cached.
+        self.stale = False
+
+    def wait(self):
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.response
 
 
 class CachingConnector(Connector):
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, keep_raw=True, max_entries=None, max_bytes=None,
+                 ttl=None, revalidate=False, cache=None, policy=None,
+                 **kwargs):
+        """
+        Args:
+          keep_raw: Keep raw bodies of cached responses. If False, only the
+            parsed form of JSON responses is kept in the cache.
+          max_entries: Maximum number of cached responses.
+          max_bytes: Maximum total size of cached response bodies.
+          ttl: Number of seconds after which cached responses expire.
+            Ignored if policy is set.
+          revalidate: Revalidate expired responses that have an ETag with a
+            conditional request instead of fetching them again.
+          cache: Cache backend (see redfish_client.cache) to use instead of
+            the in-memory cache (max_entries and max_bytes are ignored).
+            Responses are keyed by their URL, so the same backend can be
+            shared between connectors (and processes, if the backend
+            supports it).
+          policy: CachePolicy with per-path and per-type expiration,
+            uncached paths and caching of missing resources.
+
+        The cache is unbounded and entries never expire by default.
+
+        Successful or not, POST, PATCH, PUT and DELETE requests invalidate
+        cached responses of resources that they might have changed: the
+        target resource, the parent collection (for POST and DELETE), the
+        resource that owns the action (for action POSTs) and the resource
+        in the Location header of the response.
+
+        The connector is safe to share between threads. Concurrent GET
+        requests for the same path are coalesced: one thread performs the
+        request while others wait for and share its response.
+        """
         super().__init__(*args, **kwargs)
-        self._cache = {}
+        self._keep_raw = keep_raw
+        self._policy = policy or CachePolicy(ttl=ttl)
+        self._revalidate = revalidate
+        if cache is None:
+            cache = MemoryCache(max_entries=max_entries, max_bytes=max_bytes)
+        self._cache = cache
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+
+    @property
+    def cache_stats(self):
+        return self._cache.stats
+
+    @staticmethod
+    def _etag(response):
+        etag = response.headers.get("etag")
+        if not etag and isinstance(response.json, dict):
+            etag = response.json.get("@odata.etag")
+        return etag
+
+    def get(self, path, headers=None, cache=True):
+        """
+        Perform a GET request, unless the response is already cached.
+
+        Requests with custom headers and requests with cache set to False
+        (for example, pages of large collections that would only push
+        useful entries out of the cache) bypass the cache.
+        """
+        if headers or not cache or not self._policy.cacheable(path):
+            return super().get(path, headers=headers)
+
+        start = time.monotonic()
+        with self._inflight_lock:
+            response = self._cache.get(self._url(path))
+            call = self._inflight.get(path) if response is None else None
+            leader = response is None and call is None
+            if leader:
+                call = self._inflight[path] = _Call()
 
-    def get(self, path):
-        if path in self._cache:
-            return self._cache[path]
+        if not leader:
+            self._notify_before("GET", path)
+            if response is None:
+                response = call.wait()
+            self._notify_after("GET", path, start, response, cached=True)
+            return response
 
-        response = super().get(path)
-        if response.status == 200:  # Do not cache failed requests
-            self._cache[path] = response
+        try:
+            call.response = self._fetch(path, call)
+            return call.response
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._inflight_lock:
+                if self._inflight.get(path) is call:
+                    del self._inflight[path]
+            call.done.set()
+
+    def _fetch(self, path, call):
+        key = self._url(path)
+        stale = self._cache.get_stale(key) if self._revalidate else None
+        etag = stale and self._etag(stale)
+        if etag:
+            response = super().get(path, headers={"If-None-Match": etag})
+            if response.status == 304:
+                response = stale
+        else:
+            response = super().get(path)
+
+        with self._inflight_lock:
+            if not call.stale and not self._store(path, response):
+                self._cache.pop(key)
         return response
 
+    def _store(self, path, response):
+        if not self._policy.cacheable(path, response):
+            return False
+        if not self._keep_raw:
+            response.drop_raw()
+        self._cache.set(
+            self._url(path), response, ttl=self._policy.ttl(path, response),
+        )
+        return True
+
     def reset(self, path=None):
         if path:
-            self._cache.pop(path, None)
+            self._cache.pop(self._url(path))
         else:
-            self._cache = {}
+            # Backends can be shared with connectors of other services.
+            self._cache.clear_prefix(self._base_url + "/")
+
+    def expire(self, path):
+        if self._revalidate:
+            self._cache.expire(self._url(path))
+        else:
+            self._cache.pop(self._url(path))
+
+    def seed(self, path, data):
+        """
+        Cache resource data that was received inline (for example, as a
+        member of an expanded collection), as if it was fetched from path.
+        """
+        self._store(path, Response(
+            200, {}, json=data, raw=self._codec.dumps(data), codec=self._codec,
+        ))
+
+    @staticmethod
+    def _affected_paths(method, path, response):
+        path = _resource_path(path)
+        paths = [path]
+        if "/Actions/" in path:
+            paths.append(path.split("/Actions/", 1)[0])
+        elif method in ("POST", "DELETE"):
+            paths.append(path.rsplit("/", 1)[0])
+        location = response is not None and response.headers.get("location")
+        if location:
+            paths.append(urlparse(location).path.rstrip("/"))
+        return paths
+
+    def _invalidate(self, method, path, response):
+        affected = self._affected_paths(method, path, response)
+        with self._inflight_lock:
+            for resource in affected:
+                # Services are not consistent about trailing slashes.
+                self._cache.pop(self._url(resource))
+                self._cache.pop(self._url(resource + "/"))
+            # Requests in flight might have read the old content, so later
+            # requests do not wait for them.
+            stale = [p for p in self._inflight if _resource_path(p) in affected]
+            for inflight in stale:
+                self._inflight.pop(inflight).stale = True
+
+    def _mutate(self, method, path, **kwargs):
+        response = None
+        try:
+            response = super()._request(method, path, **kwargs)
+            return response
+        finally:
+            self._invalidate(method, path, response)
+
+    def post(self, path, payload=None, headers=None):
+        return self._mutate("POST", path, payload=payload, headers=headers)
+
+    def patch(self, path, payload=None, headers=None):
+        return self._mutate("PATCH", path, payload=payload, headers=headers)
+
+    def put(self, path, payload=None, headers=None):
+        return self._mutate("PUT", path, payload=payload, headers=headers)
+
+    def delete(self, path, headers=None):
+        return self._mutate("DELETE", path, headers=headers)
@@ -0,0 +1,66 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+
+
+class JsonCodec:
+    """
+    Codec that encodes request payloads and decodes response bodies.
+
+    This one uses the json module from the standard library. Custom codecs
+    need to implement the same two methods: loads, which accepts bytes and
+    raises ValueError on invalid input, and dumps, which returns bytes.
+    """
+    name = "json"
+
+    def loads(self, data):
+        return json.loads(data)
+
+    def dumps(self, obj):
+        return json.dumps(obj).encode("utf-8")
+
+
+class OrjsonCodec(JsonCodec):
+    """ Codec backed by the orjson library (pip install orjson) """
+    name = "orjson"
+
+    def __init__(self):
+        # orjson is an optional dependency.
+        import orjson
+        self._orjson = orjson
+
+    def loads(self, data):
+        return self._orjson.loads(data)
+
+    def dumps(self, obj):
+        return self._orjson.dumps(obj)
+
+
+CODECS = {c.name: c for c in (JsonCodec, OrjsonCodec)}
+DEFAULT_CODEC = JsonCodec()
+
+
+def get_codec(codec=None):
+    """
+    Return codec instance for the codec name (json, orjson) or instance.
+    """
+    if codec is None:
+        return DEFAULT_CODEC
+    if isinstance(codec, str):
+        try:
+            return CODECS[codec]()
+        except KeyError:
+            raise ValueError("Unknown codec '{}'".format(codec))
+    return codec
@@ -14,17 +14,193 @@
 
 import base64
 import collections
-import json
 import logging
+import threading
+import time
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from redfish_client.exceptions import AuthException, InaccessibleException
+from redfish_client.codec import get_codec
+from redfish_client.exceptions import (
+    AuthException,
+    InaccessibleException,
+    ResourceNotFound,
+    TimedOutException,
+)
+from redfish_client.instrumentation import RequestEvent
+from redfish_client.wire_log import WireLogger
 
 
 logger = logging.getLogger('redfish-client')
-Response = collections.namedtuple("Response", "status headers json raw")
+PoolStats = collections.namedtuple("PoolStats", "connections requests reused")
+
+
+_UNPARSED = object()
+
+
+def _unavailable(status):
+    # Streams are often missing or failing while the service (re)starts,
+    # so these statuses are worth a retry.
+    return status == 404 or status >= 500
+
+
+class Response:
+    """
+    Response of the Redfish service.
+
+    Response behaves like a (status, headers, json, raw) named tuple. The
+    body is parsed on first access to the json field, and headers are kept
+    in the case-insensitive mapping that the HTTP library produced.
+
+    Calling drop_raw releases the raw body once it has been parsed, which
+    halves the memory held by long-lived (cached) responses. The raw field
+    of such response is re-encoded from the parsed data on demand.
+
+    The codec (see redfish_client.codec) decodes and encodes the body.
+    """
+    __slots__ = ("status", "headers", "size", "_json", "_raw", "_codec")
+    _fields = ("status", "headers", "json", "raw")
+
+    def __init__(self, status, headers, json=_UNPARSED, raw=b"", codec=None):
+        self.status = status
+        self.headers = headers
+        self.size = len(raw)
+        self._json = json
+        self._raw = raw
+        self._codec = get_codec(codec)
+
+    @property
+    def json(self):
+        if self._json is _UNPARSED:
+            try:
+                self._json = self._codec.loads(self._raw) if self._raw else None
+            except ValueError:
+                self._json = None
+        return self._json
+
+    @property
+    def raw(self):
+        if self._raw is None:
+            return self._codec.dumps(self._json)
+        return self._raw
+
+    def drop_raw(self):
+        # Bodies that are not valid JSON are only available in raw form.
+        if self.json is not None:
+            self._raw = None
+
+    def __iter__(self):
+        return iter((self.status, self.headers, self.json, self.raw))
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __getitem__(self, index):
+        return tuple(self)[index]
+
+    def __eq__(self, other):
+        if isinstance(other, (Response, tuple)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return "Response(status={!r}, headers={!r}, json={!r}, raw={!r})".format(
+            *self
+        )
+
+    def _asdict(self):
+        return dict(zip(self._fields, self))
+
+
+def _pool_key(url):
+    # Connection pools are per scheme, host and port.
+    url = urlparse(url)
+    port = url.port or {"http": 80, "https": 443}.get(url.scheme)
+    return url.scheme, url.hostname, port
+
+
+def _pool_idle(pool):
+    # Connections that are checked out are missing from the pool's queue.
+    queue = pool.pool
+    return queue is None or queue.qsize() >= queue.maxsize
+
+
+class PoolAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that counts opened connections and sent requests per host.
+
+    urllib3 silently reconnects dropped keep-alive connections, so we count
+    the connect calls instead of relying on the pool counters.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._stats_lock = threading.Lock()
+        self._connections = collections.Counter()
+        self._requests = collections.Counter()
+        self._last_used = {}
+        super().__init__(*args, **kwargs)
+
+    def _count(self, counter, host):
+        with self._stats_lock:
+            counter[host] += 1
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        adapter = self
+
+        def counting_pool_class(pool_class):
+            connection_class = pool_class.ConnectionCls
+
+            def connect(conn):
+                adapter._count(adapter._connections, conn.host)
+                return connection_class.connect(conn)
+
+            return type(pool_class.__name__, (pool_class,), dict(
+                ConnectionCls=type(connection_class.__name__, (connection_class,), dict(
+                    connect=connect,
+                )),
+            ))
+
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: counting_pool_class(pool_class)
+            for scheme, pool_class in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+    def send(self, request, *args, **kwargs):  # pylint: disable=arguments-differ
+        with self._stats_lock:
+            self._requests[urlparse(request.url).hostname] += 1
+            self._last_used[_pool_key(request.url)] = time.monotonic()
+        return super().send(request, *args, **kwargs)
+
+    def reap_idle(self, url, idle_timeout):
+        """
+        Drop connection pools for the service at url that were not used for
+        idle_timeout seconds. Pools with connections in use are kept, since
+        the adapter can be shared by many connectors.
+        """
+        key = _pool_key(url)
+        with self._stats_lock:
+            last_used = self._last_used.get(key)
+        if last_used is None or time.monotonic() - last_used < idle_timeout:
+            return
+
+        pools = self.poolmanager.pools
+        for pool_key in pools.keys():
+            if (pool_key.key_scheme, pool_key.key_host, pool_key.key_port) != key:
+                continue
+            pool = pools.get(pool_key)
+            if pool is not None and _pool_idle(pool):
+                pools.pop(pool_key, None)  # Popped pools are closed
+
+    def stats(self, host):
+        with self._stats_lock:
+            connections = self._connections[host]
+            requests_sent = self._requests[host]
+        return PoolStats(
+            connections, requests_sent, max(requests_sent - connections, 0),
+        )
 
 
 class Connector:
@@ -35,8 +211,34 @@ class Connector:
         "OData-Version": "4.0"
     }
     DEFAULT_TIMEOUT = 1  # In seconds
-
-    def __init__(self, base_url, username, password, verify=True, timeout=DEFAULT_TIMEOUT):
+    DEFAULT_POOL_CONNECTIONS = 10
+    DEFAULT_POOL_MAXSIZE = 10
+
+    def __init__(self, base_url, username, password, verify=True, timeout=DEFAULT_TIMEOUT,
+                 pool_connections=DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize=DEFAULT_POOL_MAXSIZE, pool_block=False,
+                 pool_idle_timeout=None, keep_alive=True, adapter=None,
+                 instruments=(), wire_log=None, codec=None):
+        """
+        Args:
+          pool_connections: Number of per-host connection pools to keep.
+          pool_maxsize: Maximum number of idle connections kept per host.
+          pool_block: Wait for a free connection instead of opening more than
+            pool_maxsize connections to the host.
+          pool_idle_timeout: Drop pooled connections to the host after this
+            many seconds without requests (BMCs tend to silently close idle
+            connections). None keeps them indefinitely.
+          keep_alive: Close connections after each request if False.
+          adapter: PoolAdapter to use instead of creating a new one. Passing
+            the same adapter to many connectors makes them share a single
+            connection pool. The pool_* arguments are ignored in this case.
+          instruments: Instrument objects that are notified about requests.
+          wire_log: WireLogger that logs requests and responses. The default
+            one logs to the redfish-client logger at the DEBUG level.
+          codec: Codec name (json, orjson) or instance that encodes request
+            payloads and decodes response bodies. Defaults to the json module
+            from the standard library.
+        """
         self._base_url = base_url.rstrip("/")
         self._username = username
         self._password = password
@@ -46,80 +248,132 @@ class Connector:
 
         self._basic_path = None
 
+        if adapter is None:
+            adapter = PoolAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+            )
+        self._adapter = adapter
+        self._pool_idle_timeout = pool_idle_timeout
+
         self._client = requests.Session()
+        self._client.mount("http://", adapter)
+        self._client.mount("https://", adapter)
         self._client.verify = verify
         self._client.headers = Connector.DEFAULT_HEADERS.copy()
+        if not keep_alive:
+            self._client.headers["Connection"] = "close"
         self._timeout = timeout
 
+        self._instruments = list(instruments)
+        self._wire_log = wire_log or WireLogger(logger)
+        self._codec = get_codec(codec)
+        self._protocol_features = {}
+
     def _url(self, path):
         return self._base_url + path
 
-    def _log_request(self, method, path, payload, headers):
-        try:
-            logger.debug(json.dumps(dict(
-                request=dict(
-                    method=method,
-                    base_url=self._base_url,
-                    path=path,
-                    payload=payload,
-                    headers=headers,
-                )
-            )))
-        except Exception as e:
-            logger.error(e)
-
-    def _log_response(self, method, path, response, json_data):
-        try:
-            logger.debug(json.dumps(dict(
-                request_data=dict(
-                    method=method,
-                    base_url=self._base_url,
-                    path=path
-                ),
-                response=dict(
-                    status_code=response.status_code,
-                    headers=dict(response.headers.lower_items()),
-                    content=str(response.content),
-                    json_data=json_data
-                )
-            )))
-        except Exception as e:
-            logger.error(e)
+    @property
+    def protocol_features(self):
+        """ ProtocolFeaturesSupported object of the service root """
+        return self._protocol_features
 
-    def _request(self, method, path, payload=None, headers=None):
-        self._log_request(method, path, payload, headers)
-        args = dict(json=payload) if payload is not None else {}
+    def set_protocol_features(self, features):
+        self._protocol_features = features or {}
+
+    @property
+    def pool_stats(self):
+        """
+        Connection reuse counters for the connections to our service.
+
+        Returns PoolStats with the number of opened connections (TLS
+        handshakes for https services), the number of requests sent, and
+        the number of requests that reused an already opened connection.
+        Counters of a shared adapter include requests of all connectors that
+        talk to the same host.
+        """
+        return self._adapter.stats(urlparse(self._base_url).hostname)
+
+    def _reap_idle_connections(self):
+        if self._pool_idle_timeout is not None:
+            self._adapter.reap_idle(self._base_url, self._pool_idle_timeout)
+
+    def add_instrument(self, instrument):
+        self._instruments.append(instrument)
+
+    def remove_instrument(self, instrument):
+        self._instruments.remove(instrument)
+
+    def _notify_before(self, method, path):
+        for instrument in self._instruments:
+            try:
+                instrument.before_request(self._base_url, method, path)
+            except Exception as e:
+                logger.error(e)
+
+    def _notify_after(self, method, path, start, response=None, relogin=False,
+                      cached=False):
+        if not self._instruments:
+            return
+
+        event = RequestEvent(
+            self._base_url, method, path,
+            response.status if response else None,
+            response.size if response else 0,
+            time.monotonic() - start, relogin, cached,
+        )
+        for instrument in self._instruments:
+            try:
+                instrument.after_request(event)
+            except Exception as e:
+                logger.error(e)
+
+    def _send(self, method, path, **kwargs):
+        self._reap_idle_connections()
+        kwargs.setdefault("timeout", self._timeout)
         try:
-            resp = self._client.request(
-                method,
-                self._url(path),
-                **args,
-                headers=headers,
-                timeout=self._timeout
-            )
+            return self._client.request(method, self._url(path), **kwargs)
         except requests.exceptions.ConnectionError:
             raise InaccessibleException(
                 "Endpoint at {} is not accessible".format(self._base_url))
+        except requests.exceptions.Timeout:
+            raise TimedOutException(
+                "Endpoint at {} did not respond in time".format(self._base_url))
 
-        if resp.status_code == 401:
-            self._unset_header("x-auth-token")
-            self.login()
-            resp = self._client.request(
-                method,
-                self._url(path),
-                **args,
-                headers=headers,
-                timeout=self._timeout
-            )
+    def _encode_payload(self, payload, headers):
+        if payload is None:
+            return dict(headers=headers)
+        headers = dict(headers or {})
+        headers.setdefault("Content-Type", "application/json")
+        return dict(data=self._codec.dumps(payload), headers=headers)
 
+    def _request(self, method, path, payload=None, headers=None):
+        wire = self._wire_log.sample()
+        if wire:
+            self._wire_log.log_request(
+                self._base_url, method, path, payload, headers,
+            )
+        self._notify_before(method, path)
+        start, response, relogin = time.monotonic(), None, False
+        args = self._encode_payload(payload, headers)
         try:
-            json_data = resp.json()
-        except ValueError:
-            json_data = None
-        self._log_response(method, path, resp, json_data)
-        resp_headers = dict(resp.headers.lower_items())
+            resp = self._send(method, path, **args)
+
+            if resp.status_code == 401:
+                relogin = True
+                self._unset_header("x-auth-token")
+                self.login()
+                resp = self._send(method, path, **args)
 
-        return Response(resp.status_code, resp_headers, json_data, resp.content)
+            response = Response(
+                resp.status_code, resp.headers, raw=resp.content, codec=self._codec,
+            )
+            if wire:
+                self._wire_log.log_response(self._base_url, method, path, response)
+            return response
+        finally:
+            self._notify_after(method, path, start, response, relogin)
 
     def _set_header(self, key, value):
         self._client.headers[key] = value
@@ -156,9 +410,9 @@ class Connector:
         return bool(self._session_path)
 
     def _session_login(self):
-        resp = self._client.post(self._url(self._session_path), json=dict(
+        resp = self._send("POST", self._session_path, json=dict(
             UserName=self._username, Password=self._password,
-        ), timeout=self._timeout)
+        ))
         if resp.status_code != 201:
             raise AuthException("Cannot create session: {}".format(resp.text))
 
@@ -174,7 +428,7 @@ class Connector:
 
     def _session_logout(self):
         if self._session_id:
-            self._client.delete(self._url(self._session_id), timeout=self._timeout)
+            self._send("DELETE", self._session_id)
             self._session_id = None
         self._unset_header("x-auth-token")
 
@@ -182,9 +436,8 @@ class Connector:
         secret = "Basic {}".format(base64.b64encode(
             "{}:{}".format(self._username, self._password).encode("ascii"),
         ).decode("ascii"))
-        resp = self._client.get(
-            self._url(self._basic_path), headers=dict(authorization=secret),
-            timeout=self._timeout
+        resp = self._send(
+            "GET", self._basic_path, headers=dict(authorization=secret),
         )
         if resp.status_code != 200:
             raise AuthException("Invalid credentials")
@@ -207,8 +460,59 @@ class Connector:
         self._session_logout()
         self._basic_logout()
 
-    def get(self, path):
-        return self._request("GET", path)
+    def get(self, path, headers=None, cache=True):
+        # Plain connector does not cache anything, so cache is ignored.
+        return self._request("GET", path, headers=headers)
+
+    def stream(self, path, headers=None, read_timeout=None):
+        """
+        Perform a streaming GET request and yield lines of the response body.
+
+        Lines are yielded (as bytes, without line endings) as soon as the
+        service sends them, which makes this suitable for reading endless
+        responses, like Server-Sent Events streams. Closing the generator
+        closes the connection. Streams that are missing (404) or failing
+        (5xx), as they often are while the service restarts, raise the
+        InaccessibleException that event streams retry on, while other
+        failures raise ResourceNotFound.
+
+        Args:
+          path: Path of the stream.
+          headers: Additional request headers.
+          read_timeout: Number of seconds to wait for data. Waits forever
+            if None.
+        """
+        args = dict(
+            headers=headers, stream=True, timeout=(self._timeout, read_timeout),
+        )
+        resp = self._send("GET", path, **args)
+        if resp.status_code == 401:
+            resp.close()
+            self._unset_header("x-auth-token")
+            self.login()
+            resp = self._send("GET", path, **args)
+
+        try:
+            if _unavailable(resp.status_code):
+                raise InaccessibleException(
+                    "Stream at {} is not available ({})".format(
+                        self._base_url, resp.status_code,
+                    ))
+            if resp.status_code != 200:
+                raise ResourceNotFound(resp.content)
+            # chunk_size=None yields data as it arrives instead of waiting
+            # for the buffer to fill up.
+            for line in resp.iter_lines(chunk_size=None):
+                yield line
+        except (requests.exceptions.ConnectionError,
+                requests.exceptions.ChunkedEncodingError):
+            raise InaccessibleException(
+                "Stream at {} was interrupted".format(self._base_url))
+        except requests.exceptions.Timeout:
+            raise TimedOutException(
+                "Stream at {} did not send data in time".format(self._base_url))
+        finally:
+            resp.close()
 
     def post(self, path, payload=None, headers=None):
         return self._request("POST", path, payload=payload, headers=headers)
@@ -220,7 +524,15 @@ class Connector:
         return self._request("PUT", path, payload=payload, headers=headers)
 
     def delete(self, path, headers=None):
-        return self._request("DELETE", path, headers=None)
+        return self._request("DELETE", path, headers=headers)
 
     def reset(self, _path=None):
         pass
+
+    def expire(self, path):
+        """ Mark cached response for the path as outdated """
+        self.reset(path)
+
+    def seed(self, path, data):
+        """ Store resource data that was received inline (no-op) """
+        pass
@@ -0,0 +1,189 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import collections
+import fnmatch
+import gzip
+import heapq
+import json
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlparse
+
+from redfish_client.exceptions import ClientException
+
+
+CrawlResult = collections.namedtuple(
+    "CrawlResult", "path depth status document error",
+)
+
+
+def _links(data):
+    # Yield values of all @odata.id and @odata.nextLink properties.
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if key == "@odata.id" or key.endswith("@odata.nextLink"):
+                if isinstance(value, str):
+                    yield value
+            else:
+                yield from _links(value)
+    elif isinstance(data, list):
+        for value in data:
+            yield from _links(value)
+
+
+class Crawler:
+    """
+    Concurrent breadth-first crawler of the Redfish resource tree.
+
+    The crawler follows @odata.id links (and next links of paginated
+    collections) starting at the service root. Each path is fetched once,
+    no matter how many resources link to it, so cross-links cannot cause
+    loops. Documents are yielded (or written to the snapshot) as soon as
+    they arrive and are not kept around, so memory use does not depend on
+    the size of documents. Only the set of visited paths grows with the
+    size of the tree.
+    """
+    DEFAULT_WORKERS = 8
+    ROOT = "/redfish/v1"
+
+    def __init__(self, connector, max_depth=None, include=(), exclude=(),
+                 max_workers=DEFAULT_WORKERS):
+        """
+        Args:
+          connector: Connector of the service (already logged in).
+          max_depth: Maximum number of links between the start and crawled
+            resources. Unlimited if None.
+          include: Glob patterns of paths to follow. If set, links with
+            paths that match none of the patterns are not followed.
+          exclude: Glob patterns of paths that are not followed.
+          max_workers: Maximum number of requests that are in flight.
+        """
+        self._connector = connector
+        self._max_depth = max_depth
+        self._include = tuple(include)
+        self._exclude = tuple(exclude)
+        self._max_workers = max_workers
+
+    def _follow(self, path):
+        if self._include and not any(
+                fnmatch.fnmatchcase(path, p) for p in self._include):
+            return False
+        return not any(fnmatch.fnmatchcase(path, p) for p in self._exclude)
+
+    @staticmethod
+    def _normalize(link):
+        # Drop host and fragment (fragments point into fetched documents).
+        url = urlparse(link)
+        path = url.path.rstrip("/") or "/"
+        return path + ("?" + url.query if url.query else "")
+
+    def _fetch(self, path, depth):
+        try:
+            resp = self._connector.get(path, cache=False)
+        except ClientException as e:
+            return CrawlResult(path, depth, None, None, str(e))
+        return CrawlResult(path, depth, resp.status, resp.json, None)
+
+    def crawl(self, start=ROOT):
+        """
+        Crawl the tree and yield CrawlResult for each fetched path.
+
+        Requests that fail without a response (inaccessible service,
+        timeout, ...) yield results with status None and the error.
+        """
+        start = self._normalize(start)
+        seen = {start}
+        queue = collections.deque([(start, 0)])
+        inflight = {}
+        # Links of fetched resources wait here until all shallower resources
+        # are fetched, so that each path is recorded at its shortest depth.
+        pending = []
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            try:
+                while queue or inflight or pending:
+                    self._expand(pending, queue, inflight, seen)
+                    while queue and len(inflight) < self._max_workers:
+                        path, depth = queue.popleft()
+                        future = executor.submit(self._fetch, path, depth)
+                        inflight[future] = depth
+                    if not inflight:
+                        continue
+
+                    done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        del inflight[future]
+                        result = future.result()
+                        depth = result.depth + 1
+                        if self._max_depth is None or depth <= self._max_depth:
+                            links = [
+                                self._normalize(link)
+                                for link in _links(result.document)
+                            ]
+                            heapq.heappush(
+                                pending, (result.depth, id(links), links),
+                            )
+                        yield result
+            finally:
+                for future in inflight:
+                    future.cancel()
+
+    def _expand(self, pending, queue, inflight, seen):
+        depths = list(inflight.values()) + ([queue[0][1]] if queue else [])
+        lowest = min(depths, default=None)
+        while pending and (lowest is None or pending[0][0] <= lowest):
+            depth, _, links = heapq.heappop(pending)
+            for path in links:
+                if path not in seen and self._follow(path):
+                    seen.add(path)
+                    queue.append((path, depth + 1))
+
+    def snapshot(self, output, start=ROOT, compress=None):
+        """
+        Crawl the tree and write the results to a JSON Lines file.
+
+        Each line holds path, status, document and error of one resource.
+
+        Args:
+          output: Path of the output file or a writable text file object.
+          start: Path to start crawling at.
+          compress: Write gzip-compressed file. Defaults to True for paths
+            that end with .gz.
+
+        Returns:
+          Number of written documents.
+        """
+        if hasattr(output, "write"):
+            return self._write(output, start)
+
+        if compress is None:
+            compress = str(output).endswith(".gz")
+        if compress:
+            stream = gzip.open(output, "wt", encoding="utf-8")
+        else:
+            stream = open(output, "w", encoding="utf-8")
+        with stream:
+            return self._write(stream, start)
+
+    def _write(self, stream, start):
+        count = 0
+        for result in self.crawl(start):
+            stream.write(json.dumps(dict(
+                path=result.path,
+                status=result.status,
+                document=result.document,
+                error=result.error,
+            ), separators=(",", ":")))
+            stream.write("\n")
+            count += 1
+        return count
@@ -0,0 +1,230 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import urlparse
+
+from redfish_client.exceptions import SubscriptionException
+
+
+logger = logging.getLogger("redfish-client")
+
+EVENT_SERVICE = "/redfish/v1/EventService"
+
+# Resource event message names (ResourceEvent registry) and legacy event
+# types that are mapped to cache invalidations.
+CHANGED = frozenset(("ResourceChanged", "ResourceUpdated"))
+ADDED = frozenset(("ResourceAdded", "ResourceCreated"))
+REMOVED = frozenset(("ResourceRemoved",))
+# Event types to subscribe to on services that predate the ResourceEvent
+# registry (and reject RegistryPrefixes).
+EVENT_TYPES = ["ResourceUpdated", "ResourceAdded", "ResourceRemoved"]
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length)
+        # Reply first, since services time out slow event receivers.
+        self.send_response(204)
+        self.end_headers()
+        try:
+            self.server.listener.handle(json.loads(body.decode("utf-8")))
+        except Exception as e:
+            logger.error("Cannot process event: {}".format(e))
+
+    def log_message(self, *args):
+        pass
+
+
+def _event_name(record):
+    # MessageId is Registry.Major.Minor.Message, EventType is deprecated,
+    # but older services only set that one.
+    message_id = record.get("MessageId")
+    if message_id:
+        return message_id.rsplit(".", 1)[-1]
+    return record.get("EventType")
+
+
+def _origin(record):
+    origin = record.get("OriginOfCondition")
+    if isinstance(origin, dict):
+        origin = origin.get("@odata.id")
+    return origin and urlparse(origin).path.rstrip("/")
+
+
+class EventListener:
+    """
+    Receiver of pushed events that keeps connector's cache up to date.
+
+    The listener runs an HTTP server in a background thread and registers
+    an EventService subscription for it. Resources named in the
+    OriginOfCondition of resource change events are evicted from the
+    cache. Parent collections are evicted as well when resources are added
+    or removed.
+
+    Services need to be able to reach the listener at destination, which
+    defaults to http(s)://host:port/ and must be set explicitly when the
+    listener binds to all interfaces or sits behind NAT.
+    """
+
+    def __init__(self, connector, host="127.0.0.1", port=0, destination=None,
+                 ssl_context=None, context="redfish-client", callback=None):
+        """
+        Args:
+          connector: Connector, whose cache gets invalidated.
+          host: Address to bind the listener to.
+          port: Port to listen on. 0 picks a free port.
+          destination: URL that services use for sending events.
+          ssl_context: ssl.SSLContext with server certificate for HTTPS.
+          context: Context value of the subscription.
+          callback: Function that is called with each received event,
+            after the cache is invalidated.
+        """
+        self._connector = connector
+        self._server = _Server((host, port), _Handler)
+        self._server.listener = self
+        if ssl_context:
+            self._server.socket = ssl_context.wrap_socket(
+                self._server.socket, server_side=True,
+            )
+        self._destination = destination or "{}://{}:{}/".format(
+            "https" if ssl_context else "http", host, self.port,
+        )
+        self._context = context
+        self._callback = callback
+        self._thread = None
+        self._subscription = None
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    @property
+    def destination(self):
+        return self._destination
+
+    @property
+    def subscription(self):
+        return self._subscription
+
+    def __enter__(self):
+        self.start()
+        try:
+            self.subscribe()
+        except Exception:
+            self.stop()
+            raise
+        return self
+
+    def __exit__(self, *_args):
+        self.stop()
+
+    def start(self):
+        """ Start receiving events in a background thread """
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, kwargs=dict(poll_interval=0.1),
+                name="redfish-event-listener", daemon=True,
+            )
+            self._thread.start()
+
+    def _subscriptions_path(self):
+        resp = self._connector.get(EVENT_SERVICE)
+        if resp.status == 200 and isinstance(resp.json, dict):
+            oid = resp.json.get("Subscriptions", {}).get("@odata.id")
+            if oid:
+                return oid
+        return EVENT_SERVICE + "/Subscriptions"
+
+    def subscribe(self):
+        """
+        Register the listener with the service's EventService.
+
+        Services that reject subscriptions to the ResourceEvent registry
+        (with 400 Bad Request) are subscribed to the legacy EventTypes.
+        """
+        path = self._subscriptions_path()
+        subscription = dict(
+            Destination=self._destination,
+            Protocol="Redfish",
+            Context=self._context,
+        )
+        resp = self._connector.post(path, payload=dict(
+            subscription, RegistryPrefixes=["ResourceEvent"],
+        ))
+        if resp.status == 400:
+            resp = self._connector.post(path, payload=dict(
+                subscription, EventTypes=EVENT_TYPES,
+            ))
+        if resp.status not in (200, 201, 204):
+            raise SubscriptionException(
+                "Cannot subscribe to events: {}".format(resp.raw)
+            )
+
+        location = resp.headers.get("location")
+        if not location and isinstance(resp.json, dict):
+            location = resp.json.get("@odata.id")
+        self._subscription = location and urlparse(location).path
+        return self._subscription
+
+    def unsubscribe(self):
+        if self._subscription:
+            try:
+                self._connector.delete(self._subscription)
+            except Exception as e:
+                logger.error("Cannot delete subscription: {}".format(e))
+            self._subscription = None
+
+    def stop(self):
+        """ Delete the subscription and stop the listener """
+        self.unsubscribe()
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def _evict(self, path):
+        # Services are not consistent about trailing slashes.
+        self._connector.reset(path)
+        self._connector.reset(path + "/")
+
+    def handle(self, event):
+        """
+        Invalidate cached resources affected by the event.
+
+        Args:
+          event: Parsed Event payload.
+        """
+        for record in event.get("Events", []):
+            name = _event_name(record)
+            origin = _origin(record)
+            if not origin or name not in CHANGED | ADDED | REMOVED:
+                continue
+
+            self._evict(origin)
+            if name not in CHANGED:
+                self._evict(origin.rsplit("/", 1)[0])
+
+        if self._callback:
+            self._callback(event)
@@ -39,3 +39,11 @@ class ResourceNotFound(ClientException):
 
 class InaccessibleException(ClientException):
     pass
+
+
+class ResourceNotLoaded(ClientException):
+    pass
+
+
+class SubscriptionException(ClientException):
+    pass
@@ -0,0 +1,135 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import collections
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import redfish_client
+
+
+FleetResult = collections.namedtuple("FleetResult", "base_url value exception")
+
+
+class Fleet:
+    """
+    Group of Redfish services that are operated on concurrently.
+
+    Targets are (base_url, (username, password)) pairs. All remaining
+    keyword arguments are passed to the redfish_client.connect function
+    when logging in to the services.
+
+    The run method returns a generator that yields FleetResult tuples as
+    soon as the work for a host completes, while login and logout finish
+    the work for all hosts and return a dict of results by base URL. Each
+    result holds either the value or the exception that was raised while
+    processing the host, so a single unreachable service never aborts the
+    whole run.
+    """
+    DEFAULT_MAX_WORKERS = 32
+
+    def __init__(self, targets, max_workers=DEFAULT_MAX_WORKERS, **connect_args):
+        self._targets = collections.OrderedDict(
+            (base_url, credentials) for base_url, credentials in targets
+        )
+        self._max_workers = max_workers
+        self._connect_args = connect_args
+        self._roots = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc_info):
+        self.logout()
+
+    @property
+    def roots(self):
+        """ Mapping of base URLs to the Root objects of logged-in services """
+        with self._lock:
+            return dict(self._roots)
+
+    def _connect(self, base_url):
+        with self._lock:
+            root = self._roots.get(base_url)
+        if root is None:
+            username, password = self._targets[base_url]
+            root = redfish_client.connect(
+                base_url, username, password, **self._connect_args
+            )
+            with self._lock:
+                self._roots[base_url] = root
+        return root
+
+    def _map(self, func, base_urls):
+        def task(base_url):
+            try:
+                return FleetResult(base_url, func(base_url), None)
+            except Exception as e:
+                return FleetResult(base_url, None, e)
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = [executor.submit(task, url) for url in base_urls]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def login(self):
+        """
+        Log in to all services that are not logged in yet.
+
+        Returns a dict of FleetResult tuples (with the Root object as a
+        value) by base URL.
+        """
+        return {
+            result.base_url: result for result in self._map(self._connect, [
+                url for url in self._targets if url not in self.roots
+            ])
+        }
+
+    def run(self, action):
+        """
+        Run an action against every service in the fleet.
+
+        Args:
+          action: Callable that receives a Root object or a path of keys,
+            separated by slashes (for example Systems/Members/0/PowerState),
+            that is resolved starting at the Root object.
+
+        Services that are not logged in yet are logged in first.
+        """
+        if callable(action):
+            func = action
+        else:
+            def func(root):
+                return root._resolve(action)
+
+        return self._map(lambda url: func(self._connect(url)), self._targets)
+
+    def logout(self):
+        """
+        Log out from all logged-in services.
+
+        Returns a dict of FleetResult tuples by base URL. Services that
+        failed to log out stay logged in, so that the logout can be retried.
+        """
+        roots = self.roots
+        results = {
+            result.base_url: result
+            for result in self._map(lambda url: roots[url].logout(), roots)
+        }
+        with self._lock:
+            for base_url, result in results.items():
+                if result.exception is None:
+                    self._roots.pop(base_url, None)
+        return results
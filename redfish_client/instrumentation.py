@@ -0,0 +1,168 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import bisect
+import collections
+import re
+import threading
+
+
+RequestEvent = collections.namedtuple(
+    "RequestEvent", "base_url method path status size elapsed relogin cached",
+)
+
+
+class Instrument:
+    """
+    Base class for request instrumentation.
+
+    Instruments are registered with connectors, which call the hooks around
+    every request. The status of requests that failed without a response
+    (inaccessible service, timeout, ...) is None.
+    """
+
+    def before_request(self, base_url, method, path):
+        pass
+
+    def after_request(self, event):
+        pass
+
+
+def path_template(path):
+    """
+    Replace resource identifiers in the path with a placeholder.
+
+    Path segments after the /redfish/v1 prefix that contain digits are
+    treated as identifiers: /redfish/v1/Systems/1/Memory/DIMM2 becomes
+    /redfish/v1/Systems/{id}/Memory/{id}.
+    """
+    path = path.split("?", 1)[0].split("#", 1)[0]
+    components = path.strip("/").split("/")
+    return "/" + "/".join(
+        "{id}" if i > 1 and re.search(r"\d", c) else c
+        for i, c in enumerate(components)
+    )
+
+
+class Histogram:
+    # Upper bounds of latency buckets in seconds
+    DEFAULT_BUCKETS = (
+        0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, float("inf"),
+    )
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.bounds = tuple(buckets)
+        self.counts = [0] * len(self.bounds)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        index = min(bisect.bisect_left(self.bounds, value), len(self.bounds) - 1)
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    @property
+    def mean(self):
+        return self.sum / self.count if self.count else 0.0
+
+    def as_dict(self):
+        cumulative, buckets = 0, []
+        for bound, count in zip(self.bounds, self.counts):
+            cumulative += count
+            buckets.append(("+Inf" if bound == float("inf") else bound, cumulative))
+        return dict(
+            count=self.count, sum=self.sum, max=self.max, buckets=buckets,
+        )
+
+
+class RequestStats:
+    def __init__(self, buckets=Histogram.DEFAULT_BUCKETS):
+        self.latency = Histogram(buckets)
+        self.bytes = 0
+        self.cached = 0
+        self.relogins = 0
+        self.errors = 0
+        self.statuses = collections.Counter()
+
+    def record(self, event):
+        self.latency.observe(event.elapsed)
+        self.bytes += event.size
+        self.cached += event.cached
+        self.relogins += event.relogin
+        if event.status is None:
+            self.errors += 1
+        else:
+            self.statuses[event.status] += 1
+
+    def as_dict(self):
+        return dict(
+            latency=self.latency.as_dict(),
+            bytes=self.bytes,
+            cached=self.cached,
+            relogins=self.relogins,
+            errors=self.errors,
+            statuses=dict(self.statuses),
+        )
+
+
+class MetricsCollector(Instrument):
+    """
+    In-memory collector of request metrics.
+
+    Requests are aggregated per method and path template (see path_template
+    for the default template function) and per service base URL. Since the
+    same collector can be registered with many connectors, this makes it
+    possible to compare BMCs as well as endpoints.
+    """
+
+    def __init__(self, templater=path_template, buckets=Histogram.DEFAULT_BUCKETS):
+        self._templater = templater
+        self._buckets = buckets
+        self._lock = threading.Lock()
+        self._paths = {}
+        self._hosts = {}
+
+    def _stats(self, store, key):
+        stats = store.get(key)
+        if stats is None:
+            stats = store[key] = RequestStats(self._buckets)
+        return stats
+
+    def after_request(self, event):
+        path_key = "{} {}".format(event.method, self._templater(event.path))
+        with self._lock:
+            self._stats(self._paths, path_key).record(event)
+            self._stats(self._hosts, event.base_url).record(event)
+
+    def slowest(self, count=10):
+        """ Return (path template, mean latency) pairs, slowest first """
+        with self._lock:
+            means = [(k, v.latency.mean) for k, v in self._paths.items()]
+        return sorted(means, key=lambda i: i[1], reverse=True)[:count]
+
+    def snapshot(self):
+        """ Return collected metrics as a JSON-serializable dictionary """
+        with self._lock:
+            return dict(
+                paths={k: v.as_dict() for k, v in self._paths.items()},
+                hosts={k: v.as_dict() for k, v in self._hosts.items()},
+            )
+
+    def reset(self):
+        with self._lock:
+            self._paths = {}
+            self._hosts = {}
@@ -0,0 +1,528 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import argparse
+import base64
+import collections
+import itertools
+import json
+import os
+import random
+import secrets
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import urlparse
+
+
+MockStats = collections.namedtuple(
+    "MockStats", "requests rejected connections peak_connections sessions",
+)
+
+ROOT = "/redfish/v1"
+SESSIONS = ROOT + "/SessionService/Sessions"
+# Paths that services serve without authentication.
+PUBLIC = frozenset(("/redfish", ROOT, ROOT + "/odata", ROOT + "/$metadata"))
+MALFORMED_JSON = {"error": {
+    "code": "Base.1.0.MalformedJSON",
+    "message": "The request body submitted was malformed JSON and could "
+               "not be parsed by the receiving service.",
+}}
+
+
+def load_mockup(directory):
+    """
+    Load documents of a DMTF mockup directory.
+
+    Each index.json file in the directory tree holds the resource at the
+    path of its directory. Both full mockups (the ones with the redfish/v1
+    directories) and mockups that start at the service root are supported.
+    """
+    if os.path.isdir(os.path.join(directory, "redfish")):
+        prefix = ""
+    else:
+        prefix = ROOT
+
+    documents = {}
+    for dirpath, _, filenames in os.walk(directory):
+        if "index.json" not in filenames:
+            continue
+        relative = os.path.relpath(dirpath, directory).replace(os.sep, "/")
+        path = prefix + ("" if relative == "." else "/" + relative)
+        with open(os.path.join(dirpath, "index.json"), encoding="utf-8") as f:
+            documents[path or "/"] = json.load(f)
+    return documents
+
+
+def generate_documents(systems=4):
+    """ Generate a minimal service with the given number of systems """
+    members = [
+        {"@odata.id": "{}/Systems/{}".format(ROOT, i)}
+        for i in range(1, systems + 1)
+    ]
+    documents = {
+        ROOT: {
+            "@odata.id": ROOT,
+            "@odata.type": "#ServiceRoot.v1_5_0.ServiceRoot",
+            "Id": "RootService",
+            "RedfishVersion": "1.6.0",
+            "SessionService": {"@odata.id": ROOT + "/SessionService"},
+            "Systems": {"@odata.id": ROOT + "/Systems"},
+            "Links": {"Sessions": {"@odata.id": SESSIONS}},
+        },
+        ROOT + "/SessionService": {
+            "@odata.id": ROOT + "/SessionService",
+            "@odata.type": "#SessionService.v1_1_6.SessionService",
+            "Id": "SessionService",
+            "Sessions": {"@odata.id": SESSIONS},
+        },
+        ROOT + "/Systems": {
+            "@odata.id": ROOT + "/Systems",
+            "@odata.type": "#ComputerSystemCollection.ComputerSystemCollection",
+            "Members": members,
+            "Members@odata.count": len(members),
+        },
+    }
+    for i, member in enumerate(members, 1):
+        documents[member["@odata.id"]] = {
+            "@odata.id": member["@odata.id"],
+            "@odata.type": "#ComputerSystem.v1_10_0.ComputerSystem",
+            "Id": str(i),
+            "Name": "System {}".format(i),
+            "PowerState": "On",
+            "Status": {"State": "Enabled", "Health": "OK"},
+        }
+    return documents
+
+
+def _normalize(path):
+    return path.rstrip("/") or "/"
+
+
+def _payload(body):
+    try:
+        payload = json.loads(body.decode("utf-8"))
+    except ValueError:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    # Load tests open many connections at once.
+    request_queue_size = 128
+
+    def handle_error(self, request, client_address):
+        # Clients that give up on a request (timeouts, closed streams) are
+        # not worth a traceback.
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return
+        super().handle_error(request, client_address)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, so Nagle's algorithm would
+    # add a delayed ACK round to every response.
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.accepted = self.server.mock._connect()
+
+    def finish(self):
+        try:
+            super().finish()
+        finally:
+            if self.accepted:
+                self.server.mock._disconnect()
+
+    def _dispatch(self):
+        self.server.mock._handle(self)
+
+    do_GET = do_HEAD = do_POST = do_PATCH = do_PUT = do_DELETE = _dispatch
+
+    def log_message(self, *args):
+        pass
+
+
+class MockServer:
+    """
+    Mock Redfish service that runs in a background thread.
+
+    Without documents or mockup, the server serves a small generated
+    service (see generate_documents). Clients log in with the username and
+    password, either with sessions or with basic authentication. Requests
+    with expired or deleted session tokens get 401 responses.
+
+    Documents can be changed: PATCH merges properties into the document,
+    POST to a collection creates a new member and DELETE removes the
+    document. Query parameters are ignored, unless the documents contain
+    the path with the query.
+    """
+
+    def __init__(self, documents=None, mockup=None, host="127.0.0.1", port=0,
+                 latency=0, bandwidth=None, max_connections=None,
+                 retry_after=1, error_rate=0, username="user",
+                 password="pass", max_sessions=None, session_timeout=None,
+                 seed=None):
+        """
+        Args:
+          documents: Dictionary of documents keyed by their paths.
+          mockup: Path of a DMTF mockup directory to serve (see
+            load_mockup). Ignored if documents are set.
+          host: Address to bind the server to.
+          port: Port to listen on. 0 picks a free port.
+          latency: Number of seconds to wait before responding, or a
+            function that returns it for the request method and path.
+          bandwidth: Maximum number of response body bytes per second,
+            per connection.
+          max_connections: Maximum number of open connections. Requests
+            over additional connections get 503 responses and the server
+            closes those connections.
+          retry_after: Value of the Retry-After header of 503 responses.
+          error_rate: Probability of a 503 response for any request.
+          username: User name that clients log in with.
+          password: Password that clients log in with.
+          max_sessions: Maximum number of open sessions. Login requests
+            over the limit get 503 responses.
+          session_timeout: Number of seconds after which unused session
+            tokens expire.
+          seed: Seed of the random number generator for error injection.
+        """
+        if documents is None:
+            documents = load_mockup(mockup) if mockup else generate_documents()
+        self._documents = {_normalize(k): v for k, v in documents.items()}
+        root = self._documents.get(ROOT, {})
+        sessions = root.get("Links", {}).get("Sessions", {})
+        self._sessions_path = _normalize(sessions.get("@odata.id", SESSIONS))
+
+        self._latency = latency
+        self._bandwidth = bandwidth
+        self._max_connections = max_connections
+        self._retry_after = retry_after
+        self._error_rate = error_rate
+        self._random = random.Random(seed)
+        self._basic = "Basic {}".format(base64.b64encode(
+            "{}:{}".format(username, password).encode("utf-8"),
+        ).decode("ascii"))
+        self._credentials = (username, password)
+        self._max_sessions = max_sessions
+        self._session_timeout = session_timeout
+
+        self._lock = threading.Lock()
+        self._sessions = {}  # Token -> [session path, last use]
+        self._session_ids = itertools.count(1)
+        self._requests = self._rejected = 0
+        self._connections = self._peak_connections = 0
+
+        self._server = _Server((host, port), _Handler)
+        self._server.mock = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return "http://{}:{}".format(host, port)
+
+    @property
+    def stats(self):
+        with self._lock:
+            return MockStats(
+                self._requests, self._rejected, self._connections,
+                self._peak_connections, len(self._sessions),
+            )
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *_args):
+        self.stop()
+
+    def start(self):
+        """ Start serving requests in a background thread """
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, kwargs=dict(poll_interval=0.1),
+                name="redfish-mock-server", daemon=True,
+            )
+            self._thread.start()
+
+    def serve_forever(self):
+        """ Serve requests in the calling thread """
+        self._server.serve_forever()
+
+    def stop(self):
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def expire_sessions(self):
+        """ Make all session tokens invalid, as if the BMC rebooted """
+        with self._lock:
+            self._sessions.clear()
+
+    def _connect(self):
+        with self._lock:
+            if (self._max_connections is not None and
+                    self._connections >= self._max_connections):
+                return False
+            self._connections += 1
+            self._peak_connections = max(
+                self._peak_connections, self._connections,
+            )
+            return True
+
+    def _disconnect(self):
+        with self._lock:
+            self._connections -= 1
+
+    def _handle(self, handler):
+        length = int(handler.headers.get("Content-Length") or 0)
+        body = handler.rfile.read(length) if length else b""
+        method = handler.command
+        url = urlparse(handler.path)
+        path = _normalize(url.path)
+        target = path + ("?" + url.query if url.query else "")
+
+        with self._lock:
+            self._requests += 1
+            unavailable = not handler.accepted or (
+                self._error_rate and self._random.random() < self._error_rate
+            )
+            if unavailable:
+                self._rejected += 1
+        if unavailable:
+            handler.close_connection = not handler.accepted
+            return self._reply(handler, 503, None, {
+                "Retry-After": str(self._retry_after),
+            })
+
+        latency = self._latency
+        if callable(latency):
+            latency = latency(method, target)
+        if latency:
+            time.sleep(latency)
+
+        if method == "POST" and path == self._sessions_path:
+            return self._login(handler, body)
+        if path not in PUBLIC and not self._authorized(handler):
+            return self._reply(handler, 401, None, {
+                "WWW-Authenticate": 'Basic realm="redfish"',
+            })
+        if path.startswith(self._sessions_path):
+            return self._session(handler, method, path)
+        return self._document(handler, method, path, target, body)
+
+    def _authorized(self, handler):
+        token = handler.headers.get("X-Auth-Token")
+        if token is None:
+            return handler.headers.get("Authorization") == self._basic
+
+        now = time.monotonic()
+        with self._lock:
+            session = self._sessions.get(token)
+            if session is None:
+                return False
+            if (self._session_timeout is not None and
+                    now - session[1] > self._session_timeout):
+                del self._sessions[token]
+                return False
+            session[1] = now
+            return True
+
+    def _login(self, handler, body):
+        try:
+            data = json.loads(body.decode("utf-8"))
+            credentials = (data.get("UserName"), data.get("Password"))
+        except (ValueError, AttributeError):
+            credentials = None
+        if credentials != self._credentials:
+            return self._reply(handler, 401, None)
+
+        with self._lock:
+            if (self._max_sessions is not None and
+                    len(self._sessions) >= self._max_sessions):
+                full = True
+            else:
+                full = False
+                token = secrets.token_hex(16)
+                path = "{}/{}".format(self._sessions_path, next(self._session_ids))
+                self._sessions[token] = [path, time.monotonic()]
+        if full:
+            return self._reply(handler, 503, None, {
+                "Retry-After": str(self._retry_after),
+            })
+        return self._reply(handler, 201, self._session_document(path), {
+            "X-Auth-Token": token, "Location": path,
+        })
+
+    def _session_document(self, path):
+        return {
+            "@odata.id": path,
+            "@odata.type": "#Session.v1_0_0.Session",
+            "Id": path.rsplit("/", 1)[-1],
+            "UserName": self._credentials[0],
+        }
+
+    def _session(self, handler, method, path):
+        with self._lock:
+            paths = [session[0] for session in self._sessions.values()]
+            if method == "DELETE" and path in paths:
+                self._sessions = {
+                    k: v for k, v in self._sessions.items() if v[0] != path
+                }
+
+        if path == self._sessions_path and method == "GET":
+            return self._reply(handler, 200, {
+                "@odata.id": path,
+                "Members": [{"@odata.id": p} for p in sorted(paths)],
+                "Members@odata.count": len(paths),
+            })
+        if path not in paths:
+            return self._reply(handler, 404, None)
+        if method == "DELETE":
+            return self._reply(handler, 204, None)
+        if method == "GET":
+            return self._reply(handler, 200, self._session_document(path))
+        return self._reply(handler, 405, None)
+
+    def _document(self, handler, method, path, target, body):
+        with self._lock:
+            key = target if target in self._documents else path
+            document = self._documents.get(key)
+            if document is None:
+                status, document, headers = 404, None, {}
+            elif method in ("GET", "HEAD"):
+                status, headers = 200, {}
+            elif method == "PATCH":
+                payload = _payload(body)
+                if payload is None:
+                    status, document, headers = 400, MALFORMED_JSON, {}
+                else:
+                    document = dict(document, **payload)
+                    self._documents[key] = document
+                    status, headers = 200, {}
+            elif method == "DELETE":
+                del self._documents[key]
+                status, document, headers = 204, None, {}
+            elif method == "POST" and "Members" in document:
+                status, document, headers = self._create(key, document, body)
+            else:
+                status, document, headers = 405, None, {}
+        self._reply(handler, status, document, headers)
+
+    def _create(self, path, collection, body):
+        # Called with the lock held.
+        payload = _payload(body)
+        if payload is None:
+            return 400, MALFORMED_JSON, {}
+        member = "{}/{}".format(path, len(collection["Members"]) + 1)
+        while member in self._documents:
+            member += "_"
+        document = dict(payload, **{"@odata.id": member})
+        members = collection["Members"] + [{"@odata.id": member}]
+        self._documents[path] = dict(collection, **{
+            "Members": members, "Members@odata.count": len(members),
+        })
+        self._documents[member] = document
+        return 201, document, {"Location": member}
+
+    def _reply(self, handler, status, document, headers=None):
+        body = b"" if document is None else json.dumps(document).encode("utf-8")
+        handler.send_response(status)
+        handler.send_header("OData-Version", "4.0")
+        if document is not None:
+            handler.send_header("Content-Type", "application/json")
+        for key, value in (headers or {}).items():
+            handler.send_header(key, value)
+        if handler.close_connection:
+            handler.send_header("Connection", "close")
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        if handler.command != "HEAD":
+            self._write(handler, body)
+
+    def _write(self, handler, body):
+        if not self._bandwidth:
+            handler.wfile.write(body)
+            return
+        # Send the body in 10 chunks per second.
+        chunk = max(int(self._bandwidth / 10), 1)
+        for start in range(0, len(body), chunk):
+            handler.wfile.write(body[start:start + chunk])
+            handler.wfile.flush()
+            time.sleep(len(body[start:start + chunk]) / self._bandwidth)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m redfish_client.mock_server",
+        description="Mock Redfish service for local load tests.",
+    )
+    parser.add_argument("--mockup", help="DMTF mockup directory to serve")
+    parser.add_argument(
+        "--systems", type=int, default=4,
+        help="number of systems in the generated service (without --mockup)",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--latency", type=float, default=0,
+        help="seconds to wait before each response",
+    )
+    parser.add_argument(
+        "--bandwidth", type=int, help="response bytes per second per connection",
+    )
+    parser.add_argument("--max-connections", type=int)
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument(
+        "--error-rate", type=float, default=0,
+        help="probability of a 503 response",
+    )
+    parser.add_argument("--username", default="user")
+    parser.add_argument("--password", default="pass")
+    parser.add_argument("--max-sessions", type=int)
+    parser.add_argument(
+        "--session-timeout", type=float,
+        help="seconds after which unused session tokens expire",
+    )
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    documents = None if args.mockup else generate_documents(args.systems)
+    server = MockServer(
+        documents=documents, mockup=args.mockup, host=args.host,
+        port=args.port, latency=args.latency, bandwidth=args.bandwidth,
+        max_connections=args.max_connections, retry_after=args.retry_after,
+        error_rate=args.error_rate, username=args.username,
+        password=args.password, max_sessions=args.max_sessions,
+        session_timeout=args.session_timeout, seed=args.seed,
+    )
+    print("Serving mock Redfish service at {}".format(server.url))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import abc
+import operator
+from urllib.parse import quote
+
+
+# Characters that Redfish query expressions use and services expect to see
+# unescaped, like in $expand=.($levels=2).
+SAFE_CHARS = "$().=,*~'/"
+
+
+def add_query(path, params):
+    """
+    Append query parameters to the path.
+
+    Args:
+      path: Path that may already contain a query.
+      params: Dictionary of query parameters, like {"$top": 10}.
+    """
+    if not params:
+        return path
+    query = "&".join(
+        "{}={}".format(k, quote(str(v), safe=SAFE_CHARS))
+        for k, v in params.items()
+    )
+    return "{}{}{}".format(path, "&" if "?" in path else "?", query)
+
+
+def expand_query(features, levels=1):
+    """
+    Return $expand value that expands subordinate resources or None if the
+    service does not support expansion.
+
+    Args:
+      features: ProtocolFeaturesSupported object of the service root.
+      levels: Number of levels to expand.
+    """
+    expand = (features or {}).get("ExpandQuery") or {}
+    if expand.get("NoLinks"):
+        value = "."
+    elif expand.get("ExpandAll"):
+        value = "*"
+    else:
+        return None
+
+    if not expand.get("Levels"):
+        return value
+    levels = min(levels, expand.get("MaxLevels", levels))
+    return "{}($levels={})".format(value, levels)
+
+
+def _literal(value):
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return "'{}'".format(str(value).replace("'", "''"))
+
+
+class Filter(abc.ABC):
+    """
+    Base class of $filter expressions.
+
+    Expressions are built with the comparison functions (eq, ne, gt, ge,
+    lt, le) and combined with & (and) and | (or). Properties of nested
+    objects are addressed with slash-separated paths, like Status/Health.
+    Expressions can be rendered as $filter values and also evaluated on
+    resource content, for services that do not support filtering.
+    """
+
+    def __and__(self, other):
+        return _Logical("and", self, other)
+
+    def __or__(self, other):
+        return _Logical("or", self, other)
+
+    def __str__(self):
+        return self.expression()
+
+    @abc.abstractmethod
+    def expression(self):
+        pass
+
+    @abc.abstractmethod
+    def matches(self, data):
+        pass
+
+
+class _Comparison(Filter):
+    OPERATORS = dict(
+        eq=operator.eq, ne=operator.ne, gt=operator.gt, ge=operator.ge,
+        lt=operator.lt, le=operator.le,
+    )
+
+    def __init__(self, op, prop, value):
+        self._op = op
+        self._prop = prop
+        self._value = value
+
+    def expression(self):
+        return "{} {} {}".format(self._prop, self._op, _literal(self._value))
+
+    def matches(self, data):
+        # Missing properties are null, like on the service side.
+        for key in self._prop.split("/"):
+            data = data.get(key) if isinstance(data, dict) else None
+        try:
+            return self.OPERATORS[self._op](data, self._value)
+        except TypeError:  # Ordering of incomparable values
+            return False
+
+
+class _Logical(Filter):
+    def __init__(self, op, left, right):
+        self._op = op
+        self._left = left
+        self._right = right
+
+    def expression(self):
+        return "({} {} {})".format(
+            self._left.expression(), self._op, self._right.expression(),
+        )
+
+    def matches(self, data):
+        if self._op == "and":
+            return self._left.matches(data) and self._right.matches(data)
+        return self._left.matches(data) or self._right.matches(data)
+
+
+def eq(prop, value):
+    return _Comparison("eq", prop, value)
+
+
+def ne(prop, value):
+    return _Comparison("ne", prop, value)
+
+
+def gt(prop, value):
+    return _Comparison("gt", prop, value)
+
+
+def ge(prop, value):
+    return _Comparison("ge", prop, value)
+
+
+def lt(prop, value):
+    return _Comparison("lt", prop, value)
+
+
+def le(prop, value):
+    return _Comparison("le", prop, value)
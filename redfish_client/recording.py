@@ -0,0 +1,253 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import base64
+import collections
+import gzip
+import io
+import json
+import logging
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from redfish_client.connector import Connector, PoolAdapter
+from redfish_client.wire_log import WireLogger
+
+
+logger = logging.getLogger("redfish-client")
+
+Exchange = collections.namedtuple(
+    "Exchange", "method url status headers body start elapsed",
+)
+
+
+def _open(path, mode):
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _target(url):
+    # Recordings are matched on path and query, so that they can be
+    # replayed against any base URL.
+    url = urlparse(url)
+    return url.path + ("?" + url.query if url.query else "")
+
+
+def _dump(exchange):
+    record = exchange._asdict()
+    try:
+        record["body"] = exchange.body.decode("utf-8")
+    except UnicodeDecodeError:
+        del record["body"]
+        record["body_base64"] = base64.b64encode(exchange.body).decode("ascii")
+    return json.dumps(record, separators=(",", ":"))
+
+
+def _load(line):
+    record = json.loads(line)
+    if "body_base64" in record:
+        record["body"] = base64.b64decode(record.pop("body_base64"))
+    else:
+        record["body"] = record["body"].encode("utf-8")
+    return Exchange(**record)
+
+
+def load_recording(source):
+    """
+    Load exchanges from a recording file (JSON Lines, optionally gzip
+    compressed if the file name ends with .gz) or a text file object.
+    """
+    if hasattr(source, "read"):
+        return [_load(line) for line in source if line.strip()]
+    with _open(source, "r") as f:
+        return load_recording(f)
+
+
+class RecordingAdapter(PoolAdapter):
+    """
+    Connection pool adapter that records requests and responses.
+
+    Each exchange (method, URL, response status, headers and body, start
+    time relative to the start of the recording and time it took) is
+    appended to the output as one JSON line. Request bodies are not
+    recorded and authentication headers of responses are redacted, so
+    recordings do not contain credentials. Streaming responses (event
+    streams) are passed through without being recorded.
+
+    The adapter is thread-safe. Pass it to the connector (any connector
+    class accepts the adapter argument) to record its traffic.
+    """
+
+    def __init__(self, output, **kwargs):
+        """
+        Args:
+          output: Path of the recording file (gzip compressed if it ends
+            with .gz) or a writable text file object.
+        """
+        super().__init__(**kwargs)
+        if hasattr(output, "write"):
+            self._output, self._owned = output, False
+        else:
+            self._output, self._owned = _open(output, "w"), True
+        self._lock = threading.Lock()
+        self._origin = time.monotonic()
+
+    def send(self, request, *args, **kwargs):  # pylint: disable=arguments-differ
+        start = time.monotonic()
+        resp = super().send(request, *args, **kwargs)
+        if kwargs.get("stream"):
+            return resp
+
+        body = resp.content
+        elapsed = time.monotonic() - start
+        headers = {
+            k: WireLogger.REDACTED
+            if k.lower() in WireLogger.SENSITIVE_HEADERS else v
+            for k, v in resp.headers.items()
+        }
+        self.record(Exchange(
+            request.method, request.url, resp.status_code, headers, body,
+            round(start - self._origin, 6), round(elapsed, 6),
+        ))
+        return resp
+
+    def record(self, exchange):
+        line = _dump(exchange)
+        with self._lock:
+            self._output.write(line)
+            self._output.write("\n")
+            self._output.flush()
+
+    def close(self):
+        super().close()
+        with self._lock:
+            if self._owned and not self._output.closed:
+                self._output.close()
+
+
+class ReplayAdapter(PoolAdapter):
+    """
+    Connection pool adapter that serves recorded responses.
+
+    Requests are matched on method, path and query. Repeated requests for
+    the same target get the recorded responses in the recorded order, and
+    the last one once the recorded ones run out. Requests that were not
+    recorded get a 404 response.
+
+    Responses are served immediately by default. Set latency to 1 to
+    replay the recorded response times, or to any other factor to scale
+    them (for example, 0.5 replays the traffic twice as fast).
+    """
+
+    def __init__(self, recording, latency=0, **kwargs):
+        """
+        Args:
+          recording: Recording (anything that load_recording accepts) or
+            a list of exchanges.
+          latency: Factor that recorded response times are multiplied by.
+        """
+        super().__init__(**kwargs)
+        if not isinstance(recording, list):
+            recording = load_recording(recording)
+        self.exchanges = recording
+        self._latency = latency
+        self._responses = collections.defaultdict(collections.deque)
+        for exchange in recording:
+            key = (exchange.method, _target(exchange.url))
+            self._responses[key].append(exchange)
+        self._lock = threading.Lock()
+
+    def _next(self, method, target):
+        with self._lock:
+            responses = self._responses.get((method, target))
+            if not responses:
+                return None
+            if len(responses) > 1:
+                return responses.popleft()
+            return responses[0]
+
+    def send(self, request, *args, **kwargs):  # pylint: disable=arguments-differ
+        self._count(self._requests, urlparse(request.url).hostname)
+        exchange = self._next(request.method, _target(request.url))
+        if exchange is None:
+            logger.warning("No recorded response for {} {}".format(
+                request.method, request.url,
+            ))
+            exchange = Exchange(
+                request.method, request.url, 404, {}, b"", 0, 0,
+            )
+        elif self._latency:
+            time.sleep(exchange.elapsed * self._latency)
+
+        resp = requests.Response()
+        resp.status_code = exchange.status
+        resp.headers = CaseInsensitiveDict(exchange.headers)
+        resp._content = exchange.body
+        # Streaming requests (like event streams) read the body from raw.
+        resp.raw = io.BytesIO(exchange.body)
+        resp.encoding = "utf-8"
+        resp.url = request.url
+        resp.request = request
+        resp.connection = self
+        return resp
+
+
+class RecordingConnector(Connector):
+    """ Connector that records its traffic (see RecordingAdapter) """
+
+    def __init__(self, *args, output, **kwargs):
+        pool = {
+            k: kwargs.pop(k)
+            for k in ("pool_connections", "pool_maxsize", "pool_block")
+            if k in kwargs
+        }
+        kwargs["adapter"] = RecordingAdapter(output, **pool)
+        super().__init__(*args, **kwargs)
+
+    def close(self):
+        """ Close the connections and the recording file """
+        self._client.close()
+
+
+class ReplayConnector(Connector):
+    """
+    Connector that serves responses from a recording (see ReplayAdapter)
+    instead of talking to a service.
+
+    Recordings include the login requests, so the client logs in as it
+    did while recording. To replay traffic through the caching connector,
+    pass ReplayAdapter to it as the adapter argument.
+    """
+
+    def __init__(self, recording, latency=0, base_url=None, username="",
+                 password="", **kwargs):
+        """
+        Args:
+          recording: Recording (anything that load_recording accepts) or
+            a list of exchanges.
+          latency: Factor that recorded response times are multiplied by.
+          base_url: Base URL of the service. Defaults to the one used in
+            the first recorded request.
+        """
+        adapter = ReplayAdapter(recording, latency=latency)
+        if base_url is None:
+            url = urlparse(adapter.exchanges[0].url if adapter.exchanges else "")
+            base_url = "{}://{}".format(url.scheme or "https", url.netloc)
+        kwargs["adapter"] = adapter
+        super().__init__(base_url, username, password, **kwargs)
@@ -12,9 +12,12 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import collections
 import operator
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import reduce
+from urllib.parse import urlparse
 
 from redfish_client.exceptions import (
     BlacklistedValueException,
@@ -22,9 +25,12 @@ from redfish_client.exceptions import (
     MissingOidException,
     ResourceNotFound
 )
+from redfish_client.query import add_query, expand_query
 
 
 class Resource:
+    DEFAULT_PREFETCH_WORKERS = 8
+
     @staticmethod
     def _parse_fragment_string(fragment):
         if fragment:
@@ -46,6 +52,14 @@ class Resource:
         self._connector = connector
         self._is_lazy = lazy
         self._is_stub = lazy
+        # Content of expanded resources contains subordinate resources
+        # inline, so we do not need to fetch them.
+        self._is_expanded = False
+        # Content of partial resources only holds selected properties.
+        self._is_partial = False
+        # Built children (see _child) and the content they were built from.
+        self._children = {}
+        self._children_of = None
         if oid:
             if self._is_lazy:
                 self._headers, self._content = {}, {"@odata.id": oid}
@@ -80,12 +94,30 @@ class Resource:
             return [self._build(i) for i in data]
         return data
 
+    def _is_link(self, data):
+        # Links point to other resources, while inline objects (and members
+        # of expanded collections) are part of this resource's content.
+        return "@odata.id" in data and not (self._is_expanded and len(data) > 1)
+
     def _build_from_hash(self, data):
-        if "@odata.id" in data:
+        if self._is_link(data):
             return Resource(
                 self._connector, oid=data["@odata.id"], lazy=self._is_lazy
             )
-        return Resource(self._connector, data=data, lazy=self._is_lazy)
+        return self._build_inline(data)
+
+    def _build_inline(self, data):
+        resource = Resource(self._connector, data=data, lazy=self._is_lazy)
+        resource._is_stub = False
+        resource._is_expanded = self._is_expanded
+        return resource
+
+    def _build_partial(self, data):
+        # Properties that came along with the link are served as they are,
+        # any other property loads the whole resource.
+        resource = Resource(self._connector, data=data, lazy=self._is_lazy)
+        resource._is_partial = True
+        return resource
 
     def refresh(self):
         try:
@@ -93,14 +125,26 @@ class Resource:
         except KeyError:
             raise MissingOidException("Cannot refresh resource without @odata.id")
 
-        self._connector.reset(oid)
+        self._connector.expire(oid.split("#", 1)[0])
+        self._children, self._children_of = {}, None
+        self._is_expanded = self._is_partial = False
 
         if self._is_lazy:
-            self._headers, self._content = {}, {"@odata.id": oid}
-            self._is_stub = True
+            self._unload(oid)
         else:
             self._headers, self._content = self._init_from_oid(oid)
 
+    def _unload(self, oid):
+        # Turns the resource back into a stub that loads on next access.
+        self._headers, self._content = {}, {"@odata.id": oid}
+        self._is_stub = True
+        self._is_expanded = self._is_partial = False
+
+    def _modified(self, path):
+        # Requests that change the resource make its loaded content stale.
+        if self._is_lazy and path == self._content.get("@odata.id"):
+            self._unload(path)
+
     def __getattr__(self, name):
         try:
             return self[name]
@@ -108,17 +152,33 @@ class Resource:
             raise AttributeError(f"Redfish Resource does not have attribute '{name}'")
 
     def __getitem__(self, name):
-        if name in self._content:
-            return self._build(self._content[name])
-        return self._build(self._get_content()[name])
+        if name not in self._content:
+            self._get_content()
+        return self._child(name)
+
+    def _child(self, name):
+        # Children are built once per content, so that repeated access is
+        # cheap and returns the same objects (linked resources included,
+        # which keep their content once loaded). Anything that replaces the
+        # content (loading, refresh, expand, ...) invalidates them.
+        content = self._content
+        if self._children_of is not content:
+            self._children, self._children_of = {}, content
+        try:
+            return self._children[name]
+        except KeyError:
+            pass
+        child = self._children[name] = self._build(content[name])
+        return child
 
     def __contains__(self, item):
-        return item in self._get_content()
+        return item in self._content or item in self._get_content()
 
     def _get_content(self):
         oid = self._content.get("@odata.id")
-        if oid and self._is_lazy and self._is_stub:
+        if oid and (self._is_partial or self._is_lazy and self._is_stub):
             self._headers, self._content = self._init_from_oid(oid)
+            self._is_partial = False
         return self._content
 
     def dig(self, *keys):
@@ -130,6 +190,306 @@ class Resource:
                 return None
         return resource
 
+    def _resolve(self, path):
+        # Members/0/Status -> self["Members"][0]["Status"]
+        value = self
+        for component in self._parse_fragment_string(path):
+            if isinstance(value, list):
+                value = value[int(component)]
+            else:
+                value = value[component]
+        return value
+
+    def prefetch(self, *paths, max_workers=DEFAULT_PREFETCH_WORKERS,
+                 select=None):
+        """
+        Concurrently load resources that are referenced from this resource.
+
+        Args:
+          paths: Slash-separated paths of keys that point to a resource or
+            a list of resources (Members if no path is given).
+          max_workers: Maximum number of requests that are in flight.
+          select: Names of properties to load (see the select method)
+            instead of loading whole resources.
+
+        Returns:
+          List of loaded resources in the order of their appearance. These
+          are the same objects that later access through this resource
+          returns, so they are not loaded again.
+        """
+        resources = []
+        for path in paths or ("Members",):
+            value = self._resolve(path)
+            resources.extend(value if isinstance(value, list) else [value])
+
+        return self._load_all(resources, max_workers, select)
+
+    @staticmethod
+    def _load_all(resources, max_workers, select=None):
+        stubs = [
+            r for r in resources
+            if isinstance(r, Resource) and r._is_lazy and r._is_stub
+        ]
+        if stubs:
+            if select:
+                def load(resource):
+                    return resource.select(*select)
+            else:
+                load = Resource._get_content
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Consume the results in order to propagate exceptions.
+                list(executor.map(load, stubs))
+        return resources
+
+    def _get_page(self, path):
+        resp = self._connector.get(path, cache=False)
+        if resp.status != 200:
+            raise ResourceNotFound(resp.raw)
+        return resp.json
+
+    @staticmethod
+    def _page_path(link):
+        # Next links can be absolute URLs.
+        url = urlparse(link)
+        return url.path + ("?" + url.query if url.query else "")
+
+    def iter_members(self, read_ahead=1, until=None, page_size=None):
+        """
+        Iterate over members of a paginated collection.
+
+        Pages are fetched lazily (following Members@odata.nextLink or, if
+        the service only reports Members@odata.count, using $skip) while
+        at most read_ahead pages are fetched in the background. Only pages
+        that are being consumed or read ahead are kept in memory, and they
+        bypass the cache of the caching connector. Properties of members
+        that the service returns inline (like log entries often are) are
+        available without fetching the members again, while access to any
+        other property loads the whole member (unless the collection was
+        expanded).
+
+        Args:
+          read_ahead: Number of pages to fetch ahead. 0 fetches pages only
+            when they are needed.
+          until: Predicate that stops the iteration at the first member
+            for which it returns True. That member is not yielded.
+          page_size: Number of members per page ($top). Uses the page size
+            of the service if None.
+        """
+        oid = self._content.get("@odata.id")
+        if not oid:
+            raise MissingOidException(
+                "Cannot iterate over pages of resource without @odata.id"
+            )
+        url = oid.split("#", 1)[0]
+
+        executor = read_ahead and ThreadPoolExecutor(max_workers=read_ahead)
+        # Futures of pages that are read ahead or paths of pages that will
+        # be fetched when needed.
+        pending = collections.deque()
+        skip_paths = None
+
+        def schedule(path):
+            if executor:
+                pending.append(executor.submit(self._get_page, path))
+            else:
+                pending.append(path)
+
+        def next_page():
+            item = pending.popleft()
+            if isinstance(item, Future):
+                return item.result()
+            return self._get_page(item)
+
+        if page_size is None:
+            page = self._get_content()
+        else:
+            page = self._get_page(add_query(url, {"$top": page_size}))
+        offset = 0
+        try:
+            while page is not None:
+                members = page.get("Members", [])
+                offset += len(members)
+                if not pending and skip_paths is None:
+                    next_link = page.get("Members@odata.nextLink")
+                    count = page.get("Members@odata.count", 0)
+                    if next_link:
+                        schedule(self._page_path(next_link))
+                    elif members and count > offset:
+                        step = page_size or len(members)
+                        skip_paths = iter([
+                            add_query(url, {"$skip": skip, "$top": step})
+                            for skip in range(offset, count, step)
+                        ])
+                while skip_paths and len(pending) < max(read_ahead, 1):
+                    path = next(skip_paths, None)
+                    if path is None:
+                        break
+                    schedule(path)
+
+                for member in members:
+                    # Services may inline only some properties of members.
+                    partial = (
+                        isinstance(member, dict) and self._is_link(member) and
+                        len(member) > 1
+                    )
+                    if partial:
+                        resource = self._build_partial(member)
+                    else:
+                        resource = self._build(member)
+                    if until and until(resource):
+                        return
+                    yield resource
+
+                page = next_page() if pending else None
+        finally:
+            for item in pending:
+                if isinstance(item, Future):
+                    item.cancel()
+            if executor:
+                executor.shutdown(wait=True)
+
+    def filter(self, expression, max_workers=DEFAULT_PREFETCH_WORKERS):
+        """
+        Return members of the collection that match the expression.
+
+        Services that support the $filter query do the filtering, so only
+        matching members are transferred. Otherwise, all members (of all
+        pages) are loaded concurrently and filtered on the client.
+
+        Args:
+          expression: Filter expression built with the functions from the
+            redfish_client.query module, like eq("Status/Health", "OK").
+          max_workers: Maximum number of requests that are in flight when
+            loading members.
+
+        Returns:
+          List of matching members.
+        """
+        oid = self._content.get("@odata.id")
+        if not oid:
+            raise MissingOidException(
+                "Cannot filter resource without @odata.id"
+            )
+        url = oid.split("#", 1)[0]
+
+        if self._connector.protocol_features.get("FilterQuery"):
+            path = add_query(url, {"$filter": expression.expression()})
+            try:
+                # Results change over time, so they bypass the cache like
+                # the pages of iter_members do.
+                page = dict(self._get_page(path), **{"@odata.id": path})
+                return list(self._build_inline(page).iter_members())
+            except ResourceNotFound:
+                pass  # Service rejected the expression
+
+        members = self._load_all(list(self.iter_members()), max_workers)
+        return [
+            m for m in members
+            if expression.matches(m.raw if isinstance(m, Resource) else m)
+        ]
+
+    def expand(self, levels=1):
+        """
+        Load the resource together with its subordinate resources.
+
+        Services that support the $expand query return the resource with
+        subordinate resources (like members of a collection) inline in a
+        single response. Inline resources are also stored in the cache of
+        the caching connector. If the service does not support expansion,
+        members of collections are prefetched instead.
+
+        Args:
+          levels: Number of levels of subordinate resources to expand.
+
+        Returns:
+          The resource itself.
+        """
+        oid = self._content.get("@odata.id")
+        if not oid:
+            raise MissingOidException("Cannot expand resource without @odata.id")
+
+        url, _, fragment = oid.partition("#")
+        query = expand_query(self._connector.protocol_features, levels)
+        resp = None
+        if query:
+            # Expanded responses are not cached as a whole (invalidations
+            # and refresh only know about plain paths), but their inline
+            # resources are seeded into the cache below.
+            resp = self._connector.get(
+                add_query(url, {"$expand": query}), cache=False,
+            )
+        if resp is None or resp.status != 200:
+            if "Members" in self:
+                self.prefetch("Members")
+            return self
+
+        self._seed(resp.json, top=True)
+        self._headers = resp.headers
+        self._content = self._get_fragment(resp.json, fragment)
+        self._is_stub = False
+        self._is_expanded = True
+        return self
+
+    def select(self, *properties):
+        """
+        Load only the selected top-level properties of the resource.
+
+        Services that support the $select query only return the selected
+        properties, which saves bandwidth and parsing of large resources.
+        Such partial resources load the whole content on first access to
+        any other property. If the service does not support selection, the
+        whole resource is loaded. Resources that are already loaded are
+        left as they are.
+
+        Args:
+          properties: Names of properties to load.
+
+        Returns:
+          The resource itself.
+        """
+        if any("/" in p for p in properties):
+            raise ValueError("Only top-level properties can be selected")
+
+        oid = self._content.get("@odata.id")
+        if not oid:
+            raise MissingOidException(
+                "Cannot select from resource without @odata.id"
+            )
+        if not (self._is_lazy and self._is_stub) or self._is_partial:
+            return self
+
+        url, _, fragment = oid.partition("#")
+        resp = None
+        features = self._connector.protocol_features
+        if properties and not fragment and features.get("SelectQuery"):
+            # Projections are not cached, since invalidations and refresh
+            # only know about whole resources.
+            resp = self._connector.get(
+                add_query(url, {"$select": ",".join(properties)}), cache=False,
+            )
+        if resp is None or resp.status != 200 or not isinstance(resp.json, dict):
+            self._get_content()
+            return self
+
+        self._headers = resp.headers
+        self._content = dict(resp.json, **{"@odata.id": oid})
+        self._is_partial = True
+        return self
+
+    def _seed(self, data, top=False):
+        # Fragment ids (like /Thermal#/Fans/0) are parts of resources.
+        if isinstance(data, dict):
+            oid = data.get("@odata.id")
+            if not top and oid and "#" not in oid and len(data) > 1:
+                self._connector.seed(oid, data)
+            values = data.values()
+        elif isinstance(data, list):
+            values = data
+        else:
+            return
+        for value in values:
+            self._seed(value)
+
     def find_object(self, key):
         """ Recursively search for a key and return key's content """
         if key in self._get_content().keys():
@@ -211,7 +571,9 @@ class Resource:
         path = self._content.get("@odata.id")
         if not path:
             raise MissingOidException("The resource cannot be POSTed to.")
-        return self._connector.post(path, payload=payload, headers=headers)
+        resp = self._connector.post(path, payload=payload, headers=headers)
+        self._modified(path)
+        return resp
 
     def patch(self, payload, headers=None):
         """
@@ -223,7 +585,9 @@ class Resource:
         path = self._content.get("@odata.id")
         if not path:
             raise MissingOidException("The resource cannot be PATCHed.")
-        return self._connector.patch(path, payload=payload, headers=headers)
+        resp = self._connector.patch(path, payload=payload, headers=headers)
+        self._modified(path)
+        return resp
 
     def put(self, path=None, payload=None, headers=None):
         """
@@ -237,7 +601,9 @@ class Resource:
         path = self._get_path(field, path)
         if not path:
             raise MissingOidException("The resource cannot be PUT.")
-        return self._connector.put(path, payload=payload, headers=headers)
+        resp = self._connector.put(path, payload=payload, headers=headers)
+        self._modified(path)
+        return resp
 
     def delete(self, headers=None):
         """
@@ -246,4 +612,6 @@ class Resource:
         path = self._content.get("@odata.id")
         if not path:
             raise MissingOidException("The resource cannot be DELETEd.")
-        return self._connector.delete(path, headers=headers)
+        resp = self._connector.delete(path, headers=headers)
+        self._modified(path)
+        return resp
@@ -22,6 +22,9 @@ class Root(Resource):
         authenticated_path = next(
             i["@odata.id"] for i in content.values() if "@odata.id" in i
         )
+        self._connector.set_protocol_features(
+            content.get("ProtocolFeaturesSupported"),
+        )
         if "@odata.id" in sessions:
             self._connector.set_session_auth_data(sessions["@odata.id"])
         else:
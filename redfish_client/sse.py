@@ -0,0 +1,233 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+import collections
+import logging
+import time
+from urllib.parse import urlparse
+
+from redfish_client.codec import get_codec
+from redfish_client.exceptions import (
+    InaccessibleException,
+    ResourceNotFound,
+    TimedOutException,
+)
+from redfish_client.query import add_query
+
+
+logger = logging.getLogger("redfish-client")
+
+ServerSentEvent = collections.namedtuple(
+    "ServerSentEvent", "id event data retry",
+)
+
+EVENT_SERVICE = "/redfish/v1/EventService"
+
+
+class EventParser:
+    """
+    Incremental parser of the text/event-stream format.
+
+    Feed it lines without line endings. Events are returned once the blank
+    line that terminates them arrives. The id of the last event is kept
+    across events, as the specification requires.
+    """
+
+    def __init__(self):
+        self.last_id = None
+        self._event = None
+        self._data = []
+        self._retry = None
+
+    def feed(self, line):
+        if isinstance(line, bytes):
+            line = line.decode("utf-8", "replace")
+
+        if not line:
+            return self._dispatch()
+        if line.startswith(":"):  # Comment (keep-alive)
+            return None
+
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "data":
+            self._data.append(value)
+        elif field == "event":
+            self._event = value
+        elif field == "id" and "\0" not in value:
+            self.last_id = value
+        elif field == "retry" and value.isdigit():
+            self._retry = int(value)
+        return None
+
+    def _dispatch(self):
+        data, event, retry = self._data, self._event, self._retry
+        self._data, self._event, self._retry = [], None, None
+        if not data:
+            return None
+        return ServerSentEvent(self.last_id, event, "\n".join(data), retry)
+
+
+def parse_events(lines):
+    """ Parse an iterable of lines into ServerSentEvent objects """
+    parser = EventParser()
+    for line in lines:
+        event = parser.feed(line)
+        if event:
+            yield event
+
+
+class _BaseEventStream:
+    RECONNECT_DELAY = 1  # In seconds
+
+    def __init__(self, connector, path=None, event_filter=None,
+                 last_event_id=None, reconnect_delay=RECONNECT_DELAY,
+                 max_reconnects=None, read_timeout=None, codec=None):
+        """
+        Args:
+          connector: Connector of the service.
+          path: Path of the stream. Defaults to the ServerSentEventUri of
+            the EventService.
+          event_filter: Value of the $filter query parameter, for example
+            "EventFormatType eq MetricReport".
+          last_event_id: Id of the last event that was already processed.
+          reconnect_delay: Number of seconds to wait before reconnecting.
+            Services can override it with the retry field.
+          max_reconnects: Maximum number of reconnects in a row without
+            receiving an event. Reconnects forever if None.
+          read_timeout: Number of seconds without data after which the
+            connection is considered dead.
+          codec: Codec (see redfish_client.codec) for decoding events.
+        """
+        self._connector = connector
+        self._path = path
+        self._filter = event_filter
+        self.last_event_id = last_event_id
+        self._delay = reconnect_delay
+        self._max_reconnects = max_reconnects
+        self._read_timeout = read_timeout
+        self._codec = get_codec(codec)
+
+    @staticmethod
+    def _stream_path(event_service):
+        if event_service.status == 200 and isinstance(event_service.json, dict):
+            path = event_service.json.get("ServerSentEventUri")
+            if path:
+                return urlparse(path).path
+        raise ResourceNotFound("Service does not support Server-Sent Events")
+
+    def _filtered_path(self):
+        if not self._filter:
+            return self._path
+        return add_query(self._path, {"$filter": self._filter})
+
+    def _headers(self):
+        headers = {"Accept": "text/event-stream"}
+        if self.last_event_id is not None:
+            headers["Last-Event-ID"] = self.last_event_id
+        return headers
+
+    def _process(self, parser, line):
+        event = parser.feed(line)
+        if event is None:
+            return None
+        self.last_event_id = event.id
+        if event.retry is not None:
+            self._delay = event.retry / 1000
+        try:
+            return self._codec.loads(event.data.encode("utf-8"))
+        except ValueError:
+            logger.error("Skipping invalid event data: {}".format(event.data))
+            return None
+
+    def _reconnect(self, reconnects, error):
+        if self._max_reconnects is not None and reconnects > self._max_reconnects:
+            raise error or InaccessibleException(
+                "Stream at {} keeps closing".format(self._path)
+            )
+        logger.warning("Event stream closed ({}), reconnecting".format(
+            error or "end of stream"
+        ))
+
+
+class EventStream(_BaseEventStream):
+    """
+    Reader of the Server-Sent Events stream of the EventService.
+
+    Iterating over the stream yields parsed events and metric reports. The
+    stream reuses the connector's authentication, reconnects when the
+    connection drops, and resumes from the last received event using the
+    Last-Event-ID header. Break out of the loop to close the stream.
+    """
+
+    def __iter__(self):
+        if self._path is None:
+            self._path = self._stream_path(self._connector.get(EVENT_SERVICE))
+        path = self._filtered_path()
+
+        reconnects = 0
+        while True:
+            parser, error = EventParser(), None
+            parser.last_id = self.last_event_id
+            try:
+                for line in self._connector.stream(
+                        path, headers=self._headers(),
+                        read_timeout=self._read_timeout,
+                ):
+                    data = self._process(parser, line)
+                    if data is not None:
+                        reconnects = 0
+                        yield data
+            except (InaccessibleException, TimedOutException) as e:
+                error = e
+
+            reconnects += 1
+            self._reconnect(reconnects, error)
+            time.sleep(self._delay)
+
+
+class AsyncEventStream(_BaseEventStream):
+    """ Async counterpart of the EventStream for use with AsyncConnector """
+
+    def __aiter__(self):
+        return self._events()
+
+    async def _events(self):
+        if self._path is None:
+            self._path = self._stream_path(
+                await self._connector.get(EVENT_SERVICE)
+            )
+        path = self._filtered_path()
+
+        reconnects = 0
+        while True:
+            parser, error = EventParser(), None
+            parser.last_id = self.last_event_id
+            try:
+                async for line in self._connector.stream(
+                        path, headers=self._headers(),
+                        read_timeout=self._read_timeout,
+                ):
+                    data = self._process(parser, line)
+                    if data is not None:
+                        reconnects = 0
+                        yield data
+            except (InaccessibleException, TimedOutException) as e:
+                error = e
+
+            reconnects += 1
+            self._reconnect(reconnects, error)
+            await asyncio.sleep(self._delay)
@@ -0,0 +1,127 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import itertools
+import json
+import logging
+
+
+class WireLogger:
+    """
+    Debug logger for requests and responses that go over the wire.
+
+    Nothing is serialized unless the logger is enabled for the DEBUG level.
+    Response bodies are truncated to max_body bytes (their parsed form is
+    only logged for bodies that fit), passwords and authentication headers
+    are redacted, and only every sample_rate-th request is logged.
+    """
+    DEFAULT_MAX_BODY = 4096  # In bytes
+    REDACTED = "***"
+    SENSITIVE_HEADERS = frozenset(("authorization", "x-auth-token"))
+    SENSITIVE_FIELDS = frozenset(("Password",))
+
+    def __init__(self, logger=None, max_body=DEFAULT_MAX_BODY, sample_rate=1,
+                 redact=True):
+        self._logger = logger or logging.getLogger("redfish-client")
+        self._max_body = max_body
+        self._sample_rate = max(sample_rate, 1)
+        self._redact = redact
+        self._counter = itertools.count()
+
+    def sample(self):
+        """ Decide whether the next request and its response get logged """
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return False
+        return next(self._counter) % self._sample_rate == 0
+
+    def _redact_headers(self, headers):
+        if not headers or not self._redact:
+            return headers
+        return {
+            k: self.REDACTED if k.lower() in self.SENSITIVE_HEADERS else v
+            for k, v in headers.items()
+        }
+
+    def _redact_data(self, data):
+        if not self._redact:
+            return data
+        if isinstance(data, dict):
+            return {
+                k: self.REDACTED if k in self.SENSITIVE_FIELDS else self._redact_data(v)
+                for k, v in data.items()
+            }
+        if isinstance(data, list):
+            return [self._redact_data(i) for i in data]
+        return data
+
+    def _emit(self, record):
+        try:
+            self._logger.debug(json.dumps(record))
+        except Exception as e:
+            self._logger.error(e)
+
+    def log_request(self, base_url, method, path, payload, headers):
+        self._emit(dict(
+            request=dict(
+                method=method,
+                base_url=base_url,
+                path=path,
+                payload=self._redact_data(payload),
+                headers=self._redact_headers(headers),
+            )
+        ))
+
+    def _is_sensitive(self, raw):
+        return self._redact and any(
+            '"{}"'.format(field).encode("utf-8") in raw
+            for field in self.SENSITIVE_FIELDS
+        )
+
+    def log_response(self, base_url, method, path, response):
+        content = response.raw
+        json_data = None
+        if self._is_sensitive(content):
+            # The raw body would leak what the parsed form hides, so it is
+            # replaced with the redacted form before it gets truncated.
+            json_data = self._redact_data(response.json)
+            if json_data is None:
+                content = self.REDACTED.encode("utf-8")
+            else:
+                content = json.dumps(json_data).encode("utf-8")
+
+        if len(content) > self._max_body:
+            # Do not parse (or dump) bodies that we would only truncate.
+            content = "{}... ({} bytes truncated)".format(
+                content[:self._max_body], len(content) - self._max_body,
+            )
+            json_data = None
+        else:
+            content = str(content)
+            if json_data is None:
+                json_data = self._redact_data(response.json)
+        headers = {k.lower(): v for k, v in response.headers.items()}
+
+        self._emit(dict(
+            request_data=dict(
+                method=method,
+                base_url=base_url,
+                path=path
+            ),
+            response=dict(
+                status_code=response.status,
+                headers=self._redact_headers(headers),
+                content=content,
+                json_data=json_data
+            )
+        ))
@@ -0,0 +1,363 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import asyncio
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+
+import redfish_client  # noqa: E402
+from redfish_client.async_connector import AsyncConnector  # noqa: E402
+from redfish_client.async_resource import AsyncResource  # noqa: E402
+from redfish_client.exceptions import (  # noqa: E402
+    AuthException, InaccessibleException, ResourceNotLoaded,
+)
+from redfish_client.instrumentation import Instrument, MetricsCollector  # noqa: E402
+from redfish_client.sse import AsyncEventStream  # noqa: E402
+
+
+def run_with_server(routes, test):
+    # Start a throw-away aiohttp server, run the test coroutine against it
+    # and tear everything down afterwards.
+    async def runner():
+        app = web.Application()
+        app.add_routes(routes)
+        app_runner = web.AppRunner(app)
+        await app_runner.setup()
+        site = web.TCPSite(app_runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            return await test("http://127.0.0.1:{}".format(port))
+        finally:
+            await app_runner.cleanup()
+
+    return asyncio.run(runner())
+
+
+def service_routes(calls, token="abc"):
+    async def root(_request):
+        return web.json_response({
+            "@odata.id": "/redfish/v1",
+            "Systems": {"@odata.id": "/redfish/v1/Systems"},
+            "Links": {"Sessions": {"@odata.id": "/redfish/v1/Sessions"}},
+        })
+
+    async def sessions(request):
+        data = await request.json()
+        calls.append(("login", data["UserName"]))
+        if data["Password"] != "pass":
+            return web.Response(status=401, text="Invalid")
+        return web.json_response(
+            {"@odata.id": "/redfish/v1/Sessions/1"}, status=201,
+            headers={"X-Auth-Token": token},
+        )
+
+    async def systems(request):
+        calls.append(("systems", request.headers.get("X-Auth-Token")))
+        if request.headers.get("X-Auth-Token") != token:
+            return web.Response(status=401)
+        return web.json_response({
+            "@odata.id": "/redfish/v1/Systems",
+            "Members": [{"@odata.id": "/redfish/v1/Systems/1"}],
+        })
+
+    async def system(request):
+        if request.headers.get("X-Auth-Token") != token:
+            return web.Response(status=401)
+        return web.json_response({
+            "@odata.id": "/redfish/v1/Systems/1",
+            "PowerState": "On",
+            "Status": {"Health": "OK"},
+        })
+
+    return [
+        web.get("/redfish/v1", root),
+        web.post("/redfish/v1/Sessions", sessions),
+        web.get("/redfish/v1/Systems", systems),
+        web.get("/redfish/v1/Systems/1", system),
+    ]
+
+
+class TestInit:
+    def test_header_copy(self):
+        c1 = AsyncConnector("", "", "")
+        c1._set_header("a", "b")
+        c2 = AsyncConnector("", "", "")
+        assert c1._headers != c2._headers
+
+    def test_inaccessible_url(self):
+        async def test():
+            async with AsyncConnector("http://127.0.0.1:1", "u", "p") as conn:
+                await conn.get("/data")
+
+        with pytest.raises(InaccessibleException):
+            asyncio.run(test())
+
+
+class TestLogin:
+    def test_basic_login(self):
+        async def auth(request):
+            if request.headers.get("Authorization") != "Basic dXNlcjpwYXNz":
+                return web.Response(status=401)
+            return web.json_response({})
+
+        async def test(url):
+            async with AsyncConnector(url, "user", "pass") as conn:
+                conn.set_basic_auth_data("/auth")
+                await conn.login()
+                return conn._headers["authorization"]
+
+        assert run_with_server(
+            [web.get("/auth", auth)], test,
+        ) == "Basic dXNlcjpwYXNz"
+
+    def test_basic_login_invalid_credentials(self):
+        async def auth(_request):
+            return web.Response(status=401)
+
+        async def test(url):
+            async with AsyncConnector(url, "user", "bad") as conn:
+                conn.set_basic_auth_data("/auth")
+                await conn.login()
+
+        with pytest.raises(AuthException):
+            run_with_server([web.get("/auth", auth)], test)
+
+    def test_session_login(self):
+        calls = []
+
+        async def test(url):
+            async with AsyncConnector(url, "user", "pass") as conn:
+                conn.set_session_auth_data("/redfish/v1/Sessions")
+                await conn.login()
+                return conn.session_auth_data
+
+        assert run_with_server(service_routes(calls), test) == (
+            "/redfish/v1/Sessions", "/redfish/v1/Sessions/1", "abc",
+        )
+
+    def test_session_login_invalid_credentials(self):
+        async def test(url):
+            async with AsyncConnector(url, "user", "bad") as conn:
+                conn.set_session_auth_data("/redfish/v1/Sessions")
+                await conn.login()
+
+        with pytest.raises(AuthException):
+            run_with_server(service_routes([]), test)
+
+
+class TestRequests:
+    def test_get_session_relogin(self):
+        calls = []
+
+        async def test(url):
+            async with AsyncConnector(url, "user", "pass") as conn:
+                conn.set_session_auth_data("/redfish/v1/Sessions", token="old")
+                return await conn.get("/redfish/v1/Systems")
+
+        r = run_with_server(service_routes(calls), test)
+        assert r.status == 200
+        assert r.json["Members"] == [{"@odata.id": "/redfish/v1/Systems/1"}]
+        assert calls == [
+            ("systems", "old"), ("login", "user"), ("systems", "abc"),
+        ]
+
+    def test_instruments(self):
+        events = []
+
+        class Recorder(Instrument):
+            def after_request(self, event):
+                events.append(event)
+
+        collector = MetricsCollector()
+
+        async def test(url):
+            async with AsyncConnector(
+                    url, "user", "pass", instruments=[Recorder(), collector],
+            ) as conn:
+                conn.set_session_auth_data("/redfish/v1/Sessions", token="old")
+                await conn.get("/redfish/v1/Systems")
+
+        run_with_server(service_routes([]), test)
+        assert [(e.method, e.path, e.status, e.relogin) for e in events] == [
+            ("GET", "/redfish/v1/Systems", 200, True),
+        ]
+        assert events[0].size > 0
+        stats = collector.snapshot()["paths"]["GET /redfish/v1/Systems"]
+        assert stats["latency"]["count"] == 1
+
+    def test_non_json_body(self):
+        async def data(_request):
+            return web.Response(status=200, text="plain")
+
+        async def test(url):
+            async with AsyncConnector(url, None, None) as conn:
+                return await conn.get("/data")
+
+        r = run_with_server([web.get("/data", data)], test)
+        assert r.status == 200
+        assert r.json is None
+        assert r.raw == b"plain"
+
+    def test_post_with_payload(self):
+        async def post(request):
+            return web.json_response(await request.json(), status=201)
+
+        async def test(url):
+            async with AsyncConnector(url, None, None) as conn:
+                return await conn.post("/post", payload=dict(post="payload"))
+
+        status, _, json_data, _ = run_with_server([web.post("/post", post)], test)
+        assert status == 201
+        assert json_data == dict(post="payload")
+
+
+class TestAsyncResource:
+    def test_connect_and_load(self):
+        calls = []
+
+        async def test(url):
+            root = await redfish_client.connect_async(url, "user", "pass")
+            try:
+                systems = root.Systems
+                assert isinstance(systems, AsyncResource)
+                with pytest.raises(ResourceNotLoaded):
+                    systems.Members
+                await systems.load()
+                return await systems.Members[0].dig("Status", "Health")
+            finally:
+                await root.close()
+
+        assert run_with_server(service_routes(calls), test) == "OK"
+
+    def test_find_object(self):
+        calls = []
+
+        async def test(url):
+            root = await redfish_client.connect_async(url, "user", "pass")
+            try:
+                system = await root.find("/redfish/v1/Systems/1").load()
+                assert system.PowerState == "On"
+                return await system.find_object("Health")
+            finally:
+                await root.close()
+
+        assert run_with_server(service_routes(calls), test) == "OK"
+
+    def test_data_resource_is_not_a_stub(self):
+        resource = AsyncResource(None, data={"a": {"b": 1}})
+        assert resource.a.b == 1
+        with pytest.raises(KeyError):
+            resource["missing"]
+
+    @pytest.mark.parametrize("method,args", [
+        ("prefetch", ()), ("iter_members", ()), ("filter", (None,)),
+        ("expand", ()), ("select", ("Id",)),
+    ])
+    def test_sync_only(self, method, args):
+        resource = AsyncResource(None, oid="/redfish/v1/Systems")
+        with pytest.raises(TypeError, match=method):
+            getattr(resource, method)(*args)
+
+    def test_memoized_children(self):
+        async def test(url):
+            root = await redfish_client.connect_async(url, "user", "pass")
+            try:
+                system = await root.find("/redfish/v1/Systems/1").load()
+                status = system.Status
+                assert system.Status is status
+                assert root.Systems is root.Systems
+                await system.refresh()
+                return system.Status is not status
+            finally:
+                await root.close()
+
+        assert run_with_server(service_routes([]), test) is True
+
+
+class TestEventStream:
+    def test_stream_reconnect(self):
+        calls = []
+        big = "x" * 100000
+
+        async def event_service(_request):
+            return web.json_response({"ServerSentEventUri": "/redfish/v1/SSE"})
+
+        async def stream(request):
+            calls.append((
+                request.query.get("$filter"),
+                request.headers.get("Last-Event-ID"),
+            ))
+            resp = web.StreamResponse(
+                headers={"Content-Type": "text/event-stream"},
+            )
+            await resp.prepare(request)
+            if len(calls) == 1:
+                await resp.write(b": hi\r\nid: 1\r\ndata: {\"Id\": 1}\r\n\r\n")
+                await resp.write(b"id: 2\ndata: {\"Big\": \"")
+                await resp.write(big.encode("ascii") + b"\"}\n\n")
+            else:
+                await resp.write(b"id: 3\ndata: {\"Id\": 3}\n\n")
+            return resp
+
+        routes = [
+            web.get("/redfish/v1/EventService", event_service),
+            web.get("/redfish/v1/SSE", stream),
+        ]
+
+        async def test(url):
+            async with AsyncConnector(url, None, None) as conn:
+                stream = AsyncEventStream(
+                    conn, event_filter="EventType eq Alert", reconnect_delay=0,
+                )
+                events = []
+                async for event in stream:
+                    events.append(event)
+                    if len(events) == 3:
+                        break
+                return events
+
+        events = run_with_server(routes, test)
+        assert events == [dict(Id=1), dict(Big=big), dict(Id=3)]
+        assert calls == [("EventType eq Alert", None), ("EventType eq Alert", "2")]
+
+    def test_stream_unavailable(self):
+        calls = []
+
+        async def stream(request):
+            calls.append(request.path)
+            if len(calls) == 1:
+                return web.Response(status=503)
+            resp = web.StreamResponse(
+                headers={"Content-Type": "text/event-stream"},
+            )
+            await resp.prepare(request)
+            await resp.write(b"id: 1\ndata: {\"Id\": 1}\n\n")
+            return resp
+
+        async def test(url):
+            async with AsyncConnector(url, None, None) as conn:
+                stream = AsyncEventStream(
+                    conn, path="/redfish/v1/SSE", reconnect_delay=0,
+                    max_reconnects=1,
+                )
+                async for event in stream:
+                    return event
+
+        routes = [web.get("/redfish/v1/SSE", stream)]
+        assert run_with_server(routes, test) == dict(Id=1)
+        assert len(calls) == 2
@@ -0,0 +1,345 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+import redfish_client
+
+from redfish_client.cache import Cache, CachePolicy, MemoryCache, SQLiteCache
+from redfish_client.caching_connector import CachingConnector
+from redfish_client.connector import Response
+
+
+def response(size=1):
+    return Response(200, {}, raw=b"x" * size)
+
+
+class TestCache:
+    def test_abstract(self):
+        class Incomplete(Cache):
+            def get(self, key):
+                return None
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+
+class TestMemoryCache:
+    def test_get_set(self):
+        cache = MemoryCache()
+        r = response()
+        cache.set("/a", r)
+        assert cache.get("/a") is r
+        assert cache.get("/b") is None
+        assert cache.stats == (1, 1, 0, 0, 1, 1)
+
+    def test_replace(self):
+        cache = MemoryCache()
+        cache.set("/a", response(3))
+        cache.set("/a", response(5))
+        assert cache.stats.entries == 1
+        assert cache.stats.size == 5
+
+    def test_evict_by_count(self):
+        cache = MemoryCache(max_entries=2)
+        cache.set("/a", response())
+        cache.set("/b", response())
+        cache.get("/a")  # /b is now least recently used
+        cache.set("/c", response())
+        assert "/a" in cache
+        assert "/b" not in cache
+        assert "/c" in cache
+        assert cache.stats.evictions == 1
+
+    def test_evict_by_size(self):
+        cache = MemoryCache(max_bytes=10)
+        cache.set("/a", response(4))
+        cache.set("/b", response(4))
+        cache.set("/c", response(4))
+        assert list(cache._entries) == ["/b", "/c"]
+        assert cache.stats.size == 8
+        assert cache.stats.evictions == 1
+
+    def test_too_large(self):
+        cache = MemoryCache(max_bytes=10)
+        cache.set("/a", response(4))
+        cache.set("/b", response(11))
+        assert "/a" in cache
+        assert "/b" not in cache
+
+    def test_replace_too_large(self):
+        cache = MemoryCache(max_bytes=10)
+        cache.set("/a", response(4))
+        cache.set("/a", response(11))
+        assert "/a" not in cache
+        assert cache.stats.size == 0
+
+    @mock.patch("time.monotonic")
+    def test_ttl(self, monotonic):
+        monotonic.return_value = 100
+        cache = MemoryCache()
+        cache.set("/a", response(), ttl=10)
+        cache.set("/b", response())
+        monotonic.return_value = 109
+        assert cache.get("/a") is not None
+        monotonic.return_value = 110
+        assert cache.get("/a") is None
+        assert cache.get("/b") is not None
+        assert cache.stats == (2, 1, 0, 1, 2, 2)
+
+    def test_expire(self):
+        cache = MemoryCache()
+        r = response()
+        cache.set("/a", r)
+        cache.expire("/a")
+        cache.expire("/missing")
+        assert cache.get("/a") is None
+        assert cache.get_stale("/a") is r
+        assert cache.get_stale("/missing") is None
+        assert cache.stats == (0, 1, 0, 1, 1, 1)
+
+    def test_pop_and_clear(self):
+        cache = MemoryCache()
+        cache.set("/a", response(2))
+        cache.set("/b", response(3))
+        cache.pop("/a")
+        cache.pop("/missing")
+        assert cache.stats.size == 3
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats.size == 0
+
+    def test_clear_prefix(self):
+        cache = MemoryCache()
+        for key in ("https://a/1", "https://a/2", "https://b/1"):
+            cache.set(key, response(2))
+        cache.clear_prefix("https://a/")
+        assert list(cache._entries) == ["https://b/1"]
+        assert cache.stats.size == 2
+
+    def test_concurrent_access(self):
+        cache = MemoryCache(max_entries=16, max_bytes=64)
+
+        def work(worker):
+            for i in range(500):
+                key = "/{}".format((worker + i) % 32)
+                if cache.get(key) is None:
+                    cache.set(key, response(i % 5 + 1))
+                if i % 7 == 0:
+                    cache.pop(key)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(work, range(8)))
+
+        stats = cache.stats
+        assert stats.entries <= 16
+        assert stats.size <= 64
+        assert stats.size == sum(
+            cache.get_stale(k).size for k in list(cache._entries)
+        )
+        assert stats.hits + stats.misses == 8 * 500
+
+
+def _fill_shared_cache(path):
+    SQLiteCache(path).set("https://demo.dev/a", Response(
+        200, {"ETag": "1"}, raw=b'{"hello": "fish"}',
+    ))
+
+
+class TestSQLiteCache:
+    @pytest.fixture
+    def clock(self, mocker):
+        return mocker.patch("time.time", return_value=100)
+
+    @pytest.fixture
+    def cache(self, tmp_path, clock):
+        cache = SQLiteCache(str(tmp_path / "cache.db"))
+        yield cache
+        cache.close()
+
+    def test_get_set(self, cache):
+        cache.set("/a", Response(
+            200, {"ETag": "1"}, raw=b'{"hello": "fish"}',
+        ))
+        r = cache.get("/a")
+        assert r.status == 200
+        assert r.headers["etag"] == "1"
+        assert r.json == dict(hello="fish")
+        assert cache.get("/b") is None
+        assert cache.stats == (1, 1, 0, 0, 1, 17)
+
+    def test_drop_raw(self, cache):
+        r = Response(200, {}, raw=b'{"hello": "fish"}')
+        r.drop_raw()
+        cache.set("/a", r)
+        assert cache.get("/a").json == dict(hello="fish")
+
+    def test_replace(self, cache):
+        cache.set("/a", response(2))
+        cache.set("/a", response(3))
+        assert cache.get("/a").raw == b"xxx"
+        assert cache.stats.size == 3
+
+    def test_evict_lru(self, tmp_path, clock):
+        cache = SQLiteCache(str(tmp_path / "cache.db"), max_entries=2)
+        cache.set("/a", response())
+        clock.return_value = 101
+        cache.set("/b", response())
+        clock.return_value = 102
+        cache.get("/a")
+        clock.return_value = 103
+        cache.set("/c", response())
+        assert "/a" in cache
+        assert "/b" not in cache
+        assert "/c" in cache
+        assert cache.stats.evictions == 1
+
+    def test_evict_by_size(self, tmp_path, clock):
+        cache = SQLiteCache(str(tmp_path / "cache.db"), max_bytes=10)
+        cache.set("/a", response(4))
+        clock.return_value = 101
+        cache.set("/b", response(4))
+        clock.return_value = 102
+        cache.set("/c", response(4))
+        cache.set("/d", response(11))
+        assert len(cache) == 2
+        assert "/a" not in cache
+        assert cache.stats.size == 8
+
+    def test_replace_too_large(self, tmp_path, clock):
+        cache = SQLiteCache(str(tmp_path / "cache.db"), max_bytes=10)
+        cache.set("/a", response(4))
+        cache.set("/a", response(11))
+        assert "/a" not in cache
+        assert cache.stats.size == 0
+
+    def test_ttl(self, cache, clock):
+        cache.set("/a", response(), ttl=10)
+        clock.return_value = 110
+        assert cache.get("/a") is None
+        assert cache.get_stale("/a") is not None
+        assert cache.stats == (0, 1, 0, 1, 1, 1)
+
+    def test_expire(self, cache):
+        cache.set("/a", response())
+        cache.expire("/a")
+        cache.expire("/missing")
+        assert cache.get("/a") is None
+        assert cache.get_stale("/a").raw == b"x"
+
+    def test_pop_and_clear(self, cache):
+        cache.set("/a", response(2))
+        cache.set("/b", response(3))
+        cache.pop("/a")
+        cache.pop("/missing")
+        assert cache.stats.size == 3
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_clear_prefix(self, cache):
+        for key in ("https://a_1/1", "https://a_1/2", "https://ab1/1", "https://b/1"):
+            cache.set(key, response())
+        cache.clear_prefix("https://a_1/")
+        assert "https://ab1/1" in cache
+        assert "https://b/1" in cache
+        assert len(cache) == 2
+
+    def test_permissions(self, tmp_path):
+        path = tmp_path / "cache.db"
+        cache = SQLiteCache(str(path))
+        cache.set("/a", response())
+        cache.close()
+        assert path.stat().st_mode & 0o777 == 0o600
+
+    def test_shared_between_processes(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        process = multiprocessing.Process(target=_fill_shared_cache, args=(path,))
+        process.start()
+        process.join()
+        assert process.exitcode == 0
+
+        r = SQLiteCache(path).get("https://demo.dev/a")
+        assert r.json == dict(hello="fish")
+        assert r.headers["ETag"] == "1"
+
+
+class TestCachePolicy:
+    @staticmethod
+    def typed(odata_type):
+        return Response(200, {}, json={"@odata.type": odata_type})
+
+    def test_default(self):
+        policy = CachePolicy()
+        assert policy.cacheable("/a")
+        assert policy.cacheable("/a", response())
+        assert policy.ttl("/a", response()) is None
+        assert not policy.cacheable("/a", Response(404, {}, raw=b""))
+        assert not policy.cacheable("/a", Response(500, {}, raw=b""))
+
+    def test_paths(self):
+        policy = CachePolicy(ttl=60, paths={
+            "/redfish/v1/Chassis/*/Sensors/*": 1,
+            "/redfish/v1/Chassis/*": 3600,
+        })
+        assert policy.ttl("/redfish/v1/Chassis/1/Sensors/T1", response()) == 1
+        assert policy.ttl("/redfish/v1/Chassis/1", response()) == 3600
+        assert policy.ttl("/redfish/v1/Systems/1", response()) == 60
+
+    def test_types(self):
+        policy = CachePolicy(ttl=60, paths={"/fast": 1}, types={
+            "#Thermal.*": 2,
+            "Power": 3,
+        })
+        assert policy.ttl("/a", self.typed("#Thermal.v1_5_0.Thermal")) == 2
+        assert policy.ttl("/a", self.typed("#Power.v1_0_0.Power")) == 3
+        assert policy.ttl("/a", self.typed("#Chassis.v1_0_0.Chassis")) == 60
+        assert policy.ttl("/fast", self.typed("#Power.v1_0_0.Power")) == 1
+        assert policy.ttl("/a", response()) == 60
+
+    def test_never(self):
+        policy = CachePolicy(never=("/redfish/v1/TaskService/*",))
+        assert not policy.cacheable("/redfish/v1/TaskService/Tasks/1")
+        assert not policy.cacheable("/redfish/v1/TaskService/Tasks", response())
+        assert policy.cacheable("/redfish/v1/TaskService")
+
+    def test_negative(self):
+        policy = CachePolicy(ttl=60, negative_ttl=5)
+        missing = Response(404, {}, raw=b"")
+        assert policy.cacheable("/a", missing)
+        assert policy.ttl("/a", missing) == 5
+        assert not policy.cacheable("/a", Response(503, {}, raw=b""))
+
+
+class TestConnect:
+    @pytest.mark.parametrize("cache", [
+        lambda tmp_path: MemoryCache(),
+        lambda tmp_path: SQLiteCache(str(tmp_path / "cache.db")),
+    ])
+    def test_empty_cache_instance(self, requests_mock, tmp_path, cache):
+        requests_mock.get("https://bmc/redfish/v1", json={
+            "@odata.id": "/redfish/v1",
+            "Systems": {"@odata.id": "/redfish/v1/Systems"},
+        })
+        requests_mock.get("https://bmc/redfish/v1/Systems", json={})
+        cache = cache(tmp_path)
+        assert len(cache) == 0
+
+        root = redfish_client.connect("https://bmc", "user", "pass", cache=cache)
+        assert isinstance(root._connector, CachingConnector)
+        assert root._connector._cache is cache
+        assert len(cache) > 0
@@ -12,9 +12,23 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+import requests
 
+from redfish_client.cache import CachePolicy, SQLiteCache
 from redfish_client.caching_connector import CachingConnector
+from redfish_client.connector import Connector, Response
+from redfish_client.exceptions import (
+    InaccessibleException,
+    ResourceNotFound,
+    TimedOutException,
+)
+from redfish_client.instrumentation import Instrument, MetricsCollector
+from redfish_client.resource import Resource
 
 
 class TestGet:
@@ -36,6 +50,51 @@ class TestGet:
         assert conn.get("/data").json == dict(error="bad")
         assert conn.get("/data").json == dict(really="bad")
 
+    def test_get_no_cache(self, requests_mock):
+        requests_mock.get("https://demo.dev/data", [
+            dict(status_code=200, json=dict(hello="fish")),
+            dict(status_code=200, json=dict(solong="fish")),
+        ])
+        conn = CachingConnector("https://demo.dev", None, None)
+        assert conn.get("/data", cache=False).json == dict(hello="fish")
+        assert conn.get("/data").json == dict(solong="fish")
+        assert conn.cache_stats.entries == 1
+
+    def test_get_caching_drop_raw(self, requests_mock):
+        requests_mock.get(
+            "https://demo.dev/data", status_code=200, json=dict(hello="fish"),
+        )
+        conn = CachingConnector("https://demo.dev", None, None, keep_raw=False)
+        conn.get("/data")
+        cached = conn.get("/data")
+        assert cached._raw is None
+        assert cached.json == dict(hello="fish")
+        assert cached.raw == b'{"hello": "fish"}'
+
+    def test_get_caching_bounded(self, requests_mock):
+        for i in range(3):
+            requests_mock.get(
+                "https://demo.dev/{}".format(i), status_code=200, text="x" * 10,
+            )
+        conn = CachingConnector("https://demo.dev", None, None, max_entries=2)
+        for i in (0, 1, 2, 0):
+            conn.get("/{}".format(i))
+        assert requests_mock.call_count == 4
+        assert conn.cache_stats == (0, 4, 2, 0, 2, 20)
+
+    def test_get_caching_ttl(self, requests_mock, mocker):
+        monotonic = mocker.patch("time.monotonic", return_value=0)
+        requests_mock.get("https://demo.dev/data", [
+            dict(status_code=200, json=dict(hello="fish")),
+            dict(status_code=200, json=dict(solong="fish")),
+        ])
+        conn = CachingConnector("https://demo.dev", None, None, ttl=5)
+        assert conn.get("/data").json == dict(hello="fish")
+        monotonic.return_value = 4
+        assert conn.get("/data").json == dict(hello="fish")
+        monotonic.return_value = 5
+        assert conn.get("/data").json == dict(solong="fish")
+
 
 class TestReset:
     @staticmethod
@@ -58,6 +117,20 @@ class TestReset:
         assert conn.get("/1").json == dict(hello="bear")
         assert conn.get("/2").json == dict(solong="bear")
 
+    def test_reset_shared_cache(self, requests_mock, tmp_path):
+        requests_mock.get("https://demo.dev/1", json=dict(hello="fish"))
+        requests_mock.get("https://other.dev/1", json=dict(hello="bear"))
+        cache = SQLiteCache(str(tmp_path / "cache.db"))
+        conn = CachingConnector("https://demo.dev", "", "", cache=cache)
+        other = CachingConnector("https://other.dev", "", "", cache=cache)
+        conn.get("/1")
+        other.get("/1")
+        assert len(cache) == 2
+        conn.reset()
+        assert "https://other.dev/1" in cache
+        assert len(cache) == 1
+        cache.close()
+
     def test_reset_with_path(self, requests_mock):
         self.mock_paths(requests_mock)
         conn = CachingConnector("https://demo.dev", "user", "pass")
@@ -75,3 +148,461 @@ class TestReset:
         conn.reset("/3")
         assert conn.get("/1").json == dict(hello="fish")
         assert conn.get("/2").json == dict(solong="fish")
+
+
+class TestRevalidate:
+    def test_not_modified(self, requests_mock):
+        requests_mock.get(
+            "https://demo.dev/data", status_code=200, json=dict(hello="fish"),
+            headers={"ETag": "W/\"1\""},
+        )
+        requests_mock.get(
+            "https://demo.dev/data", status_code=304,
+            request_headers={"If-None-Match": "W/\"1\""},
+        )
+        conn = CachingConnector("https://demo.dev", None, None, revalidate=True)
+        first = conn.get("/data")
+        conn.expire("/data")
+        assert conn.get("/data") is first
+        assert requests_mock.call_count == 2
+        assert conn.get("/data") is first
+        assert requests_mock.call_count == 2
+
+    def test_modified(self, requests_mock):
+        requests_mock.get("https://demo.dev/data", [
+            dict(status_code=200, json={"@odata.etag": "1", "hello": "fish"}),
+            dict(status_code=200, json={"@odata.etag": "2", "hello": "bear"}),
+        ])
+        conn = CachingConnector("https://demo.dev", None, None, revalidate=True)
+        conn.get("/data")
+        conn.expire("/data")
+        assert conn.get("/data").json["hello"] == "bear"
+        assert requests_mock.last_request.headers["If-None-Match"] == "1"
+
+    def test_no_etag(self, requests_mock):
+        requests_mock.get("https://demo.dev/data", [
+            dict(status_code=200, json=dict(hello="fish")),
+            dict(status_code=200, json=dict(hello="bear")),
+        ])
+        conn = CachingConnector("https://demo.dev", None, None, revalidate=True)
+        conn.get("/data")
+        conn.expire("/data")
+        assert conn.get("/data").json == dict(hello="bear")
+        assert "If-None-Match" not in requests_mock.last_request.headers
+
+    def test_expired_by_ttl(self, requests_mock, mocker):
+        monotonic = mocker.patch("time.monotonic", return_value=0)
+        requests_mock.get("https://demo.dev/data", [
+            dict(status_code=200, json=dict(hello="fish"), headers={"ETag": "1"}),
+            dict(status_code=304),
+        ])
+        conn = CachingConnector(
+            "https://demo.dev", None, None, ttl=5, revalidate=True,
+        )
+        first = conn.get("/data")
+        monotonic.return_value = 10
+        assert conn.get("/data") is first
+        assert conn.get("/data") is first
+        assert requests_mock.call_count == 2
+
+    def test_expire_without_revalidation(self, requests_mock):
+        requests_mock.get("https://demo.dev/data", [
+            dict(status_code=200, json=dict(hello="fish"), headers={"ETag": "1"}),
+            dict(status_code=200, json=dict(hello="bear")),
+        ])
+        conn = CachingConnector("https://demo.dev", None, None)
+        conn.get("/data")
+        conn.expire("/data")
+        assert conn.get("/data").json == dict(hello="bear")
+        assert "If-None-Match" not in requests_mock.last_request.headers
+
+    def test_resource_refresh(self, requests_mock):
+        requests_mock.get(
+            "https://demo.dev/data", status_code=200, headers={"ETag": "1"},
+            json={"@odata.id": "/data", "Status": {"State": "Enabled"}},
+        )
+        requests_mock.get(
+            "https://demo.dev/data", status_code=304,
+            request_headers={"If-None-Match": "1"},
+        )
+        conn = CachingConnector("https://demo.dev", None, None, revalidate=True)
+        resource = Resource(conn, oid="/data", lazy=False)
+        resource.refresh()
+        assert resource.Status.State == "Enabled"
+        assert requests_mock.call_count == 2
+
+
+class TestSingleFlight:
+    @staticmethod
+    def _slow(json, delay=0.1):
+        def callback(_request, _context):
+            time.sleep(delay)
+            return json
+        return callback
+
+    @staticmethod
+    def _concurrent_gets(conn, path, count=8):
+        barrier = threading.Barrier(count)
+
+        def get(_):
+            barrier.wait()
+            return conn.get(path)
+
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            return list(executor.map(get, range(count)))
+
+    def test_coalesce(self, requests_mock):
+        requests_mock.get(
+            "https://demo.dev/data", json=self._slow(dict(hello="fish")),
+        )
+        conn = CachingConnector("https://demo.dev", None, None)
+        responses = self._concurrent_gets(conn, "/data")
+        assert requests_mock.call_count == 1
+        assert all(r is responses[0] for r in responses)
+        assert conn.cache_stats.entries == 1
+
+    def test_coalesce_non_ok(self, requests_mock):
+        requests_mock.get("https://demo.dev/data", [
+            dict(status_code=404, json=self._slow(dict(error="bad"))),
+            dict(status_code=200, json=dict(hello="fish")),
+        ])
+        conn = CachingConnector("https://demo.dev", None, None)
+        responses = self._concurrent_gets(conn, "/data")
+        assert requests_mock.call_count == 1
+        assert all(r.status == 404 for r in responses)
+        assert conn.get("/data").status == 200
+
+    def test_coalesce_error(self, requests_mock):
+        def callback(_request, _context):
+            time.sleep(0.1)
+            raise requests.exceptions.ConnectionError("down")
+
+        requests_mock.get("https://demo.dev/data", json=callback)
+        conn = CachingConnector("https://demo.dev", None, None)
+        with pytest.raises(InaccessibleException):
+            self._concurrent_gets(conn, "/data")
+        assert requests_mock.call_count == 1
+        assert conn._inflight == {}
+
+    def test_different_paths(self, requests_mock):
+        requests_mock.get("https://demo.dev/a", json=self._slow(dict(a=1)))
+        requests_mock.get("https://demo.dev/b", json=self._slow(dict(b=2)))
+        conn = CachingConnector("https://demo.dev", None, None)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            paths = ["/a", "/b", "/a", "/b"]
+            responses = list(executor.map(conn.get, paths))
+        assert requests_mock.call_count == 2
+        assert [r.json for r in responses] == [
+            dict(a=1), dict(b=2), dict(a=1), dict(b=2),
+        ]
+
+    def test_followers_notify_instruments(self, requests_mock):
+        requests_mock.get(
+            "https://demo.dev/data", json=self._slow(dict(hello="fish")),
+        )
+        collector = MetricsCollector()
+        conn = CachingConnector(
+            "https://demo.dev", None, None, instruments=[collector],
+        )
+        self._concurrent_gets(conn, "/data", count=4)
+        stats = collector.snapshot()["paths"]["GET /data"]
+        assert stats["latency"]["count"] == 4
+        assert stats["cached"] == 3
+
+
+    def test_mutation_during_get(self, mocker):
+        started, patched = threading.Event(), threading.Event()
+        state = dict(PowerState="On")
+
+        def get(path, headers=None):
+            body = dict(state)
+            started.set()
+            patched.wait(5)  # The response arrives after the PATCH
+            return Response(200, {}, body, b"")
+
+        def request(method, path, payload=None, headers=None):
+            state.update(payload)
+            return Response(200, {}, None, b"")
+
+        mocker.patch.object(Connector, "get", side_effect=get)
+        mocker.patch.object(Connector, "_request", side_effect=request)
+        conn = CachingConnector("https://demo.dev", None, None)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(conn.get, "/data")
+            started.wait(5)
+            conn.patch("/data", payload=dict(PowerState="Off"))
+            patched.set()
+            assert future.result().json == dict(PowerState="On")
+        assert conn.get("/data").json == dict(PowerState="Off")
+        assert conn._inflight == {}
+
+    def test_follower_notified_before_wait(self, requests_mock):
+        events = []
+        released = threading.Event()
+
+        def slow_get(_request, _context):
+            released.wait(5)
+            return {}
+
+        class Recorder(Instrument):
+            def before_request(self, base_url, method, path):
+                events.append("before")
+
+            def after_request(self, event):
+                events.append("after")
+
+        requests_mock.get("https://demo.dev/data", json=slow_get)
+        conn = CachingConnector(
+            "https://demo.dev", None, None, instruments=[Recorder()],
+        )
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(conn.get, "/data") for _ in range(2)]
+            deadline = time.monotonic() + 5
+            while events.count("before") < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert events == ["before", "before"]
+            released.set()
+            for future in futures:
+                future.result()
+        assert events == ["before", "before", "after", "after"]
+
+
+class TestCacheBackend:
+    def test_shared_backend(self, requests_mock, tmp_path):
+        requests_mock.get("https://demo.dev/data", [
+            dict(status_code=200, json=dict(hello="fish")),
+            dict(status_code=200, json=dict(solong="fish")),
+        ])
+        requests_mock.get("https://other.dev/data", json=dict(hello="bear"))
+        path = str(tmp_path / "cache.db")
+        conn = CachingConnector("https://demo.dev", None, None,
+                                cache=SQLiteCache(path))
+        assert conn.get("/data").json == dict(hello="fish")
+
+        conn = CachingConnector("https://demo.dev", None, None,
+                                cache=SQLiteCache(path))
+        assert conn.get("/data").json == dict(hello="fish")
+        other = CachingConnector("https://other.dev", None, None,
+                                 cache=SQLiteCache(path))
+        assert other.get("/data").json == dict(hello="bear")
+        assert requests_mock.call_count == 2
+
+    def test_revalidate_persisted(self, requests_mock, tmp_path):
+        requests_mock.get(
+            "https://demo.dev/data", status_code=200, json=dict(hello="fish"),
+            headers={"ETag": "1"},
+        )
+        requests_mock.get(
+            "https://demo.dev/data", status_code=304,
+            request_headers={"If-None-Match": "1"},
+        )
+        path = str(tmp_path / "cache.db")
+        conn = CachingConnector("https://demo.dev", None, None, ttl=0,
+                                revalidate=True, cache=SQLiteCache(path))
+        conn.get("/data")
+
+        conn = CachingConnector("https://demo.dev", None, None, ttl=0,
+                                revalidate=True, cache=SQLiteCache(path))
+        assert conn.get("/data").json == dict(hello="fish")
+        assert requests_mock.call_count == 2
+
+
+class TestPolicy:
+    def test_never(self, requests_mock):
+        requests_mock.get("https://demo.dev/tasks/1", [
+            dict(status_code=200, json=dict(state="Running")),
+            dict(status_code=200, json=dict(state="Completed")),
+        ])
+        policy = CachePolicy(never=("/tasks/*",))
+        conn = CachingConnector("https://demo.dev", None, None, policy=policy)
+        assert conn.get("/tasks/1").json == dict(state="Running")
+        assert conn.get("/tasks/1").json == dict(state="Completed")
+        assert conn.cache_stats.entries == 0
+
+    def test_type_ttl(self, requests_mock, mocker):
+        monotonic = mocker.patch("time.monotonic", return_value=0)
+        requests_mock.get("https://demo.dev/thermal", [
+            dict(json={"@odata.type": "#Thermal.v1_0_0.Thermal", "T": 20}),
+            dict(json={"@odata.type": "#Thermal.v1_0_0.Thermal", "T": 21}),
+        ])
+        requests_mock.get("https://demo.dev/fru", [
+            dict(json={"@odata.type": "#Assembly.v1_0_0.Assembly", "v": 1}),
+            dict(json={"@odata.type": "#Assembly.v1_0_0.Assembly", "v": 2}),
+        ])
+        policy = CachePolicy(ttl=3600, types={"Thermal": 1})
+        conn = CachingConnector("https://demo.dev", None, None, policy=policy)
+        conn.get("/thermal")
+        conn.get("/fru")
+        monotonic.return_value = 5
+        assert conn.get("/thermal").json["T"] == 21
+        assert conn.get("/fru").json["v"] == 1
+
+    def test_negative(self, requests_mock, mocker):
+        monotonic = mocker.patch("time.monotonic", return_value=0)
+        requests_mock.get("https://demo.dev/missing", [
+            dict(status_code=404, json=dict(error="missing")),
+            dict(status_code=200, json=dict(hello="fish")),
+        ])
+        policy = CachePolicy(negative_ttl=10)
+        conn = CachingConnector("https://demo.dev", None, None, policy=policy)
+        assert conn.get("/missing").status == 404
+        assert conn.get("/missing").status == 404
+        assert requests_mock.call_count == 1
+        monotonic.return_value = 10
+        assert conn.get("/missing").status == 200
+
+    def test_negative_resource(self, requests_mock):
+        requests_mock.get(
+            "https://demo.dev/data", json={"Optional": {"@odata.id": "/opt"}},
+        )
+        requests_mock.get("https://demo.dev/opt", status_code=404, json={})
+        policy = CachePolicy(negative_ttl=10)
+        conn = CachingConnector("https://demo.dev", None, None, policy=policy)
+        resource = Resource(conn, oid="/data")
+        for _ in range(3):
+            with pytest.raises(ResourceNotFound):
+                resource.dig("Optional", "Name")
+        assert requests_mock.call_count == 2
+
+
+class TestInvalidation:
+    @staticmethod
+    def mock_get(requests_mock, path):
+        requests_mock.get("https://demo.dev" + path, [
+            dict(json=dict(version=1)), dict(json=dict(version=2)),
+        ])
+
+    @staticmethod
+    def warm(conn, *paths):
+        for path in paths:
+            assert conn.get(path).json == dict(version=1)
+
+    @staticmethod
+    def versions(conn, *paths):
+        return [conn.get(path).json["version"] for path in paths]
+
+    def test_patch(self, requests_mock):
+        for path in ("/Systems", "/Systems/1", "/Systems/2"):
+            self.mock_get(requests_mock, path)
+        requests_mock.patch("https://demo.dev/Systems/1", status_code=204)
+        conn = CachingConnector("https://demo.dev", None, None)
+        self.warm(conn, "/Systems", "/Systems/1", "/Systems/2")
+        conn.patch("/Systems/1", payload=dict(AssetTag="x"))
+        assert self.versions(conn, "/Systems", "/Systems/1", "/Systems/2") == [
+            1, 2, 1,
+        ]
+
+    def test_post_location(self, requests_mock):
+        for path in ("/", "/Sessions", "/Sessions/2"):
+            self.mock_get(requests_mock, path)
+        requests_mock.post("https://demo.dev/Sessions/", status_code=201,
+                           headers={"Location": "https://demo.dev/Sessions/2"})
+        conn = CachingConnector("https://demo.dev", None, None)
+        self.warm(conn, "/", "/Sessions", "/Sessions/2")
+        conn.post("/Sessions/", payload={})
+        assert self.versions(conn, "/", "/Sessions", "/Sessions/2") == [2, 2, 2]
+
+    def test_delete(self, requests_mock):
+        for path in ("/Sessions", "/Sessions/1", "/Sessions/2"):
+            self.mock_get(requests_mock, path)
+        requests_mock.delete("https://demo.dev/Sessions/1", status_code=204)
+        conn = CachingConnector("https://demo.dev", None, None)
+        self.warm(conn, "/Sessions", "/Sessions/1", "/Sessions/2")
+        conn.delete("/Sessions/1")
+        assert self.versions(
+            conn, "/Sessions", "/Sessions/1", "/Sessions/2",
+        ) == [2, 2, 1]
+
+    def test_action(self, requests_mock):
+        for path in ("/Systems", "/Systems/1"):
+            self.mock_get(requests_mock, path)
+        requests_mock.post(
+            "https://demo.dev/Systems/1/Actions/ComputerSystem.Reset",
+            status_code=204,
+        )
+        conn = CachingConnector("https://demo.dev", None, None)
+        self.warm(conn, "/Systems", "/Systems/1")
+        conn.post("/Systems/1/Actions/ComputerSystem.Reset", payload={})
+        assert self.versions(conn, "/Systems", "/Systems/1") == [1, 2]
+
+    def test_trailing_slash(self, requests_mock):
+        self.mock_get(requests_mock, "/Systems/1/")
+        requests_mock.put("https://demo.dev/Systems/1", status_code=204)
+        conn = CachingConnector("https://demo.dev", None, None)
+        self.warm(conn, "/Systems/1/")
+        conn.put("/Systems/1", payload={})
+        assert self.versions(conn, "/Systems/1/") == [2]
+
+    def test_failed_request(self, requests_mock):
+        self.mock_get(requests_mock, "/Systems/1")
+        requests_mock.patch(
+            "https://demo.dev/Systems/1",
+            exc=requests.exceptions.ReadTimeout,
+        )
+        conn = CachingConnector("https://demo.dev", None, None)
+        self.warm(conn, "/Systems/1")
+        with pytest.raises(TimedOutException):
+            conn.patch("/Systems/1", payload={})
+        assert self.versions(conn, "/Systems/1") == [2]
+
+    def test_resource_patch(self, requests_mock):
+        requests_mock.get("https://demo.dev/Systems/1", [
+            dict(json={"@odata.id": "/Systems/1", "AssetTag": "old"}),
+            dict(json={"@odata.id": "/Systems/1", "AssetTag": "new"}),
+        ])
+        requests_mock.patch("https://demo.dev/Systems/1", status_code=204)
+        conn = CachingConnector("https://demo.dev", None, None)
+        system = Resource(conn, oid="/Systems/1")
+        assert system.AssetTag == "old"
+        system.patch(payload=dict(AssetTag="new"))
+        assert Resource(conn, oid="/Systems/1").AssetTag == "new"
+
+
+class TestSeed:
+    def test_expand_seeds_cache(self, requests_mock):
+        requests_mock.get("https://demo.dev/Systems?$expand=.($levels=1)", json={
+            "@odata.id": "/Systems",
+            "Members": [
+                {"@odata.id": "/Systems/1", "Name": "one"},
+                {"@odata.id": "/Systems/2", "Name": "two"},
+            ],
+        })
+        conn = CachingConnector("https://demo.dev", None, None)
+        conn.set_protocol_features(
+            {"ExpandQuery": {"NoLinks": True, "Levels": True}},
+        )
+        Resource(conn, oid="/Systems").expand()
+        assert Resource(conn, oid="/Systems/2").Name == "two"
+        assert requests_mock.call_count == 1
+        assert requests_mock.last_request.url.endswith("$expand=.($levels=1)")
+
+    def test_seed_policy(self):
+        policy = CachePolicy(never=("/tasks/*",))
+        conn = CachingConnector(
+            "https://demo.dev", None, None, policy=policy, keep_raw=False,
+        )
+        conn.seed("/tasks/1", dict(a=1))
+        conn.seed("/systems/1", dict(a=2))
+        assert conn.cache_stats.entries == 1
+        assert conn.get("/systems/1").json == dict(a=2)
+
+    def test_select_is_not_full_content(self, requests_mock):
+        # Later registrations take precedence in requests_mock.
+        requests_mock.get("https://demo.dev/Systems/1", json={
+            "@odata.id": "/Systems/1", "PowerState": "On", "Name": "one",
+        })
+        requests_mock.get(
+            "https://demo.dev/Systems/1?$select=PowerState",
+            json={"@odata.id": "/Systems/1", "PowerState": "On"},
+        )
+        conn = CachingConnector("https://demo.dev", None, None)
+        conn.set_protocol_features({"SelectQuery": True})
+        for _ in range(2):
+            system = Resource(conn, oid="/Systems/1").select("PowerState")
+            assert system.PowerState == "On"
+        # Projections bypass the cache and are not stored as full content.
+        assert requests_mock.call_count == 2
+        assert conn.cache_stats.entries == 0
+        assert "Name" not in system._content
+        assert Resource(conn, oid="/Systems/1").Name == "one"
+        assert requests_mock.call_count == 3
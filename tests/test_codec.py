@@ -0,0 +1,81 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from redfish_client.codec import DEFAULT_CODEC, JsonCodec, get_codec
+from redfish_client.connector import Connector, Response
+
+
+class UpperCodec(JsonCodec):
+    # Test codec that makes it obvious which codec processed the data
+    def loads(self, data):
+        return super().loads(data.upper())
+
+    def dumps(self, obj):
+        return super().dumps(obj).upper()
+
+
+class TestGetCodec:
+    def test_default(self):
+        assert get_codec() is DEFAULT_CODEC
+        assert isinstance(get_codec("json"), JsonCodec)
+
+    def test_instance(self):
+        codec = UpperCodec()
+        assert get_codec(codec) is codec
+
+    def test_unknown(self):
+        with pytest.raises(ValueError):
+            get_codec("yaml")
+
+    def test_orjson(self):
+        pytest.importorskip("orjson")
+        codec = get_codec("orjson")
+        assert codec.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+        assert codec.dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
+        with pytest.raises(ValueError):
+            codec.loads(b"invalid")
+
+
+class TestConnectorCodec:
+    def test_decode(self, requests_mock):
+        requests_mock.get("https://demo.dev/data", status_code=200, text='{"a": "b"}')
+        conn = Connector("https://demo.dev", None, None, codec=UpperCodec())
+        assert conn.get("/data").json == {"A": "B"}
+
+    def test_encode(self, requests_mock):
+        requests_mock.post(
+            "https://demo.dev/post", status_code=200,
+            request_headers={"Content-Type": "application/json"},
+            additional_matcher=lambda r: r.json() == {"POST": "PAYLOAD"},
+        )
+        conn = Connector("https://demo.dev", None, None, codec=UpperCodec())
+        assert conn.post("/post", dict(post="payload")).status == 200
+
+    def test_custom_content_type(self, requests_mock):
+        requests_mock.post(
+            "https://demo.dev/post", status_code=200,
+            request_headers={"Content-Type": "application/merge-patch+json"},
+        )
+        conn = Connector("https://demo.dev", None, None)
+        assert conn.post("/post", {}, headers={
+            "Content-Type": "application/merge-patch+json",
+        }).status == 200
+
+    def test_response_codec(self):
+        r = Response(200, {}, raw=b'{"a": "b"}', codec=UpperCodec())
+        assert r.json == {"A": "B"}
+        r.drop_raw()
+        assert r.raw == b'{"A": "B"}'
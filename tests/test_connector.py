@@ -13,10 +13,19 @@
 #  limitations under the License.
 
 import logging
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
 import pytest
+import requests
 
-from redfish_client.connector import Connector
-from redfish_client.exceptions import AuthException, InaccessibleException
+from redfish_client.connector import (
+    _UNPARSED, Connector, PoolAdapter, Response,
+)
+from redfish_client.exceptions import (
+    AuthException, InaccessibleException, TimedOutException,
+)
 
 
 class TestInit:
@@ -263,6 +272,50 @@ class TestGet:
         assert conn.get("/data").json == dict(really="bad")
 
 
+class TestResponse:
+    def test_lazy_json(self, requests_mock):
+        requests_mock.get(
+            "https://demo.dev/data", status_code=200, json=dict(hello="fish"),
+        )
+        r = Connector("https://demo.dev", None, None).get("/data")
+        assert r._json is _UNPARSED
+        assert r.size == len(r.raw)
+        assert r.json == dict(hello="fish")
+        assert r.json is r.json
+
+    def test_case_insensitive_headers(self, requests_mock):
+        requests_mock.get(
+            "https://demo.dev/data", status_code=200, headers={"ETag": "W/1"},
+        )
+        r = Connector("https://demo.dev", None, None).get("/data")
+        assert r.headers["etag"] == "W/1"
+        assert r.headers["ETag"] == "W/1"
+
+    def test_tuple_compatibility(self):
+        r = Response(200, {}, None, b"")
+        status, headers, json_data, raw = r
+        assert (status, headers, json_data, raw) == (200, {}, None, b"")
+        assert r == (200, {}, None, b"")
+        assert r[0] == 200
+        assert len(r) == 4
+        assert r._asdict() == dict(status=200, headers={}, json=None, raw=b"")
+        assert Response(status=200, headers={}, json={"a": 1}).json == {"a": 1}
+
+    def test_drop_raw(self):
+        r = Response(200, {}, raw=b'{"a": 1}')
+        r.drop_raw()
+        assert r._raw is None
+        assert r.json == {"a": 1}
+        assert r.raw == b'{"a": 1}'
+        assert r.size == 8
+
+    def test_drop_raw_non_json(self):
+        r = Response(200, {}, raw=b"plain")
+        r.drop_raw()
+        assert r.json is None
+        assert r.raw == b"plain"
+
+
 class TestPost:
     def test_post_no_payload(self, requests_mock):
         requests_mock.post("https://demo.dev/post", status_code=200)
@@ -333,6 +386,15 @@ class TestDelete:
         status, *_ = conn.delete("/delete")
         assert status == 204
 
+    def test_delete_headers(self, requests_mock):
+        requests_mock.delete(
+            "https://demo.dev/delete", status_code=204,
+            request_headers={"If-Match": "1"},
+        )
+        conn = Connector("https://demo.dev", None, None)
+        status, *_ = conn.delete("/delete", headers={"If-Match": "1"})
+        assert status == 204
+
 
 class TestReset:
     @staticmethod
@@ -366,6 +428,10 @@ class TestReset:
 
 
 class TestLogging:
+    @pytest.fixture(autouse=True)
+    def debug_level(self, caplog):
+        caplog.set_level(logging.DEBUG, logger="redfish-client")
+
     def test_logging_get(self, mocker, requests_mock):
         logging_debug_mock = mocker.patch.object(logging.Logger, 'debug')
         logging_error_mock = mocker.patch.object(logging.Logger, 'error')
@@ -419,3 +485,103 @@ class TestLogging:
                             '}')
             ]
         )
+
+
+class TestTimeout:
+    def test_read_timeout(self, requests_mock):
+        requests_mock.get(
+            "https://demo.dev/data", exc=requests.exceptions.ReadTimeout,
+        )
+        conn = Connector("https://demo.dev", "user", "pass")
+        with pytest.raises(TimedOutException):
+            conn.get("/data")
+
+    def test_login_inaccessible(self, requests_mock):
+        requests_mock.post(
+            "https://demo.dev/sessions", exc=requests.exceptions.ConnectionError,
+        )
+        conn = Connector("https://demo.dev", "user", "pass")
+        conn.set_session_auth_data("/sessions")
+        with pytest.raises(InaccessibleException):
+            conn.login()
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b'{"hello": "fish"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs=dict(poll_interval=0.01), daemon=True,
+    )
+    thread.start()
+    yield "http://127.0.0.1:{}".format(server.server_address[1])
+    server.shutdown()
+    server.server_close()
+
+
+class TestConnectionPool:
+    def test_connection_reuse(self, http_server):
+        conn = Connector(http_server, None, None)
+        for _ in range(3):
+            assert conn.get("/data").json == dict(hello="fish")
+        assert conn.pool_stats == (1, 3, 2)
+
+    def test_no_keep_alive(self, http_server):
+        conn = Connector(http_server, None, None, keep_alive=False)
+        for _ in range(3):
+            conn.get("/data")
+        assert conn.pool_stats == (3, 3, 0)
+
+    def test_idle_timeout(self, http_server):
+        conn = Connector(http_server, None, None, pool_idle_timeout=0)
+        for _ in range(3):
+            conn.get("/data")
+        assert conn.pool_stats == (3, 3, 0)
+
+    def test_idle_timeout_shared_pool(self, http_server):
+        adapter = PoolAdapter()
+        conn = Connector(http_server, None, None, adapter=adapter,
+                         pool_idle_timeout=0)
+        conn.get("/data")
+        pool = adapter.poolmanager.connection_from_url(http_server)
+        other = adapter.poolmanager.connection_from_url("http://127.0.0.1:1")
+        in_use = pool._get_conn()  # Checked out by another connector
+        conn.get("/data")
+        assert adapter.poolmanager.connection_from_url(http_server) is pool
+
+        pool._put_conn(in_use)
+        conn.get("/data")
+        assert adapter.poolmanager.connection_from_url(http_server) is not pool
+        # Pools of other ports on the same host are left alone.
+        assert adapter.poolmanager.connection_from_url("http://127.0.0.1:1") is other
+
+    def test_shared_adapter(self, http_server):
+        adapter = PoolAdapter(pool_maxsize=2)
+        c1 = Connector(http_server, None, None, adapter=adapter)
+        c2 = Connector(http_server, None, None, adapter=adapter)
+        c1.get("/data")
+        c2.get("/data")
+        assert c1.pool_stats == (1, 2, 1)
+        assert c1.pool_stats == c2.pool_stats
+
+    def test_pool_size(self):
+        conn = Connector("https://demo.dev", None, None, pool_maxsize=32)
+        assert conn._client.get_adapter("https://demo.dev")._pool_maxsize == 32
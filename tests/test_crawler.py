@@ -0,0 +1,199 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import gzip
+import io
+import json
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from redfish_client.connector import Connector, Response
+from redfish_client.crawler import Crawler
+from redfish_client.exceptions import TimedOutException
+
+
+TREE = {
+    "/redfish/v1": {
+        "@odata.id": "/redfish/v1",
+        "Systems": {"@odata.id": "/redfish/v1/Systems"},
+        "Chassis": {"@odata.id": "/redfish/v1/Chassis/"},
+    },
+    "/redfish/v1/Systems": {
+        "@odata.id": "/redfish/v1/Systems",
+        "Members": [{"@odata.id": "/redfish/v1/Systems/1"}],
+        "Members@odata.nextLink": "/redfish/v1/Systems?$skip=1",
+    },
+    "/redfish/v1/Systems?$skip=1": {
+        "@odata.id": "/redfish/v1/Systems",
+        "Members": [{"@odata.id": "/redfish/v1/Systems/2"}],
+    },
+    "/redfish/v1/Systems/1": {
+        "@odata.id": "/redfish/v1/Systems/1",
+        "Links": {"Chassis": [{"@odata.id": "/redfish/v1/Chassis/1"}]},
+        "Thermal": {"@odata.id": "/redfish/v1/Systems/1#/Thermal"},
+    },
+    "/redfish/v1/Systems/2": {
+        "@odata.id": "/redfish/v1/Systems/2",
+        "Links": {"Chassis": [{"@odata.id": "https://bmc/redfish/v1/Chassis/1"}]},
+    },
+    "/redfish/v1/Chassis": {
+        "@odata.id": "/redfish/v1/Chassis",
+        "Members": [{"@odata.id": "/redfish/v1/Chassis/1"}],
+    },
+    "/redfish/v1/Chassis/1": {
+        "@odata.id": "/redfish/v1/Chassis/1",
+        "Links": {"ComputerSystems": [
+            {"@odata.id": "/redfish/v1/Systems/1"},
+            {"@odata.id": "/redfish/v1/Systems/2"},
+        ]},
+        "Sensors": {"@odata.id": "/redfish/v1/Chassis/1/Sensors"},
+    },
+}
+
+
+def build_connector(tree=TREE, delay=0, slow=()):
+    def get(path, cache=True):
+        time.sleep(0.1 if path in slow else delay)
+        if path not in tree:
+            return Response(404, {}, None, b"")
+        return Response(200, {}, tree[path], b"")
+
+    connector = mock.Mock(spec=Connector)
+    connector.get.side_effect = get
+    return connector
+
+
+class TestCrawl:
+    def test_crawl(self):
+        connector = build_connector()
+        results = list(Crawler(connector).crawl())
+        assert sorted((r.path, r.depth, r.status) for r in results) == [
+            ("/redfish/v1", 0, 200),
+            ("/redfish/v1/Chassis", 1, 200),
+            ("/redfish/v1/Chassis/1", 2, 200),
+            ("/redfish/v1/Chassis/1/Sensors", 3, 404),
+            ("/redfish/v1/Systems", 1, 200),
+            ("/redfish/v1/Systems/1", 2, 200),
+            ("/redfish/v1/Systems/2", 3, 200),
+            ("/redfish/v1/Systems?$skip=1", 2, 200),
+        ]
+        # Every path is fetched exactly once, bypassing the cache.
+        assert connector.get.call_count == 8
+        assert all(c[1] == dict(cache=False) for c in connector.get.call_args_list)
+
+    def test_breadth_first(self):
+        results = list(Crawler(build_connector(), max_workers=1).crawl())
+        depths = [r.depth for r in results]
+        assert depths == sorted(depths)
+
+    def test_shortest_depth(self):
+        # Systems/1 links to Chassis/1 before the slow Chassis collection is
+        # fetched, but Chassis/1 is still recorded one level below Chassis.
+        connector = build_connector(slow=("/redfish/v1/Chassis",))
+        depths = {r.path: r.depth for r in Crawler(connector).crawl()}
+        assert depths["/redfish/v1/Chassis/1"] == 2
+
+    def test_max_depth(self):
+        results = Crawler(build_connector(), max_depth=1).crawl()
+        assert sorted(r.path for r in results) == [
+            "/redfish/v1", "/redfish/v1/Chassis", "/redfish/v1/Systems",
+        ]
+
+    def test_include_exclude(self):
+        crawler = Crawler(
+            build_connector(), include=("/redfish/v1/Systems*",),
+            exclude=("*$skip=*",),
+        )
+        assert sorted(r.path for r in crawler.crawl()) == [
+            "/redfish/v1", "/redfish/v1/Systems", "/redfish/v1/Systems/1",
+        ]
+
+    def test_start(self):
+        results = Crawler(build_connector()).crawl("/redfish/v1/Chassis/1/")
+        assert sorted(r.path for r in results) == [
+            "/redfish/v1/Chassis/1", "/redfish/v1/Chassis/1/Sensors",
+            "/redfish/v1/Systems/1", "/redfish/v1/Systems/2",
+        ]
+
+    def test_errors(self):
+        connector = mock.Mock(spec=Connector)
+        connector.get.side_effect = TimedOutException("slow")
+        results = list(Crawler(connector).crawl())
+        assert results == [(
+            "/redfish/v1", 0, None, None, "slow",
+        )]
+
+    def test_bounded_concurrency(self):
+        tree = {"/redfish/v1": {"Members": [
+            {"@odata.id": "/redfish/v1/{}".format(i)} for i in range(20)
+        ]}}
+        lock = threading.Lock()
+        active, peak = [0], [0]
+
+        def get(path, cache=True):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            return Response(200, {}, tree.get(path, {}), b"")
+
+        connector = mock.Mock(spec=Connector)
+        connector.get.side_effect = get
+        assert len(list(Crawler(connector, max_workers=3).crawl())) == 21
+        assert peak[0] <= 3
+
+    def test_stop_early(self):
+        crawler = Crawler(build_connector(delay=0.01), max_workers=2)
+        results = crawler.crawl()
+        assert next(results).path == "/redfish/v1"
+        results.close()
+
+
+class TestSnapshot:
+    @staticmethod
+    def read(lines):
+        return {d["path"]: d for d in map(json.loads, lines)}
+
+    def test_jsonl(self, tmp_path):
+        path = tmp_path / "snapshot.jsonl"
+        assert Crawler(build_connector()).snapshot(str(path)) == 8
+        documents = self.read(path.read_text().splitlines())
+        assert documents["/redfish/v1/Systems/1"] == dict(
+            path="/redfish/v1/Systems/1", status=200, error=None,
+            document=TREE["/redfish/v1/Systems/1"],
+        )
+        assert documents["/redfish/v1/Chassis/1/Sensors"]["status"] == 404
+
+    @pytest.mark.parametrize("name,compress", [
+        ("snapshot.jsonl.gz", None), ("snapshot.bin", True),
+    ])
+    def test_gzip(self, tmp_path, name, compress):
+        path = tmp_path / name
+        Crawler(build_connector()).snapshot(str(path), compress=compress)
+        with gzip.open(str(path), "rt") as f:
+            assert len(self.read(f)) == 8
+
+    def test_file_object(self):
+        output = io.StringIO()
+        Crawler(build_connector()).snapshot(output, start="/redfish/v1/Chassis")
+        assert sorted(self.read(output.getvalue().splitlines())) == [
+            "/redfish/v1/Chassis", "/redfish/v1/Chassis/1",
+            "/redfish/v1/Chassis/1/Sensors", "/redfish/v1/Systems/1",
+            "/redfish/v1/Systems/2",
+        ]
@@ -0,0 +1,203 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import threading
+import urllib.request
+from unittest import mock
+
+import pytest
+
+from redfish_client.caching_connector import CachingConnector
+from redfish_client.events import EventListener
+from redfish_client.exceptions import SubscriptionException
+
+
+def event(*records):
+    return {"@odata.type": "#Event.v1_4_0.Event", "Events": list(records)}
+
+
+def send_event(url, payload):
+    # Fake event sender, playing the role of the service.
+    request = urllib.request.Request(
+        url, data=json.dumps(payload).encode("utf-8"), method="POST",
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return response.status
+
+
+def mock_event_service(mock):
+    mock.get("https://demo.dev/redfish/v1/EventService", json={
+        "@odata.id": "/redfish/v1/EventService",
+        "Subscriptions": {"@odata.id": "/redfish/v1/EventService/Subs"},
+    })
+    mock.post(
+        "https://demo.dev/redfish/v1/EventService/Subs", status_code=201,
+        headers={"Location": "https://demo.dev/redfish/v1/EventService/Subs/7"},
+    )
+    mock.delete(
+        "https://demo.dev/redfish/v1/EventService/Subs/7", status_code=204,
+    )
+
+
+@pytest.fixture
+def listener():
+    listener = EventListener(mock.Mock(spec=CachingConnector))
+    yield listener
+    listener.stop()
+
+
+class TestHandle:
+    def test_changed(self, listener):
+        listener.handle(event(dict(
+            MessageId="ResourceEvent.1.0.ResourceChanged",
+            OriginOfCondition={"@odata.id": "/redfish/v1/Systems/1"},
+        )))
+        listener._connector.reset.assert_has_calls([
+            mock.call("/redfish/v1/Systems/1"),
+            mock.call("/redfish/v1/Systems/1/"),
+        ])
+        assert listener._connector.reset.call_count == 2
+
+    def test_added_and_removed(self, listener):
+        listener.handle(event(
+            dict(EventType="ResourceAdded",
+                 OriginOfCondition="/redfish/v1/Sessions/2/"),
+            dict(MessageId="ResourceEvent.1.0.ResourceRemoved",
+                 OriginOfCondition={"@odata.id": "/redfish/v1/Tasks/3"}),
+        ))
+        paths = [c[0][0] for c in listener._connector.reset.call_args_list]
+        assert paths == [
+            "/redfish/v1/Sessions/2", "/redfish/v1/Sessions/2/",
+            "/redfish/v1/Sessions", "/redfish/v1/Sessions/",
+            "/redfish/v1/Tasks/3", "/redfish/v1/Tasks/3/",
+            "/redfish/v1/Tasks", "/redfish/v1/Tasks/",
+        ]
+
+    def test_ignored(self, listener):
+        listener.handle(event(
+            dict(MessageId="Base.1.0.Success",
+                 OriginOfCondition={"@odata.id": "/redfish/v1/Systems/1"}),
+            dict(MessageId="ResourceEvent.1.0.ResourceChanged"),
+        ))
+        listener.handle({})
+        listener._connector.reset.assert_not_called()
+
+    def test_callback(self):
+        callback = mock.Mock()
+        listener = EventListener(
+            mock.Mock(spec=CachingConnector), callback=callback,
+        )
+        listener.handle(event())
+        listener.stop()
+        callback.assert_called_once_with(event())
+
+
+class TestSubscription:
+    def test_subscribe(self, requests_mock):
+        mock_event_service(requests_mock)
+        conn = CachingConnector("https://demo.dev", None, None)
+        with EventListener(conn, context="ctx") as listener:
+            assert listener.subscription == "/redfish/v1/EventService/Subs/7"
+            subscription = requests_mock.request_history[1].json()
+            assert subscription == dict(
+                Destination="http://127.0.0.1:{}/".format(listener.port),
+                Protocol="Redfish",
+                Context="ctx",
+                RegistryPrefixes=["ResourceEvent"],
+            )
+        assert requests_mock.last_request.method == "DELETE"
+        assert listener.subscription is None
+
+    def test_subscribe_default_path(self, requests_mock):
+        requests_mock.get(
+            "https://demo.dev/redfish/v1/EventService", status_code=404,
+        )
+        requests_mock.post(
+            "https://demo.dev/redfish/v1/EventService/Subscriptions",
+            status_code=201, json={"@odata.id": "/subs/1"},
+        )
+        requests_mock.delete("https://demo.dev/subs/1", status_code=204)
+        conn = CachingConnector("https://demo.dev", None, None)
+        listener = EventListener(conn, destination="https://me:8443/events")
+        assert listener.subscribe() == "/subs/1"
+        assert requests_mock.last_request.json()["Destination"] == (
+            "https://me:8443/events"
+        )
+        listener.stop()
+        assert requests_mock.last_request.method == "DELETE"
+
+    def test_subscribe_event_types(self, requests_mock):
+        mock_event_service(requests_mock)
+        requests_mock.post("https://demo.dev/redfish/v1/EventService/Subs", [
+            dict(status_code=400),
+            dict(status_code=201, headers={"Location": "/subs/2"}),
+        ])
+        conn = CachingConnector("https://demo.dev", None, None)
+        listener = EventListener(conn)
+        assert listener.subscribe() == "/subs/2"
+        first, second = requests_mock.request_history[1:]
+        assert first.json()["RegistryPrefixes"] == ["ResourceEvent"]
+        assert "RegistryPrefixes" not in second.json()
+        assert second.json()["EventTypes"] == [
+            "ResourceUpdated", "ResourceAdded", "ResourceRemoved",
+        ]
+        requests_mock.delete("https://demo.dev/subs/2", status_code=204)
+        listener.stop()
+        assert requests_mock.last_request.url == "https://demo.dev/subs/2"
+
+    @pytest.mark.parametrize("status,posts", [(400, 2), (403, 1)])
+    def test_subscribe_fail(self, requests_mock, status, posts):
+        mock_event_service(requests_mock)
+        requests_mock.post(
+            "https://demo.dev/redfish/v1/EventService/Subs", status_code=status,
+        )
+        conn = CachingConnector("https://demo.dev", None, None)
+        with pytest.raises(SubscriptionException):
+            with EventListener(conn):
+                pass
+        assert [r.method for r in requests_mock.request_history].count(
+            "POST",
+        ) == posts
+
+
+class TestListener:
+    def test_invalidate_on_event(self, requests_mock):
+        mock_event_service(requests_mock)
+        requests_mock.get("https://demo.dev/redfish/v1/Systems/1", [
+            dict(json=dict(PowerState="Off")),
+            dict(json=dict(PowerState="On")),
+        ])
+        received = threading.Event()
+        conn = CachingConnector("https://demo.dev", None, None)
+        with EventListener(conn, callback=lambda e: received.set()) as listener:
+            assert conn.get("/redfish/v1/Systems/1").json["PowerState"] == "Off"
+            assert conn.get("/redfish/v1/Systems/1").json["PowerState"] == "Off"
+
+            status = send_event(listener.destination, event(dict(
+                MessageId="ResourceEvent.1.0.ResourceChanged",
+                OriginOfCondition={"@odata.id": "/redfish/v1/Systems/1"},
+            )))
+            assert status == 204
+            assert received.wait(5)
+            assert conn.get("/redfish/v1/Systems/1").json["PowerState"] == "On"
+
+    def test_invalid_payload(self, listener):
+        listener.start()
+        url = listener.destination
+        request = urllib.request.Request(url, data=b"nope", method="POST")
+        with urllib.request.urlopen(request, timeout=5) as response:
+            assert response.status == 204
+        listener._connector.reset.assert_not_called()
@@ -0,0 +1,122 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+import requests
+
+from redfish_client.exceptions import (
+    AuthException, InaccessibleException, TimedOutException,
+)
+from redfish_client.fleet import Fleet
+
+
+def mock_service(mock, base_url, power_state="On"):
+    mock.get(base_url + "/redfish/v1", status_code=200, json={
+        "@odata.id": "/redfish/v1",
+        "Systems": {"@odata.id": "/redfish/v1/Systems"},
+        "Links": {"Sessions": {"@odata.id": "/redfish/v1/Sessions"}},
+    })
+    mock.post(
+        base_url + "/redfish/v1/Sessions", status_code=201,
+        headers={"X-Auth-Token": "abc", "Location": "/redfish/v1/Sessions/1"},
+    )
+    mock.delete(base_url + "/redfish/v1/Sessions/1", status_code=204)
+    mock.get(base_url + "/redfish/v1/Systems", status_code=200, json={
+        "@odata.id": "/redfish/v1/Systems",
+        "Members": [{"@odata.id": "/redfish/v1/Systems/1"}],
+    })
+    mock.get(base_url + "/redfish/v1/Systems/1", status_code=200, json={
+        "@odata.id": "/redfish/v1/Systems/1",
+        "PowerState": power_state,
+    })
+
+
+@pytest.fixture
+def fleet(requests_mock):
+    mock_service(requests_mock, "https://bmc1", "On")
+    mock_service(requests_mock, "https://bmc2", "Off")
+    requests_mock.get(
+        "https://bmc3/redfish/v1", exc=requests.exceptions.ConnectionError,
+    )
+    requests_mock.get(
+        "https://bmc4/redfish/v1", exc=requests.exceptions.ReadTimeout,
+    )
+    mock_service(requests_mock, "https://bmc5")
+    requests_mock.post("https://bmc5/redfish/v1/Sessions", status_code=401)
+    return Fleet([
+        ("https://bmc{}".format(i), ("user", "pass")) for i in range(1, 6)
+    ], max_workers=2)
+
+
+class TestLogin:
+    def test_login(self, fleet):
+        results = fleet.login()
+        assert results["https://bmc1"].exception is None
+        assert results["https://bmc2"].exception is None
+        assert isinstance(results["https://bmc3"].exception, InaccessibleException)
+        assert isinstance(results["https://bmc4"].exception, TimedOutException)
+        assert isinstance(results["https://bmc5"].exception, AuthException)
+        assert sorted(fleet.roots) == ["https://bmc1", "https://bmc2"]
+
+    def test_login_skips_logged_in(self, fleet, requests_mock):
+        fleet.login()
+        calls = requests_mock.call_count
+        assert len(list(fleet.login())) == 3
+        assert requests_mock.call_count - calls == 4
+
+
+class TestRun:
+    def test_run_path(self, fleet):
+        results = {r.base_url: r for r in fleet.run("Systems/Members/0/PowerState")}
+        assert results["https://bmc1"].value == "On"
+        assert results["https://bmc2"].value == "Off"
+        assert results["https://bmc3"].value is None
+        assert isinstance(results["https://bmc3"].exception, InaccessibleException)
+
+    def test_run_callable(self, fleet):
+        results = {
+            r.base_url: r.value
+            for r in fleet.run(lambda root: root.Systems.Members[0].PowerState)
+        }
+        assert results["https://bmc1"] == "On"
+        assert results["https://bmc2"] == "Off"
+
+    def test_run_invalid_path(self, fleet):
+        results = {r.base_url: r for r in fleet.run("Systems/Invalid")}
+        assert isinstance(results["https://bmc1"].exception, KeyError)
+
+
+class TestLogout:
+    def test_context_manager_logout(self, fleet, requests_mock):
+        with fleet:
+            fleet.login()
+        assert fleet.roots == {}
+        deletes = [r for r in requests_mock.request_history if r.method == "DELETE"]
+        assert len(deletes) == 2
+
+    def test_logout(self, fleet, requests_mock):
+        fleet.login()
+        requests_mock.delete(
+            "https://bmc2/redfish/v1/Sessions/1",
+            exc=requests.exceptions.ConnectionError,
+        )
+        fleet.logout()  # Not iterating over the results must not matter
+        deletes = [r for r in requests_mock.request_history if r.method == "DELETE"]
+        assert len(deletes) == 2
+        assert list(fleet.roots) == ["https://bmc2"]
+
+        requests_mock.delete("https://bmc2/redfish/v1/Sessions/1", status_code=204)
+        results = fleet.logout()
+        assert results["https://bmc2"].exception is None
+        assert fleet.roots == {}
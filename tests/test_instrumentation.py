@@ -0,0 +1,156 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+
+import pytest
+import requests
+
+from redfish_client.caching_connector import CachingConnector
+from redfish_client.connector import Connector
+from redfish_client.exceptions import InaccessibleException
+from redfish_client.instrumentation import (
+    Histogram, Instrument, MetricsCollector, path_template,
+)
+
+
+class Recorder(Instrument):
+    def __init__(self):
+        self.before = []
+        self.after = []
+
+    def before_request(self, base_url, method, path):
+        self.before.append((base_url, method, path))
+
+    def after_request(self, event):
+        self.after.append(event)
+
+
+class TestPathTemplate:
+    @pytest.mark.parametrize("path,template", [
+        ("/redfish/v1", "/redfish/v1"),
+        ("/redfish/v1/Systems", "/redfish/v1/Systems"),
+        ("/redfish/v1/Systems/1/", "/redfish/v1/Systems/{id}"),
+        ("/redfish/v1/Systems/System.Embedded.1/Memory/DIMM2",
+         "/redfish/v1/Systems/{id}/Memory/{id}"),
+        ("/redfish/v1/Chassis/1/Power#/PowerControl/0",
+         "/redfish/v1/Chassis/{id}/Power"),
+        ("/redfish/v1/Systems?$top=2", "/redfish/v1/Systems"),
+    ])
+    def test_path_template(self, path, template):
+        assert path_template(path) == template
+
+
+class TestHistogram:
+    def test_observe(self):
+        histogram = Histogram(buckets=(0.1, 1, float("inf")))
+        for value in (0.05, 0.1, 0.5, 3):
+            histogram.observe(value)
+        assert histogram.as_dict() == dict(
+            count=4, sum=3.65, max=3,
+            buckets=[(0.1, 2), (1, 3), ("+Inf", 4)],
+        )
+        assert histogram.mean == pytest.approx(0.9125)
+
+
+class TestHooks:
+    def test_request_events(self, requests_mock):
+        requests_mock.get(
+            "https://demo.dev/data", status_code=200, json=dict(hello="fish"),
+        )
+        recorder = Recorder()
+        conn = Connector("https://demo.dev", "user", "pass", instruments=[recorder])
+        conn.get("/data")
+        assert recorder.before == [("https://demo.dev", "GET", "/data")]
+        event, = recorder.after
+        assert event.status == 200
+        assert event.size == len(b'{"hello": "fish"}')
+        assert event.elapsed >= 0
+        assert not event.relogin
+        assert not event.cached
+
+    def test_relogin_event(self, requests_mock):
+        requests_mock.get("https://demo.dev/data", [
+            dict(status_code=401), dict(status_code=200),
+        ])
+        requests_mock.post(
+            "https://demo.dev/sessions", status_code=201,
+            headers={"X-Auth-Token": "123", "Location": "/sessions/3"},
+        )
+        recorder = Recorder()
+        conn = Connector("https://demo.dev", "user", "pass")
+        conn.add_instrument(recorder)
+        conn.set_session_auth_data("/sessions")
+        conn.get("/data")
+        assert [e.relogin for e in recorder.after] == [True]
+
+    def test_cached_event(self, requests_mock):
+        requests_mock.get(
+            "https://demo.dev/data", status_code=200, json=dict(hello="fish"),
+        )
+        recorder = Recorder()
+        conn = CachingConnector("https://demo.dev", None, None, instruments=[recorder])
+        conn.get("/data")
+        conn.get("/data")
+        assert [e.cached for e in recorder.after] == [False, True]
+        assert requests_mock.call_count == 1
+
+    def test_error_event(self, requests_mock):
+        requests_mock.get(
+            "https://demo.dev/data", exc=requests.exceptions.ConnectionError,
+        )
+        recorder = Recorder()
+        conn = Connector("https://demo.dev", None, None, instruments=[recorder])
+        with pytest.raises(InaccessibleException):
+            conn.get("/data")
+        event, = recorder.after
+        assert event.status is None
+        assert event.size == 0
+
+    def test_broken_instrument(self, requests_mock):
+        class Broken(Instrument):
+            def after_request(self, event):
+                raise RuntimeError("broken")
+
+        requests_mock.get("https://demo.dev/data", status_code=200)
+        conn = Connector("https://demo.dev", None, None, instruments=[Broken()])
+        assert conn.get("/data").status == 200
+
+
+class TestMetricsCollector:
+    def test_collect(self, requests_mock):
+        requests_mock.get("https://bmc1/redfish/v1/Systems/1", status_code=200, text="ab")
+        requests_mock.get("https://bmc1/redfish/v1/Systems/2", status_code=404)
+        requests_mock.get("https://bmc2/redfish/v1/Systems/1", status_code=200, text="abc")
+        collector = MetricsCollector()
+        c1 = CachingConnector("https://bmc1", None, None, instruments=[collector])
+        c2 = Connector("https://bmc2", None, None, instruments=[collector])
+        c1.get("/redfish/v1/Systems/1")
+        c1.get("/redfish/v1/Systems/1")
+        c1.get("/redfish/v1/Systems/2")
+        c2.get("/redfish/v1/Systems/1")
+
+        snapshot = collector.snapshot()
+        json.dumps(snapshot)  # Must be exportable
+        systems = snapshot["paths"]["GET /redfish/v1/Systems/{id}"]
+        assert systems["latency"]["count"] == 4
+        assert systems["bytes"] == 7
+        assert systems["cached"] == 1
+        assert systems["statuses"] == {200: 3, 404: 1}
+        assert snapshot["hosts"]["https://bmc1"]["latency"]["count"] == 3
+        assert snapshot["hosts"]["https://bmc2"]["bytes"] == 3
+        assert [k for k, _ in collector.slowest()] == ["GET /redfish/v1/Systems/{id}"]
+
+        collector.reset()
+        assert collector.snapshot() == dict(paths={}, hosts={})
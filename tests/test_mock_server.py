@@ -0,0 +1,244 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import http.client
+import json
+import subprocess
+import sys
+import time
+from urllib.parse import urlparse
+
+import pytest
+
+from redfish_client.connector import Connector
+from redfish_client.exceptions import AuthException
+from redfish_client.mock_server import (
+    MockServer, generate_documents, load_mockup,
+)
+from redfish_client.root import Root
+
+
+@pytest.fixture
+def mock_server():
+    with MockServer() as server:
+        yield server
+
+
+def login(server, **kwargs):
+    connector = Connector(server.url, "user", "pass", **kwargs)
+    root = Root(connector, oid="/redfish/v1")
+    root.login()
+    return root
+
+
+def raw_request(server, method="GET", path="/redfish/v1/Systems", body=None,
+                headers=None):
+    url = urlparse(server.url)
+    conn = http.client.HTTPConnection(url.hostname, url.port)
+    conn.request(method, path, body=body, headers=headers or {})
+    return conn, conn.getresponse()
+
+
+class TestDocuments:
+    def test_generated(self, mock_server):
+        root = login(mock_server)
+        assert [s.PowerState for s in root.Systems.Members] == ["On"] * 4
+
+    def test_documents(self):
+        documents = generate_documents(1)
+        documents["/redfish/v1/Systems?$top=1"] = dict(Members=[])
+        with MockServer(documents=documents) as server:
+            root = login(server)
+            connector = root._connector
+            assert connector.get("/redfish/v1/Systems/").json["Members"]
+            assert connector.get("/redfish/v1/Systems?$top=1").json == dict(
+                Members=[],
+            )
+            assert connector.get("/redfish/v1/Systems?$top=2").json[
+                "Members@odata.count"
+            ] == 1
+            assert connector.get("/redfish/v1/Chassis").status == 404
+
+    @pytest.mark.parametrize("prefix", ["", "redfish/v1"])
+    def test_mockup(self, tmp_path, prefix):
+        for path, document in generate_documents(2).items():
+            directory = tmp_path / prefix / path[len("/redfish/v1/"):]
+            directory.mkdir(parents=True, exist_ok=True)
+            (directory / "index.json").write_text(json.dumps(document))
+
+        documents = load_mockup(str(tmp_path))
+        assert documents == generate_documents(2)
+        with MockServer(mockup=str(tmp_path)) as server:
+            assert len(login(server).Systems.Members) == 2
+
+    def test_changes(self, mock_server):
+        connector = login(mock_server)._connector
+        resp = connector.patch(
+            "/redfish/v1/Systems/1", payload=dict(PowerState="Off"),
+        )
+        assert resp.status == 200
+        assert connector.get("/redfish/v1/Systems/1").json["PowerState"] == "Off"
+
+        resp = connector.post("/redfish/v1/Systems", payload=dict(Name="New"))
+        assert resp.status == 201
+        assert resp.headers["location"] == "/redfish/v1/Systems/5"
+        assert connector.get("/redfish/v1/Systems/5").json["Name"] == "New"
+
+        assert connector.delete("/redfish/v1/Systems/5").status == 204
+        assert connector.get("/redfish/v1/Systems/5").status == 404
+        assert connector.post("/redfish/v1/Systems/1").status == 405
+
+    @pytest.mark.parametrize("method,path", [
+        ("PATCH", "/redfish/v1/Systems/1"), ("POST", "/redfish/v1/Systems"),
+    ])
+    @pytest.mark.parametrize("body", [b"{", b"[]", b"\xff"])
+    def test_malformed_body(self, mock_server, method, path, body):
+        _, resp = raw_request(
+            mock_server, method, path, body=body,
+            headers={"Authorization": "Basic dXNlcjpwYXNz"},
+        )
+        assert resp.status == 400
+        assert json.loads(resp.read())["error"]["code"] == (
+            "Base.1.0.MalformedJSON"
+        )
+        assert len(login(mock_server).Systems.Members) == 4
+
+
+class TestAuth:
+    def test_unauthenticated(self, mock_server):
+        _, resp = raw_request(mock_server, path="/redfish/v1")
+        assert resp.status == 200
+        _, resp = raw_request(mock_server)
+        assert resp.status == 401
+
+    def test_basic(self):
+        documents = generate_documents(1)
+        del documents["/redfish/v1"]["Links"]
+        with MockServer(documents=documents) as server:
+            assert login(server).Systems.Members[0].PowerState == "On"
+            assert server.stats.sessions == 0
+
+    def test_invalid_credentials(self, mock_server):
+        connector = Connector(mock_server.url, "user", "wrong")
+        with pytest.raises(AuthException):
+            Root(connector, oid="/redfish/v1").login()
+
+    def test_sessions(self, mock_server):
+        root = login(mock_server)
+        assert mock_server.stats.sessions == 1
+        sessions = root._connector.get("/redfish/v1/SessionService/Sessions")
+        assert sessions.json["Members"] == [
+            {"@odata.id": "/redfish/v1/SessionService/Sessions/1"},
+        ]
+        root.logout()
+        assert mock_server.stats.sessions == 0
+
+    def test_session_limit(self):
+        with MockServer(max_sessions=1) as server:
+            login(server)
+            with pytest.raises(AuthException):
+                login(server)
+
+    def test_token_expiry(self):
+        with MockServer(session_timeout=0.05) as server:
+            connector = login(server)._connector
+            token = connector.session_auth_data[2]
+            assert connector.get("/redfish/v1/Systems").status == 200
+            time.sleep(0.1)
+            # Connector logs in again after the 401 response.
+            assert connector.get("/redfish/v1/Systems").status == 200
+            assert connector.session_auth_data[2] != token
+            assert server.stats.sessions == 1
+
+    def test_expire_sessions(self, mock_server):
+        root = login(mock_server)
+        mock_server.expire_sessions()
+        assert root._connector.get("/redfish/v1/Systems").status == 200
+        assert mock_server.stats.sessions == 1
+
+
+class TestFaults:
+    def test_latency(self):
+        with MockServer(latency=0.1) as server:
+            start = time.monotonic()
+            raw_request(server, path="/redfish/v1")
+            assert time.monotonic() - start >= 0.1
+
+    def test_latency_function(self):
+        def latency(method, path):
+            return 0.1 if path.endswith("$top=1") else 0
+
+        with MockServer(latency=latency) as server:
+            start = time.monotonic()
+            raw_request(server, path="/redfish/v1")
+            assert time.monotonic() - start < 0.1
+            raw_request(server, path="/redfish/v1?$top=1")
+            assert time.monotonic() - start >= 0.1
+
+    def test_bandwidth(self):
+        documents = {"/redfish/v1": dict(Data="x" * 2000)}
+        with MockServer(documents=documents, bandwidth=10000) as server:
+            start = time.monotonic()
+            _, resp = raw_request(server, path="/redfish/v1")
+            assert len(json.loads(resp.read())["Data"]) == 2000
+            assert time.monotonic() - start >= 0.15
+
+    def test_max_connections(self):
+        with MockServer(max_connections=1, retry_after=3) as server:
+            first, resp = raw_request(server, path="/redfish/v1")
+            resp.read()
+            second, resp = raw_request(server, path="/redfish/v1")
+            assert resp.status == 503
+            assert resp.getheader("Retry-After") == "3"
+            assert resp.getheader("Connection") == "close"
+
+            second.close()
+            first.close()
+            time.sleep(0.05)
+            _, resp = raw_request(server, path="/redfish/v1")
+            assert resp.status == 200
+            assert server.stats.rejected == 1
+            assert server.stats.peak_connections == 1
+
+    def test_connection_reset(self, mock_server, capsys):
+        for error in ConnectionResetError, BrokenPipeError, ValueError:
+            try:
+                raise error()
+            except Exception:
+                mock_server._server.handle_error(None, ("127.0.0.1", 1))
+        assert capsys.readouterr().err.count("Traceback") == 1
+
+    def test_error_rate(self):
+        with MockServer(error_rate=0.5, seed=1) as server:
+            statuses = [
+                raw_request(server, path="/redfish/v1")[1].status
+                for _ in range(20)
+            ]
+            assert set(statuses) == {200, 503}
+            assert server.stats.rejected == statuses.count(503)
+
+    def test_stats(self, mock_server):
+        login(mock_server).Systems.Members[0].PowerState
+        stats = mock_server.stats
+        assert stats.requests == 4
+        assert stats.sessions == 1
+
+
+class TestCommand:
+    def test_help(self):
+        result = subprocess.run(
+            [sys.executable, "-m", "redfish_client.mock_server", "--help"],
+            stdout=subprocess.PIPE, check=True,
+        )
+        assert b"--max-connections" in result.stdout
@@ -0,0 +1,108 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from redfish_client.query import (
+    Filter, add_query, eq, expand_query, ge, gt, le, lt, ne,
+)
+
+
+class TestAddQuery:
+    def test_no_params(self):
+        assert add_query("/a", {}) == "/a"
+        assert add_query("/a", None) == "/a"
+
+    def test_params(self):
+        assert add_query("/a", {"$expand": ".($levels=2)", "$top": 5}) == (
+            "/a?$expand=.($levels=2)&$top=5"
+        )
+
+    def test_existing_query(self):
+        assert add_query("/a?$skip=5", {"$top": 5}) == "/a?$skip=5&$top=5"
+
+    def test_escape(self):
+        assert add_query("/a", {"$filter": "Id eq 'a&b'"}) == (
+            "/a?$filter=Id%20eq%20'a%26b'"
+        )
+
+
+class TestExpandQuery:
+    @pytest.mark.parametrize("features,levels,query", [
+        (None, 1, None),
+        ({}, 1, None),
+        ({"ExpandQuery": {"ExpandAll": False, "NoLinks": False}}, 1, None),
+        ({"ExpandQuery": {"NoLinks": True}}, 2, "."),
+        ({"ExpandQuery": {"ExpandAll": True}}, 1, "*"),
+        ({"ExpandQuery": {"NoLinks": True, "Levels": True}}, 4, ".($levels=4)"),
+        ({"ExpandQuery": {
+            "NoLinks": True, "Levels": True, "MaxLevels": 2,
+        }}, 4, ".($levels=2)"),
+    ])
+    def test_expand_query(self, features, levels, query):
+        assert expand_query(features, levels) == query
+
+
+class TestFilter:
+    DRIVE = {
+        "Name": "Drive 1",
+        "CapacityBytes": 1000,
+        "Status": {"Health": "Critical", "State": "Enabled"},
+        "FailurePredicted": True,
+    }
+
+    @pytest.mark.parametrize("expression,rendered", [
+        (eq("Status/Health", "OK"), "Status/Health eq 'OK'"),
+        (ne("Name", "It's"), "Name ne 'It''s'"),
+        (gt("CapacityBytes", 10), "CapacityBytes gt 10"),
+        (ge("Reading", 1.5), "Reading ge 1.5"),
+        (lt("Count", 3), "Count lt 3"),
+        (le("FailurePredicted", False), "FailurePredicted le false"),
+        (eq("Location", None), "Location eq null"),
+        (
+            eq("Status/Health", "Critical") | (gt("A", 1) & lt("A", 5)),
+            "(Status/Health eq 'Critical' or (A gt 1 and A lt 5))",
+        ),
+    ])
+    def test_expression(self, expression, rendered):
+        assert expression.expression() == rendered
+        assert str(expression) == rendered
+
+    @pytest.mark.parametrize("expression,result", [
+        (eq("Status/Health", "Critical"), True),
+        (eq("Status/Health", "OK"), False),
+        (ne("Status/Health", "OK"), True),
+        (gt("CapacityBytes", 999), True),
+        (ge("CapacityBytes", 1000), True),
+        (lt("CapacityBytes", 1000), False),
+        (le("CapacityBytes", 1000), True),
+        (eq("FailurePredicted", True), True),
+        (eq("Missing/Property", None), True),
+        (ne("Missing", "x"), True),
+        (gt("Missing", 1), False),
+        (gt("Name", 1), False),
+        (eq("Name/Nested", "x"), False),
+        (eq("Status/Health", "OK") | eq("Name", "Drive 1"), True),
+        (eq("Status/Health", "OK") & eq("Name", "Drive 1"), False),
+    ])
+    def test_matches(self, expression, result):
+        assert expression.matches(self.DRIVE) is result
+
+    def test_abstract(self):
+        class Incomplete(Filter):
+            def expression(self):
+                return "true"
+
+        with pytest.raises(TypeError):
+            Incomplete()
@@ -0,0 +1,214 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import io
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+import pytest
+
+from redfish_client.caching_connector import CachingConnector
+from redfish_client.recording import (
+    Exchange, RecordingAdapter, RecordingConnector, ReplayAdapter,
+    ReplayConnector, load_recording,
+)
+from redfish_client.root import Root
+
+
+DOCUMENTS = {
+    "/redfish/v1": {
+        "@odata.id": "/redfish/v1",
+        "Links": {"Sessions": {"@odata.id": "/redfish/v1/Sessions"}},
+        "Systems": {"@odata.id": "/redfish/v1/Systems"},
+    },
+    "/redfish/v1/Systems": {
+        "@odata.id": "/redfish/v1/Systems",
+        "Members": [{"@odata.id": "/redfish/v1/Systems/1"}],
+    },
+    "/redfish/v1/Systems/1": {
+        "@odata.id": "/redfish/v1/Systems/1", "PowerState": "On",
+    },
+}
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, status, data=None, headers=None):
+        body = json.dumps(data).encode("utf-8") if data is not None else b""
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/binary":
+            self.send_response(200)
+            self.send_header("Content-Length", "3")
+            self.end_headers()
+            self.wfile.write(b"\xff\x00\xfe")
+        elif self.path in DOCUMENTS:
+            time.sleep(0.05 if self.path == "/redfish/v1/Systems/1" else 0)
+            self._send(200, DOCUMENTS[self.path])
+        else:
+            self._send(404)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self._send(201, {"@odata.id": "/redfish/v1/Sessions/1"}, {
+            "X-Auth-Token": "secret-token",
+            "Location": "/redfish/v1/Sessions/1",
+        })
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs=dict(poll_interval=0.01), daemon=True,
+    )
+    thread.start()
+    yield "http://127.0.0.1:{}".format(server.server_port)
+    server.shutdown()
+    server.server_close()
+
+
+def record(base_url, output):
+    connector = RecordingConnector(base_url, "user", "pass", output=output)
+    root = Root(connector, oid="/redfish/v1")
+    root.login()
+    [system] = root.Systems.Members
+    assert system.PowerState == "On"
+    connector.close()
+
+
+class TestRecording:
+    def test_record(self, http_server, tmp_path):
+        path = tmp_path / "traffic.jsonl"
+        record(http_server, str(path))
+
+        exchanges = load_recording(str(path))
+        assert [(e.method, e.url[len(http_server):], e.status) for e in exchanges] == [
+            ("GET", "/redfish/v1", 200),
+            ("POST", "/redfish/v1/Sessions", 201),
+            ("GET", "/redfish/v1/Systems", 200),
+            ("GET", "/redfish/v1/Systems/1", 200),
+        ]
+        assert json.loads(exchanges[3].body) == DOCUMENTS["/redfish/v1/Systems/1"]
+        assert exchanges[3].elapsed >= 0.05
+        starts = [e.start for e in exchanges]
+        assert starts == sorted(starts)
+
+    def test_no_credentials(self, http_server, tmp_path):
+        path = tmp_path / "traffic.jsonl"
+        record(http_server, str(path))
+        content = path.read_text()
+        assert "secret-token" not in content
+        assert "pass" not in content
+
+    def test_gzip(self, http_server, tmp_path):
+        path = tmp_path / "traffic.jsonl.gz"
+        record(http_server, str(path))
+        assert len(load_recording(str(path))) == 4
+
+    def test_binary_body(self, http_server):
+        output = io.StringIO()
+        adapter = RecordingAdapter(output)
+        conn = CachingConnector(http_server, "", "", adapter=adapter)
+        assert conn.get("/binary").raw == b"\xff\x00\xfe"
+        conn.get("/binary")  # Cached, so it is not recorded
+
+        [line] = output.getvalue().splitlines()
+        assert "body_base64" in json.loads(line)
+
+        replay = ReplayConnector(load_recording(io.StringIO(output.getvalue())))
+        assert replay.get("/binary").raw == b"\xff\x00\xfe"
+
+
+class TestReplay:
+    @pytest.fixture
+    def recording(self, http_server, tmp_path):
+        path = tmp_path / "traffic.jsonl"
+        record(http_server, str(path))
+        return str(path)
+
+    def test_replay(self, recording):
+        connector = ReplayConnector(recording, username="user", password="pass")
+        root = Root(connector, oid="/redfish/v1")
+        root.login()
+        assert connector.session_auth_data == (
+            "/redfish/v1/Sessions", "/redfish/v1/Sessions/1", "***",
+        )
+        [system] = root.Systems.Members
+        assert system.PowerState == "On"
+        assert connector.pool_stats.connections == 0
+
+    def test_base_url(self, recording, http_server):
+        assert ReplayConnector(recording)._base_url == http_server
+        connector = ReplayConnector(recording, base_url="https://other")
+        assert connector.get("/redfish/v1/Systems").status == 200
+
+    def test_full_speed(self, recording):
+        connector = ReplayConnector(recording)
+        start = time.monotonic()
+        for _ in range(5):
+            connector.get("/redfish/v1/Systems/1")
+        assert time.monotonic() - start < 0.05
+
+    def test_latency(self, recording):
+        connector = ReplayConnector(recording, latency=1)
+        start = time.monotonic()
+        connector.get("/redfish/v1/Systems/1")
+        assert time.monotonic() - start >= 0.05
+
+    def test_unknown_request(self, recording):
+        connector = ReplayConnector(recording)
+        assert connector.get("/redfish/v1/Chassis").status == 404
+        assert connector.delete("/redfish/v1/Systems/1").status == 404
+
+    def test_order(self):
+        exchanges = [
+            Exchange("GET", "https://bmc/a", status, {}, b"", 0, 0)
+            for status in (503, 200)
+        ]
+        connector = ReplayConnector(exchanges)
+        assert [connector.get("/a").status for _ in range(3)] == [503, 200, 200]
+
+    def test_stream(self):
+        exchanges = [Exchange(
+            "GET", "https://bmc/sse", 200, {"Content-Type": "text/event-stream"},
+            b"id: 1\ndata: {}\n\n", 0, 0,
+        )]
+        connector = ReplayConnector(exchanges)
+        assert list(connector.stream("/sse")) == [b"id: 1", b"data: {}", b""]
+
+    def test_caching_connector(self, recording):
+        connector = CachingConnector(
+            "https://bmc", "", "", adapter=ReplayAdapter(recording),
+        )
+        for _ in range(3):
+            connector.get("/redfish/v1/Systems/1")
+        assert connector.pool_stats.requests == 1
@@ -16,10 +16,14 @@ from unittest import mock
 
 import pytest
 
+from redfish_client.caching_connector import CachingConnector
 from redfish_client.connector import Connector, Response
 from redfish_client.exceptions import (BlacklistedValueException,
     MissingOidException, TimedOutException, ResourceNotFound)
+from redfish_client.mock_server import MockServer
+from redfish_client.query import eq, gt
 from redfish_client.resource import Resource
+from redfish_client.root import Root
 
 
 class TestGetKey:
@@ -340,3 +344,621 @@ class TestLazyResource:
         assert len(connector.get.call_args_list) == 2
         assert connector.get.call_args_list[0][0] == ("parent",)
         assert connector.get.call_args_list[1][0] == ("child_0",)
+
+
+class TestPrefetch:
+    @staticmethod
+    def build_connector(count):
+        def get(path):
+            if path == "parent":
+                return Response(200, {}, {
+                    "@odata.id": "parent",
+                    "Members": [
+                        {"@odata.id": "child_{}".format(i)} for i in range(count)
+                    ],
+                    "Links": {"Chassis": {"@odata.id": "chassis"}},
+                }, b"")
+            return Response(200, {}, {"@odata.id": path, "Name": path}, b"")
+
+        connector = mock.Mock(spec=Connector)
+        connector.get.side_effect = get
+        return connector
+
+    def test_prefetch_members(self):
+        connector = self.build_connector(20)
+        members = Resource(connector, oid="parent").prefetch(max_workers=4)
+        assert [m._is_stub for m in members] == [False] * 20
+        assert [m.Name for m in members] == ["child_{}".format(i) for i in range(20)]
+        assert connector.get.call_count == 21
+
+    def test_members_after_prefetch(self):
+        connector = self.build_connector(5)
+        collection = Resource(connector, oid="parent")
+        collection.prefetch()
+        for _ in range(2):
+            assert [m.Name for m in collection.Members] == [
+                "child_{}".format(i) for i in range(5)
+            ]
+        assert collection.Links.Chassis.Name == "chassis"
+        collection.prefetch("Links/Chassis")
+        assert connector.get.call_count == 7
+
+    def test_prefetch_paths(self):
+        connector = self.build_connector(2)
+        resources = Resource(connector, oid="parent").prefetch(
+            "Links/Chassis", "Members/1",
+        )
+        assert [r.Name for r in resources] == ["chassis", "child_1"]
+        assert connector.get.call_count == 3
+
+    def test_prefetch_not_found(self):
+        connector = mock.Mock(spec=Connector)
+        connector.get.return_value = Response(404, {}, None, b"missing")
+        with pytest.raises(ResourceNotFound):
+            Resource(connector, data={
+                "@odata.id": "parent", "Members": [{"@odata.id": "child"}],
+            }).prefetch()
+
+
+class TestExpand:
+    FEATURES = {"ExpandQuery": {
+        "ExpandAll": True, "Levels": True, "Links": True, "NoLinks": True,
+        "MaxLevels": 3,
+    }}
+
+    @staticmethod
+    def member(i):
+        return {
+            "@odata.id": "/Systems/{}".format(i),
+            "Name": "System {}".format(i),
+            "Status": {"Health": "OK"},
+            "Processors": {"@odata.id": "/Systems/{}/Processors".format(i)},
+        }
+
+    def build_connector(self, count, features=FEATURES, status=200):
+        def get(path, cache=True):
+            if "$expand" in path:
+                return Response(status, {}, {
+                    "@odata.id": "/Systems",
+                    "Members": [self.member(i) for i in range(count)],
+                }, b"")
+            if path == "/Systems":
+                return Response(200, {}, {
+                    "@odata.id": "/Systems",
+                    "Members": [
+                        {"@odata.id": "/Systems/{}".format(i)}
+                        for i in range(count)
+                    ],
+                }, b"")
+            return Response(200, {}, self.member(path.rsplit("/", 1)[1]), b"")
+
+        connector = mock.Mock(spec=Connector)
+        connector.protocol_features = features
+        connector.get.side_effect = get
+        return connector
+
+    def test_expand(self):
+        connector = self.build_connector(3)
+        systems = Resource(connector, oid="/Systems").expand()
+        assert [m.Name for m in systems.Members] == [
+            "System 0", "System 1", "System 2",
+        ]
+        assert systems.Members[1].Status.Health == "OK"
+        connector.get.assert_called_once_with(
+            "/Systems?$expand=.($levels=1)", cache=False,
+        )
+        assert connector.seed.call_args_list == [
+            mock.call("/Systems/{}".format(i), self.member(i)) for i in range(3)
+        ]
+
+    def test_links_stay_lazy(self):
+        connector = self.build_connector(1)
+        systems = Resource(connector, oid="/Systems").expand()
+        processors = systems.Members[0].Processors
+        assert processors._is_stub
+        assert connector.get.call_count == 1
+
+    def test_levels(self):
+        connector = self.build_connector(1)
+        Resource(connector, oid="/Systems").expand(levels=5)
+        connector.get.assert_called_once_with(
+            "/Systems?$expand=.($levels=3)", cache=False,
+        )
+
+    def test_no_levels(self):
+        connector = self.build_connector(1, features={
+            "ExpandQuery": {"ExpandAll": True, "Levels": False},
+        })
+        Resource(connector, oid="/Systems").expand(levels=2)
+        connector.get.assert_called_once_with(
+            "/Systems?$expand=*", cache=False,
+        )
+
+    @pytest.mark.parametrize("features,status", [
+        ({}, 200),
+        ({"ExpandQuery": {"ExpandAll": False, "NoLinks": False}}, 200),
+        (FEATURES, 501),
+    ])
+    def test_fallback(self, features, status):
+        connector = self.build_connector(4, features=features, status=status)
+        Resource(connector, oid="/Systems").expand()
+        paths = sorted(c[0][0] for c in connector.get.call_args_list)
+        assert [p for p in paths if "$expand" not in p] == [
+            "/Systems", "/Systems/0", "/Systems/1", "/Systems/2", "/Systems/3",
+        ]
+        connector.seed.assert_not_called()
+
+    def test_not_lazy(self):
+        connector = self.build_connector(2)
+        systems = Resource(connector, oid="/Systems", lazy=False)
+        systems.expand()
+        assert systems.Members[1].Name == "System 1"
+        assert connector.get.call_count == 2
+
+    def test_refresh(self):
+        connector = self.build_connector(2)
+        systems = Resource(connector, oid="/Systems").expand()
+        systems.refresh()
+        assert systems.Members[0]._is_stub
+
+    def test_not_cached(self):
+        with MockServer() as server:
+            connector = CachingConnector(server.url, "user", "pass")
+            root = Root(connector, oid="/redfish/v1")
+            root.login()
+            connector.set_protocol_features({"ExpandQuery": {"ExpandAll": True}})
+            systems = root.Systems.expand()
+            assert len(systems.Members) == 4
+
+            systems.post({"Name": "New"})
+            systems.refresh()
+            assert len(systems.expand().Members) == 5
+
+    def test_missing_oid(self):
+        with pytest.raises(MissingOidException):
+            Resource(None, data={}).expand()
+
+    def test_root_login_features(self):
+        connector = mock.Mock(spec=Connector)
+        connector.get.return_value = Response(200, {}, {
+            "@odata.id": "/redfish/v1",
+            "ProtocolFeaturesSupported": self.FEATURES,
+            "Systems": {"@odata.id": "/redfish/v1/Systems"},
+            "Links": {"Sessions": {"@odata.id": "/redfish/v1/Sessions"}},
+        }, b"")
+        Root(connector, oid="/redfish/v1").login()
+        connector.set_protocol_features.assert_called_once_with(self.FEATURES)
+
+
+class TestSelect:
+    SYSTEM = {
+        "@odata.id": "/Systems/1",
+        "Name": "System",
+        "PowerState": "On",
+        "Status": {"Health": "OK", "State": "Enabled"},
+        "Memory": {"@odata.id": "/Systems/1/Memory"},
+    }
+
+    def build_connector(self, features={"SelectQuery": True}, status=200):
+        def get(path, cache=True):
+            if "?$select=" in path:
+                path, properties = path.split("?$select=")
+                return Response(status, {}, dict(
+                    {"@odata.id": path},
+                    **{p: self.SYSTEM[p] for p in properties.split(",")}
+                ), b"")
+            return Response(200, {}, self.SYSTEM, b"")
+
+        connector = mock.Mock(spec=Connector)
+        connector.protocol_features = features
+        connector.get.side_effect = get
+        return connector
+
+    def test_select(self):
+        connector = self.build_connector()
+        system = Resource(connector, oid="/Systems/1")
+        assert system.select("PowerState", "Status") is system
+        assert system.PowerState == "On"
+        assert system.Status.Health == "OK"
+        assert system.dig("Status", "State") == "Enabled"
+        connector.get.assert_called_once_with(
+            "/Systems/1?$select=PowerState,Status", cache=False,
+        )
+
+    def test_load_rest(self):
+        connector = self.build_connector()
+        system = Resource(connector, oid="/Systems/1").select("PowerState")
+        assert system.Name == "System"
+        assert system.raw == self.SYSTEM
+        assert connector.get.call_args_list[1] == mock.call("/Systems/1")
+        assert system.PowerState == "On"
+        assert connector.get.call_count == 2
+
+    def test_raw_is_never_partial(self):
+        connector = self.build_connector()
+        system = Resource(connector, oid="/Systems/1").select("PowerState")
+        assert system.raw == self.SYSTEM
+
+    @pytest.mark.parametrize("features,status", [
+        ({}, 200),
+        ({"SelectQuery": False}, 200),
+        ({"SelectQuery": True}, 400),
+    ])
+    def test_fallback(self, features, status):
+        connector = self.build_connector(features=features, status=status)
+        system = Resource(connector, oid="/Systems/1").select("PowerState")
+        assert system.Name == "System"
+        assert connector.get.call_args_list[-1] == mock.call("/Systems/1")
+        assert connector.get.call_count == (2 if status != 200 else 1)
+
+    @pytest.mark.parametrize("body", [None, ["On"]])
+    def test_not_an_object(self, body):
+        connector = mock.Mock(spec=Connector)
+        connector.protocol_features = {"SelectQuery": True}
+        connector.get.side_effect = [
+            Response(200, {}, body, b""), Response(200, {}, self.SYSTEM, b""),
+        ]
+        system = Resource(connector, oid="/Systems/1").select("PowerState")
+        assert system.PowerState == "On"
+        assert system.Name == "System"
+        assert connector.get.call_args_list[-1] == mock.call("/Systems/1")
+        assert connector.get.call_count == 2
+
+    def test_loaded(self):
+        connector = self.build_connector()
+        system = Resource(connector, oid="/Systems/1", lazy=False)
+        system.select("PowerState")
+        assert system.Name == "System"
+        assert connector.get.call_count == 1
+
+    def test_refresh(self):
+        connector = self.build_connector()
+        system = Resource(connector, oid="/Systems/1").select("PowerState")
+        system.refresh()
+        assert system.Name == "System"
+        assert connector.get.call_args_list[-1] == mock.call("/Systems/1")
+
+    def test_not_cached(self):
+        with MockServer() as server:
+            connector = CachingConnector(server.url, "user", "pass")
+            root = Root(connector, oid="/redfish/v1")
+            root.login()
+            connector.set_protocol_features({"SelectQuery": True})
+            system = root.find("/redfish/v1/Systems/1").select("PowerState")
+            assert system.PowerState == "On"
+
+            system.patch({"PowerState": "Off"})
+            system.refresh()
+            assert system.select("PowerState").PowerState == "Off"
+
+    def test_nested(self):
+        with pytest.raises(ValueError):
+            Resource(None, oid="/Systems/1").select("Status/Health")
+
+    def test_prefetch(self):
+        connector = self.build_connector()
+        collection = Resource(connector, data={"Members": [
+            {"@odata.id": "/Systems/1"}, {"@odata.id": "/Systems/2"},
+        ]})
+        members = collection.prefetch(select=["PowerState"])
+        assert [m.PowerState for m in members] == ["On", "On"]
+        assert sorted(c[0][0] for c in connector.get.call_args_list) == [
+            "/Systems/1?$select=PowerState", "/Systems/2?$select=PowerState",
+        ]
+
+
+class TestIterMembers:
+    @staticmethod
+    def entry(i):
+        return {"@odata.id": "/Entries/{}".format(i), "Id": str(i)}
+
+    def next_link_connector(self, pages, per_page, absolute=False):
+        def get(path, cache=True):
+            page = int(path.split("page=")[1]) if "page=" in path else 0
+            start = page * per_page
+            data = {
+                "@odata.id": "/Entries",
+                "Members": [self.entry(i) for i in range(start, start + per_page)],
+            }
+            if page + 1 < pages:
+                link = "/Entries?page={}".format(page + 1)
+                if absolute:
+                    link = "https://demo.dev" + link
+                data["Members@odata.nextLink"] = link
+            return Response(200, {}, data, b"")
+
+        connector = mock.Mock(spec=Connector)
+        connector.get.side_effect = get
+        return connector
+
+    def skip_connector(self, count, per_page):
+        def get(path, cache=True):
+            query = dict(
+                q.split("=") for q in path.partition("?")[2].split("&") if q
+            )
+            skip = int(query.get("$skip", 0))
+            top = int(query.get("$top", per_page))
+            return Response(200, {}, {
+                "@odata.id": "/Entries",
+                "Members@odata.count": count,
+                "Members": [
+                    self.entry(i) for i in range(skip, min(skip + top, count))
+                ],
+            }, b"")
+
+        connector = mock.Mock(spec=Connector)
+        connector.get.side_effect = get
+        return connector
+
+    @staticmethod
+    def ids(resources):
+        return [int(r.Id) for r in resources]
+
+    @pytest.mark.parametrize("read_ahead", [0, 1, 3])
+    def test_next_link(self, read_ahead):
+        connector = self.next_link_connector(pages=4, per_page=3)
+        entries = Resource(connector, oid="/Entries")
+        assert self.ids(entries.iter_members(read_ahead=read_ahead)) == list(
+            range(12)
+        )
+        assert connector.get.call_args_list == [mock.call("/Entries")] + [
+            mock.call("/Entries?page={}".format(i), cache=False)
+            for i in range(1, 4)
+        ]
+
+    def test_absolute_next_link(self):
+        connector = self.next_link_connector(pages=2, per_page=2, absolute=True)
+        entries = Resource(connector, oid="/Entries")
+        assert self.ids(entries.iter_members()) == [0, 1, 2, 3]
+        connector.get.assert_called_with("/Entries?page=1", cache=False)
+
+    @pytest.mark.parametrize("read_ahead", [0, 1, 3])
+    def test_skip(self, read_ahead):
+        connector = self.skip_connector(count=10, per_page=3)
+        entries = Resource(connector, oid="/Entries")
+        assert self.ids(entries.iter_members(read_ahead=read_ahead)) == list(
+            range(10)
+        )
+        paths = [c[0][0] for c in connector.get.call_args_list]
+        assert paths == ["/Entries"] + [
+            "/Entries?$skip={}&$top=3".format(i) for i in (3, 6, 9)
+        ]
+
+    def test_page_size(self):
+        connector = self.skip_connector(count=5, per_page=100)
+        entries = Resource(connector, oid="/Entries")
+        assert self.ids(entries.iter_members(page_size=2)) == [0, 1, 2, 3, 4]
+        paths = [c[0][0] for c in connector.get.call_args_list]
+        assert paths == [
+            "/Entries?$top=2", "/Entries?$skip=2&$top=2",
+            "/Entries?$skip=4&$top=2",
+        ]
+
+    def test_until(self):
+        connector = self.skip_connector(count=1000, per_page=10)
+        entries = Resource(connector, oid="/Entries")
+        members = entries.iter_members(
+            read_ahead=2, until=lambda r: int(r.Id) == 25,
+        )
+        assert self.ids(members) == list(range(25))
+        # Pages with entries 0-29 were needed, two more could be read ahead.
+        assert connector.get.call_count <= 5
+
+    def test_lazy(self):
+        connector = self.next_link_connector(pages=100, per_page=10)
+        members = Resource(connector, oid="/Entries").iter_members(read_ahead=0)
+        assert self.ids([next(members) for _ in range(15)]) == list(range(15))
+        assert connector.get.call_count == 2
+        members.close()
+
+    def test_single_page(self):
+        connector = mock.Mock(spec=Connector)
+        connector.get.return_value = Response(200, {}, {
+            "@odata.id": "/Entries", "Members": [{"@odata.id": "/Entries/0"}],
+        }, b"")
+        members = list(Resource(connector, oid="/Entries").iter_members())
+        assert members[0]._is_stub
+        assert connector.get.call_count == 1
+
+    def test_partial_members(self):
+        connector = mock.Mock(spec=Connector)
+        connector.get.side_effect = [
+            Response(200, {}, {
+                "@odata.id": "/Entries", "Members": [self.entry(0)],
+            }, b""),
+            Response(200, {}, dict(self.entry(0), Message="Hi"), b""),
+        ]
+        member, = Resource(connector, oid="/Entries").iter_members()
+        assert member.Id == "0"
+        assert connector.get.call_count == 1
+        assert member.Message == "Hi"
+        connector.get.assert_called_with("/Entries/0")
+
+    def test_page_not_found(self):
+        connector = self.next_link_connector(pages=3, per_page=1)
+        connector.get.side_effect = [
+            connector.get.side_effect("/Entries"),
+            Response(404, {}, None, b"gone"),
+        ]
+        members = Resource(connector, oid="/Entries").iter_members()
+        with pytest.raises(ResourceNotFound):
+            list(members)
+
+    def test_missing_oid(self):
+        with pytest.raises(MissingOidException):
+            next(Resource(None, data={"Members": []}).iter_members())
+
+
+class TestFilter:
+    DRIVES = [
+        {"@odata.id": "/Drives/{}".format(i), "Id": str(i),
+         "Status": {"Health": health}}
+        for i, health in enumerate(["OK", "Critical", "OK", "Critical"])
+    ]
+
+    def build_connector(self, features, status=200):
+        def get(path, cache=True):
+            if "$filter=" in path:
+                if status != 200:
+                    return Response(status, {}, None, b"bad filter")
+                return Response(200, {}, {
+                    "@odata.id": "/Drives",
+                    "Members": [{"@odata.id": "/Drives/1"}],
+                }, b"")
+            if path == "/Drives":
+                return Response(200, {}, {
+                    "@odata.id": "/Drives",
+                    "Members": [{"@odata.id": d["@odata.id"]} for d in self.DRIVES],
+                }, b"")
+            return Response(200, {}, self.DRIVES[int(path[-1])], b"")
+
+        connector = mock.Mock(spec=Connector)
+        connector.protocol_features = features
+        connector.get.side_effect = get
+        return connector
+
+    def test_server_side(self):
+        connector = self.build_connector({"FilterQuery": True})
+        drives = Resource(connector, oid="/Drives")
+        result = drives.filter(eq("Status/Health", "Critical"))
+        assert [r.Id for r in result] == ["1"]
+        assert connector.get.call_args_list[0] == mock.call(
+            "/Drives?$filter=Status/Health%20eq%20'Critical'", cache=False,
+        )
+
+    def test_polling(self):
+        with MockServer() as server:
+            connector = CachingConnector(server.url, "user", "pass")
+            root = Root(connector, oid="/redfish/v1")
+            root.login()
+            connector.set_protocol_features({"FilterQuery": True})
+            systems = root.Systems
+            # The mock server ignores the filter and returns all members.
+            assert len(systems.filter(eq("Name", "New"))) == 4
+
+            systems.post({"Name": "New"})
+            assert len(systems.filter(eq("Name", "New"))) == 5
+
+    @pytest.mark.parametrize("features,status", [
+        ({}, 200),
+        ({"FilterQuery": False}, 200),
+        ({"FilterQuery": True}, 400),
+    ])
+    def test_client_side(self, features, status):
+        connector = self.build_connector(features, status)
+        drives = Resource(connector, oid="/Drives")
+        result = drives.filter(
+            eq("Status/Health", "Critical") & gt("Id", "2"),
+        )
+        assert [r.Id for r in result] == ["3"]
+        paths = [c[0][0] for c in connector.get.call_args_list]
+        assert sorted(p for p in paths if "$filter" not in p) == [
+            "/Drives", "/Drives/0", "/Drives/1", "/Drives/2", "/Drives/3",
+        ]
+
+    def test_missing_oid(self):
+        with pytest.raises(MissingOidException):
+            Resource(None, data={}).filter(eq("Id", "1"))
+
+
+class TestChildren:
+    @staticmethod
+    def build_connector(*contents):
+        connector = mock.Mock(spec=Connector)
+        connector.get.side_effect = [
+            Response(200, {}, content, b"") for content in contents
+        ]
+        return connector
+
+    def test_identity(self):
+        resource = Resource(None, data={
+            "Status": {"Health": "OK"},
+            "Members": [{"Id": "1"}, {"Id": "2"}],
+            "Empty": None,
+        })
+        assert resource.Status is resource["Status"]
+        assert resource.Members is resource.Members
+        assert resource.Members[0] is resource["Members"][0]
+        assert resource.Empty is None
+        for _ in range(2):
+            with pytest.raises(KeyError):
+                resource["Missing"]
+
+    def test_stub_loading(self):
+        connector = self.build_connector({
+            "@odata.id": "id", "Status": {"Health": "OK"},
+        })
+        resource = Resource(connector, oid="id")
+        oid = resource["@odata.id"]
+        assert resource.Status.Health == "OK"
+        assert resource["@odata.id"] == oid
+        assert resource.Status is resource.Status
+
+    def test_refresh(self):
+        connector = self.build_connector(
+            {"@odata.id": "id", "Status": {"Health": "OK"}},
+            {"@odata.id": "id", "Status": {"Health": "Critical"}},
+        )
+        resource = Resource(connector, oid="id")
+        status = resource.Status
+        assert status.Health == "OK"
+
+        resource.refresh()
+        assert resource.Status is not status
+        assert resource.Status.Health == "Critical"
+        assert resource.Status is resource.Status
+
+    def test_links(self):
+        connector = mock.Mock(spec=Connector)
+        connector.get.side_effect = lambda path: Response(
+            200, {}, {"@odata.id": path, "Name": path}, b"",
+        )
+        collection = Resource(connector, data={
+            "@odata.id": "parent",
+            "Links": {"Chassis": {"@odata.id": "chassis"}},
+            "Members": [{"@odata.id": "child_{}".format(i)} for i in range(3)],
+        })
+        assert collection.Links.Chassis is collection.Links.Chassis
+        assert collection.Members is collection.Members
+        for _ in range(3):
+            assert [m.Name for m in collection.Members] == [
+                "child_0", "child_1", "child_2",
+            ]
+        assert connector.get.call_count == 3
+
+    def test_refresh_links(self):
+        connector = mock.Mock(spec=Connector)
+        connector.get.side_effect = lambda path: Response(
+            200, {}, {"@odata.id": path, "Members": [{"@odata.id": "child"}]},
+            b"",
+        )
+        collection = Resource(connector, oid="parent")
+        members = collection.Members
+        collection.refresh()
+        assert collection.Members is not members
+
+    def test_patch_through_parent(self):
+        with MockServer() as server:
+            connector = CachingConnector(server.url, "user", "pass")
+            root = Root(connector, oid="/redfish/v1")
+            root.login()
+            assert "AssetTag" not in root.Systems.Members[0].raw
+
+            root.Systems.Members[0].patch({"AssetTag": "NEW"})
+            assert root.Systems.Members[0].raw["AssetTag"] == "NEW"
+
+    def test_expand(self):
+        connector = self.build_connector(
+            {"@odata.id": "parent", "Members": [{"@odata.id": "child"}]},
+            {
+                "@odata.id": "parent",
+                "Members": [{"@odata.id": "child", "Name": "child"}],
+            },
+        )
+        connector.protocol_features = {"ExpandQuery": {"ExpandAll": True}}
+        collection = Resource(connector, oid="parent")
+        assert collection.Members[0]._is_stub
+
+        collection.expand()
+        assert not collection.Members[0]._is_stub
+        assert collection.Members[0].Name == "child"
@@ -0,0 +1,213 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import itertools
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+import pytest
+import requests
+
+from redfish_client.connector import Connector
+from redfish_client.exceptions import InaccessibleException, ResourceNotFound
+from redfish_client.sse import EventStream, ServerSentEvent, parse_events
+
+
+def sse(*events):
+    return "".join(
+        "id: {}\ndata: {{\"Id\": \"{}\"}}\n\n".format(i, i) for i in events
+    ).encode("utf-8")
+
+
+def take(iterable, count):
+    return list(itertools.islice(iterable, count))
+
+
+class TestParseEvents:
+    def test_events(self):
+        lines = [
+            ": keep-alive", "",
+            "id: 1", "event: metric", "data: {", "data:  \"a\": 1}", "",
+            "data: no id", "retry: 500", "",
+            "id", "data: reset id", "",
+            "data: incomplete",
+        ]
+        assert list(parse_events(lines)) == [
+            ServerSentEvent("1", "metric", "{\n \"a\": 1}", None),
+            ServerSentEvent("1", None, "no id", 500),
+            ServerSentEvent("", None, "reset id", None),
+        ]
+
+    def test_bytes(self):
+        assert list(parse_events([b"data:x", b""])) == [
+            ServerSentEvent(None, None, "x", None),
+        ]
+
+
+class TestEventStream:
+    def test_discover_and_filter(self, requests_mock):
+        requests_mock.get("https://demo.dev/redfish/v1/EventService", json={
+            "ServerSentEventUri": "https://demo.dev/redfish/v1/SSE",
+        })
+        requests_mock.get("https://demo.dev/redfish/v1/SSE", content=sse(1, 2))
+        conn = Connector("https://demo.dev", None, None)
+        stream = EventStream(
+            conn, event_filter="EventFormatType eq MetricReport",
+        )
+        assert take(stream, 2) == [dict(Id="1"), dict(Id="2")]
+        request = requests_mock.last_request
+        assert request.qs == {"$filter": ["eventformattype eq metricreport"]}
+        assert request.headers["Accept"] == "text/event-stream"
+        assert stream.last_event_id == "2"
+
+    def test_not_supported(self, requests_mock):
+        requests_mock.get(
+            "https://demo.dev/redfish/v1/EventService", json={},
+        )
+        conn = Connector("https://demo.dev", None, None)
+        with pytest.raises(ResourceNotFound):
+            next(iter(EventStream(conn)))
+
+    def test_reconnect(self, requests_mock):
+        requests_mock.get("https://demo.dev/sse", [
+            dict(content=sse(1, 2)),
+            dict(exc=requests.exceptions.ConnectionError),
+            dict(content=sse(3)),
+        ])
+        conn = Connector("https://demo.dev", None, None)
+        stream = EventStream(conn, path="/sse", reconnect_delay=0)
+        assert take(stream, 3) == [dict(Id="1"), dict(Id="2"), dict(Id="3")]
+        history = requests_mock.request_history
+        assert "Last-Event-ID" not in history[0].headers
+        assert history[1].headers["Last-Event-ID"] == "2"
+        assert history[2].headers["Last-Event-ID"] == "2"
+
+    def test_max_reconnects(self, requests_mock):
+        requests_mock.get("https://demo.dev/sse", [
+            dict(content=sse(1)),
+            dict(exc=requests.exceptions.ConnectionError),
+        ])
+        conn = Connector("https://demo.dev", None, None)
+        stream = EventStream(
+            conn, path="/sse", reconnect_delay=0, max_reconnects=1,
+        )
+        events = iter(stream)
+        assert next(events) == dict(Id="1")
+        with pytest.raises(InaccessibleException):
+            next(events)
+        assert requests_mock.call_count == 2
+
+    def test_reconnect_unavailable(self, requests_mock):
+        requests_mock.get("https://demo.dev/sse", [
+            dict(status_code=503),
+            dict(status_code=404),
+            dict(content=sse(1)),
+        ])
+        conn = Connector("https://demo.dev", None, None)
+        stream = EventStream(
+            conn, path="/sse", reconnect_delay=0, max_reconnects=2,
+        )
+        assert take(stream, 1) == [dict(Id="1")]
+        assert requests_mock.call_count == 3
+
+    def test_unavailable_max_reconnects(self, requests_mock):
+        requests_mock.get("https://demo.dev/sse", status_code=500)
+        conn = Connector("https://demo.dev", None, None)
+        stream = EventStream(
+            conn, path="/sse", reconnect_delay=0, max_reconnects=2,
+        )
+        with pytest.raises(InaccessibleException):
+            next(iter(stream))
+        assert requests_mock.call_count == 3
+
+    def test_rejected(self, requests_mock):
+        requests_mock.get("https://demo.dev/sse", status_code=403)
+        conn = Connector("https://demo.dev", None, None)
+        with pytest.raises(ResourceNotFound):
+            next(iter(EventStream(conn, path="/sse", reconnect_delay=0)))
+        assert requests_mock.call_count == 1
+
+    def test_relogin(self, requests_mock):
+        requests_mock.post(
+            "https://demo.dev/sessions", status_code=201,
+            headers={"X-Auth-Token": "new", "Location": "/sessions/1"},
+        )
+        requests_mock.get("https://demo.dev/sse", [
+            dict(status_code=401),
+            dict(content=sse(1)),
+        ])
+        conn = Connector("https://demo.dev", "user", "pass")
+        conn.set_session_auth_data("/sessions", token="old")
+        assert take(EventStream(conn, path="/sse"), 1) == [dict(Id="1")]
+        assert requests_mock.last_request.headers["X-Auth-Token"] == "new"
+
+    def test_invalid_data(self, requests_mock):
+        requests_mock.get(
+            "https://demo.dev/sse", content=b"data: nope\n\n" + sse(1),
+        )
+        conn = Connector("https://demo.dev", None, None)
+        assert take(EventStream(conn, path="/sse"), 1) == [dict(Id="1")]
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _SlowStream(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for i in (1, 2):
+            chunk = sse(i)
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.flush()
+            self.server.sent.wait(5)
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, *args):
+        pass
+
+
+class TestStreaming:
+    def test_events_as_they_arrive(self):
+        server = _Server(("127.0.0.1", 0), _SlowStream)
+        server.sent = threading.Event()
+        thread = threading.Thread(
+            target=server.serve_forever, kwargs=dict(poll_interval=0.01),
+        )
+        thread.start()
+        try:
+            conn = Connector(
+                "http://127.0.0.1:{}".format(server.server_address[1]),
+                None, None,
+            )
+            start = time.monotonic()
+            events = iter(EventStream(conn, path="/sse"))
+            # The server waits for us before sending the second event.
+            assert next(events) == dict(Id="1")
+            assert time.monotonic() - start < 4
+            server.sent.set()
+            assert next(events) == dict(Id="2")
+            events.close()
+        finally:
+            server.sent.set()
+            server.shutdown()
+            thread.join()
+            server.server_close()
@@ -0,0 +1,108 @@
+#  Copyright 2026 XLAB d.o.o.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import logging
+
+import pytest
+
+from redfish_client.connector import Connector
+from redfish_client.wire_log import WireLogger
+
+
+def records(caplog):
+    return [json.loads(r.getMessage()) for r in caplog.records]
+
+
+class TestWireLogger:
+    def test_disabled(self, caplog, mocker, requests_mock):
+        caplog.set_level(logging.INFO, logger="redfish-client")
+        log_request = mocker.spy(WireLogger, "log_request")
+        log_response = mocker.spy(WireLogger, "log_response")
+        requests_mock.get("https://demo.dev/1", status_code=200, json=dict(a=1))
+        Connector("https://demo.dev", None, None).get("/1")
+        log_request.assert_not_called()
+        log_response.assert_not_called()
+        assert caplog.records == []
+
+    def test_truncate_body(self, caplog, requests_mock):
+        caplog.set_level(logging.DEBUG, logger="redfish-client")
+        requests_mock.get("https://demo.dev/1", status_code=200, text="x" * 20)
+        wire_log = WireLogger(max_body=8)
+        Connector("https://demo.dev", None, None, wire_log=wire_log).get("/1")
+        _, response = records(caplog)
+        assert response["response"]["content"] == (
+            "b'xxxxxxxx'... (12 bytes truncated)"
+        )
+        assert response["response"]["json_data"] is None
+
+    def test_redact(self, caplog, requests_mock):
+        caplog.set_level(logging.DEBUG, logger="redfish-client")
+        requests_mock.post(
+            "https://demo.dev/1", status_code=201,
+            json=dict(UserName="user", Password=None),
+            headers={"X-Auth-Token": "secret"},
+        )
+        Connector("https://demo.dev", None, None).post(
+            "/1", payload=dict(UserName="user", Password="pass"),
+            headers=dict(Authorization="Basic secret"),
+        )
+        request, response = records(caplog)
+        assert request["request"]["payload"] == dict(UserName="user", Password="***")
+        assert request["request"]["headers"] == dict(Authorization="***")
+        assert response["response"]["headers"]["x-auth-token"] == "***"
+        assert response["response"]["json_data"]["Password"] == "***"
+
+    @pytest.mark.parametrize("max_body", [8, 4096])
+    def test_redact_content(self, caplog, requests_mock, max_body):
+        caplog.set_level(logging.DEBUG, logger="redfish-client")
+        requests_mock.get(
+            "https://demo.dev/1", status_code=200,
+            json=dict(Password="hunter2", UserName="user"),
+        )
+        wire_log = WireLogger(max_body=max_body)
+        Connector("https://demo.dev", None, None, wire_log=wire_log).get("/1")
+        assert caplog.records
+        for record in caplog.records:
+            assert "hunter2" not in record.getMessage()
+
+    def test_redact_invalid_content(self, caplog, requests_mock):
+        caplog.set_level(logging.DEBUG, logger="redfish-client")
+        requests_mock.get(
+            "https://demo.dev/1", status_code=200,
+            text='{"Password": "hunter2", ',
+        )
+        Connector("https://demo.dev", None, None).get("/1")
+        _, response = records(caplog)
+        assert response["response"]["content"] == "b'***'"
+
+    def test_no_redact(self, caplog, requests_mock):
+        caplog.set_level(logging.DEBUG, logger="redfish-client")
+        requests_mock.post("https://demo.dev/1", status_code=201)
+        Connector(
+            "https://demo.dev", None, None, wire_log=WireLogger(redact=False),
+        ).post("/1", payload=dict(Password="pass"))
+        request, _ = records(caplog)
+        assert request["request"]["payload"] == dict(Password="pass")
+
+    @pytest.mark.parametrize("rate,logged", [(1, 5), (2, 3), (5, 1)])
+    def test_sample(self, caplog, requests_mock, rate, logged):
+        caplog.set_level(logging.DEBUG, logger="redfish-client")
+        requests_mock.get("https://demo.dev/1", status_code=200)
+        conn = Connector(
+            "https://demo.dev", None, None, wire_log=WireLogger(sample_rate=rate),
+        )
+        for _ in range(5):
+            conn.get("/1")
+        assert len(records(caplog)) == 2 * logged